@@ -3,11 +3,16 @@
 import os
 import tkinter as tk
 from tkinter import messagebox, ttk
-import matplotlib.pyplot as plt
+import math
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Shadow
 import random
 import datetime
 
+from follower_model import AnalysisWorker, ScoredFollowers
+from rule_profiles import APP_FLAG_PROFILE, APP_PROFILE
+
 # Sample data (in a real app, this would come from an API)
 sample_followers = [
     {"username": "user1", "profile_pic": True, "bio": True, "links": True, 
@@ -26,6 +31,371 @@ sample_followers = [
      "posts_count": 85, "creation_date": "2022-07-18", "engagement_ratio": 0.5},
 ]
 
+def load_followers():
+    # Current follower data; Refresh Data reads it again and rescores what changed
+    return [dict(account) for account in sample_followers]
+
+# How often the GUI checks the analysis worker for results
+POLL_INTERVAL_MS = 100
+
+# Follower Analysis columns: (heading, model column, display formatter)
+ANALYSIS_COLUMNS = [
+    ("Username", "username", str),
+    ("Profile Pic", "profile_pic", lambda v: "Yes" if v else "No"),
+    ("Bio", "bio", lambda v: "Yes" if v else "No"),
+    ("Posts", "posts_count", str),
+    ("Creation Date", "creation_date", str),
+    ("Engagement", "engagement_ratio", lambda v: f"{v:.2f}"),
+    ("Status", "status", str),
+]
+
+class VirtualTreeview:
+    """
+    A Treeview that holds only the visible window of rows (plus a small
+    buffer) and refills those items from the model as the user scrolls.
+    Sorting and filtering select row positions in the model, so the widget
+    never holds more than a screenful of items whatever the dataset size.
+    """
+    ROW_HEIGHT = 22
+    BUFFER_ROWS = 5
+    
+    def __init__(self, parent, model, columns, on_change=None):
+        self.model = model
+        self.columns = columns
+        self.on_change = on_change
+        self.filters = {}
+        self.sort_column = None
+        self.descending = False
+        self.positions = model.select()
+        self.first = 0
+        self.visible = 20
+        self.items = []
+        
+        style = ttk.Style()
+        style.configure("Virtual.Treeview", rowheight=self.ROW_HEIGHT)
+        
+        frame = tk.Frame(parent, bg="white")
+        frame.pack(expand=True, fill="both")
+        headings = [heading for heading, _, _ in columns]
+        self.tree = ttk.Treeview(frame, columns=headings, show="headings", style="Virtual.Treeview")
+        for heading, column, _ in columns:
+            self.tree.heading(heading, text=heading, command=lambda c=column: self.sort_by(c))
+            self.tree.column(heading, width=100, anchor="center")
+        
+        # Apply colors
+        self.tree.tag_configure("Suspicious", background="#FFEBEE")
+        self.tree.tag_configure("Genuine", background="#E8F5E9")
+        
+        # The scrollbar drives the window into the data, not the tree's own view
+        self.scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(expand=True, fill="both")
+        
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_by(-1 if e.delta > 0 else 1, 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-1, 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(1, 3))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-1, self.visible))
+        self.tree.bind("<Next>", lambda e: self.scroll_by(1, self.visible))
+    
+    def on_resize(self, event):
+        visible = max(1, event.height // self.ROW_HEIGHT - 1)  # minus the heading row
+        if visible != self.visible:
+            self.visible = visible
+            self.refresh()
+    
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.first = int(float(amount) * len(self.positions))
+            self.refresh()
+        else:
+            self.scroll_by(int(amount), self.visible if unit == "pages" else 1)
+    
+    def scroll_by(self, direction, rows):
+        self.first += direction * rows
+        self.refresh()
+        return "break"  # keep the tree from scrolling its own items
+    
+    def sort_by(self, column):
+        self.descending = not self.descending if column == self.sort_column else False
+        self.sort_column = column
+        self.reload()
+    
+    def set_filter(self, status=None, search=None):
+        self.filters = {"status": status, "search": search}
+        self.reload()
+    
+    def reload(self, keep_position=False):
+        self.positions = self.model.select(sort_by=self.sort_column, descending=self.descending, 
+                                           **self.filters)
+        if not keep_position:
+            self.first = 0
+        self.refresh()
+    
+    def refresh(self):
+        total = len(self.positions)
+        self.first = max(0, min(self.first, total - self.visible))
+        window = self.positions[self.first:self.first + self.visible + self.BUFFER_ROWS]
+        rows = self.model.take(window) if len(window) else None
+        count = len(window)
+        
+        while len(self.items) < count:
+            self.items.append(self.tree.insert("", "end"))
+        
+        data = [rows[column].tolist() for _, column, _ in self.columns] if count else []
+        statuses = rows["status"].tolist() if count else []
+        for i, item in enumerate(self.items):
+            if i < count:
+                values = [fmt(values[i]) for (_, _, fmt), values in zip(self.columns, data)]
+                self.tree.item(item, values=values, tags=(statuses[i],))
+                self.tree.move(item, "", i)  # reattach if it was hidden
+            else:
+                self.tree.detach(item)
+        
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        if self.on_change:
+            self.on_change(total)
+
+class DashboardChart:
+    """
+    The dashboard's real vs suspicious pie. The Figure is created once per app
+    (outside pyplot, so sessions do not pile up figures) and update() moves
+    the existing wedges and labels in place when counts change. Those
+    artists are animated: a full draw caches the rest of the figure as a
+    background, and updates restore it and blit just the pie artists.
+    """
+    LABELS = ['Real Accounts', 'Suspicious Accounts']
+    COLORS = ['#4CAF50', '#F44336']
+    EXPLODE = (0, 0.1)  # explode the 2nd slice (fake accounts)
+    START_ANGLE = 90
+    LABEL_DISTANCE = 1.1
+    PCT_DISTANCE = 0.6
+    
+    def __init__(self):
+        self.figure = Figure(figsize=(5, 4))
+        self.ax = self.figure.add_subplot()
+        self.wedges, self.texts, self.autotexts = self.ax.pie(
+            [1, 1], explode=self.EXPLODE, labels=self.LABELS, colors=self.COLORS,
+            autopct='%1.1f%%', shadow=True, startangle=self.START_ANGLE)
+        self.shadows = [patch for patch in self.ax.patches if isinstance(patch, Shadow)]
+        self.ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+        self.empty_text = self.ax.text(0, 0, "Waiting for results...", ha="center", va="center")
+        self.dynamic = (*self.shadows, *self.wedges, *self.texts, *self.autotexts, self.empty_text)
+        for artist in self.dynamic:
+            artist.set_animated(True)
+        self.canvas = None
+        self.background = None
+        self.counts = None
+    
+    def attach(self, parent):
+        # Tk widgets die with each session, so only the canvas widget is new
+        self.use_canvas(FigureCanvasTkAgg(self.figure, parent))
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        return self.canvas
+    
+    def use_canvas(self, canvas):
+        self.canvas = canvas
+        self.background = None
+        self.counts = None
+        canvas.mpl_connect('draw_event', self.on_draw)
+    
+    def on_draw(self, event):
+        # Full draws (first show, resize) leave animated artists out: keep the
+        # result as the background and paint the pie on top
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_dynamic()
+    
+    def draw_dynamic(self):
+        for artist in self.dynamic:
+            self.figure.draw_artist(artist)
+    
+    def update(self, counts):
+        counts = tuple(counts)
+        if counts == self.counts:
+            return False
+        self.counts = counts
+        
+        total = sum(counts)
+        for artist in (*self.wedges, *self.texts, *self.autotexts, *self.shadows):
+            artist.set_visible(total > 0)
+        self.empty_text.set_visible(total == 0)
+        
+        # Same geometry as Axes.pie, applied to the existing artists
+        theta1 = self.START_ANGLE / 360
+        for i, count in enumerate(counts if total else ()):
+            theta2 = theta1 + count / total
+            middle = math.pi * (theta1 + theta2)
+            x = self.EXPLODE[i] * math.cos(middle)
+            y = self.EXPLODE[i] * math.sin(middle)
+            
+            wedge = self.wedges[i]
+            wedge.set_center((x, y))
+            wedge.set_theta1(360 * theta1)
+            wedge.set_theta2(360 * theta2)
+            
+            label_x = x + self.LABEL_DISTANCE * math.cos(middle)
+            self.texts[i].set_position((label_x, y + self.LABEL_DISTANCE * math.sin(middle)))
+            self.texts[i].set_horizontalalignment('left' if label_x > 0 else 'right')
+            self.autotexts[i].set_position((x + self.PCT_DISTANCE * math.cos(middle),
+                                            y + self.PCT_DISTANCE * math.sin(middle)))
+            self.autotexts[i].set_text(f"{100 * count / total:1.1f}%")
+            theta1 = theta2
+        
+        if self.canvas is None:
+            return True
+        if self.background is None:
+            self.canvas.draw_idle()  # not drawn yet; on_draw paints the pie
+        else:
+            self.canvas.restore_region(self.background)
+            self.draw_dynamic()
+            self.canvas.blit(self.figure.bbox)
+        return True
+
+class AccountCard:
+    """A suspicious-account card built once and rebound to other accounts as the list scrolls"""
+    
+    def __init__(self, parent):
+        # Create a frame for the card
+        self.frame = tk.Frame(parent, bg="#FFEBEE", padx=15, pady=15, relief="raised", bd=1)
+        
+        # Username header
+        self.username_label = tk.Label(self.frame, font=("Arial", 14, "bold"), bg="#FFEBEE")
+        self.username_label.pack(anchor="w")
+        
+        # Details
+        details_frame = tk.Frame(self.frame, bg="#FFEBEE")
+        details_frame.pack(fill="x", pady=5)
+        
+        # Left column - Account details
+        left_col = tk.Frame(details_frame, bg="#FFEBEE")
+        left_col.pack(side="left", fill="both", expand=True)
+        
+        self.created_label = tk.Label(left_col, bg="#FFEBEE")
+        self.created_label.pack(anchor="w")
+        self.posts_label = tk.Label(left_col, bg="#FFEBEE")
+        self.posts_label.pack(anchor="w")
+        self.engagement_label = tk.Label(left_col, bg="#FFEBEE")
+        self.engagement_label.pack(anchor="w")
+        
+        # Right column - Flags (rules in rule_profiles.APP_FLAG_PROFILE)
+        right_col = tk.Frame(details_frame, bg="#FFEBEE")
+        right_col.pack(side="right", fill="both", expand=True)
+        
+        tk.Label(right_col, text="Suspicious flags:", font=("Arial", 10, "bold"), 
+                bg="#FFEBEE").pack(anchor="w")
+        self.flag_labels = [tk.Label(right_col, bg="#FFEBEE") for _ in APP_FLAG_PROFILE.rules]
+        self.position = None
+    
+    def widgets(self):
+        stack = [self.frame]
+        while stack:
+            widget = stack.pop()
+            yield widget
+            stack.extend(widget.winfo_children())
+    
+    def show(self, account):
+        self.username_label.config(text=account["username"])
+        self.created_label.config(text=f"Created: {account['creation_date']}")
+        self.posts_label.config(text=f"Posts: {account['posts_count']}")
+        self.engagement_label.config(text=f"Engagement Ratio: {account['engagement_ratio']:.2f}")
+        flags = account["flags"]
+        for i, label in enumerate(self.flag_labels):
+            if i < len(flags):
+                label.config(text=f"• {flags[i]}")
+                label.pack(anchor="w")
+            else:
+                label.pack_forget()
+
+class CardList:
+    """
+    A scrolling list of account cards backed by a small pool of AccountCard
+    widgets. All cards get the height of a card showing every flag, measured
+    once, so the scroll region comes from the number of accounts and only
+    the cards in view are bound to data.
+    """
+    SPACING = 20
+    
+    def __init__(self, parent, model, positions):
+        self.model = model
+        self.positions = positions
+        self.cards = []  # (AccountCard, canvas window id)
+        self.width = 0
+        
+        # Create a canvas with scrollbar for the cards
+        self.canvas = tk.Canvas(parent, bg="white")
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self.on_view_change)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.canvas.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.canvas)
+        
+        # The first card measures the tallest a card can get: every flag shown
+        card = self.add_card()
+        card.show({"username": "", "creation_date": "", "posts_count": 0, "engagement_ratio": 0.0,
+                   "flags": [rule.reason for rule in APP_FLAG_PROFILE.rules]})
+        self.canvas.update_idletasks()
+        self.card_height = card.frame.winfo_reqheight()
+    
+    @property
+    def slot(self):
+        return self.card_height + self.SPACING
+    
+    def add_card(self):
+        card = AccountCard(self.canvas)
+        window = self.canvas.create_window(0, -2 * self.SPACING, window=card.frame, anchor="nw")
+        for widget in card.widgets():
+            self.bind_wheel(widget)
+        self.cards.append((card, window))
+        return card
+    
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(-1 if e.delta > 0 else 1, "units"))
+        widget.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        widget.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+    
+    def on_resize(self, event):
+        self.width = event.width
+        self.canvas.configure(scrollregion=(0, 0, event.width, len(self.positions) * self.slot),
+                              yscrollincrement=self.slot // 4)
+        
+        # Enough cards to cover the view while scrolling, plus one
+        needed = event.height // self.slot + 2
+        while len(self.cards) < needed:
+            self.add_card()
+        for _, window in self.cards:
+            self.canvas.itemconfigure(window, width=max(1, event.width - 40), height=self.card_height)
+        self.refresh()
+    
+    def set_positions(self, positions):
+        self.positions = positions
+        for card, _ in self.cards:
+            card.position = None
+        self.canvas.configure(scrollregion=(0, 0, self.width, len(positions) * self.slot))
+        self.refresh()
+    
+    def on_view_change(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+    
+    def refresh(self):
+        first = max(0, int(self.canvas.canvasy(0) // self.slot))
+        for i, (card, window) in enumerate(self.cards):
+            index = first + i
+            if index < len(self.positions):
+                position = self.positions[index]
+                if card.position != position:
+                    card.show(self.model.row(position))
+                    card.position = position
+                self.canvas.coords(window, 20, index * self.slot + self.SPACING // 2)
+            else:
+                # Park unused cards above the scroll region
+                self.canvas.coords(window, 20, -2 * self.slot)
+
 class FakeProfileDetector:
     def __init__(self, root):
         self.root = root
@@ -34,9 +404,16 @@ class FakeProfileDetector:
         self.root.configure(bg="#f0f0f0")
         
         self.current_user = None
+        self.followers = None
+        self.worker = None
+        self.poll_id = None
+        self.dashboard_chart = DashboardChart()
         self.setup_login_screen()
     
     def setup_login_screen(self):
+        # Stop any analysis still running for the previous session
+        self.stop_analysis()
+        
         # Clear any existing widgets
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -90,6 +467,9 @@ class FakeProfileDetector:
         for widget in self.root.winfo_children():
             widget.destroy()
             
+        # All tabs read from this model; it fills up as the worker scores batches
+        self.followers = ScoredFollowers()
+        
         # Create a notebook for tabs
         notebook = ttk.Notebook(self.root)
         notebook.pack(expand=True, fill="both", padx=10, pady=10)
@@ -112,11 +492,98 @@ class FakeProfileDetector:
         # Suspicious Accounts Tab
         self.setup_suspicious_tab(suspicious_tab)
         
+        # Progress and cancel controls
+        progress_frame = tk.Frame(self.root, bg="#f0f0f0")
+        progress_frame.pack(side="bottom", fill="x", padx=10)
+        
         # Logout button in the main window
-        logout_btn = tk.Button(self.root, text="Logout", 
+        logout_btn = tk.Button(progress_frame, text="Logout", 
                               command=self.setup_login_screen,
                               bg="#f44336", fg="white")
-        logout_btn.pack(side="bottom", pady=10)
+        logout_btn.pack(side="right", pady=10)
+        
+        self.cancel_btn = tk.Button(progress_frame, text="Cancel Analysis", 
+                                    command=self.cancel_analysis)
+        self.cancel_btn.pack(side="right", padx=10, pady=10)
+        
+        self.refresh_btn = tk.Button(progress_frame, text="Refresh Data", 
+                                     command=self.refresh_followers, state="disabled")
+        self.refresh_btn.pack(side="right", padx=10, pady=10)
+        
+        self.progress_label = tk.Label(progress_frame, font=("Arial", 10), bg="#f0f0f0")
+        self.progress_label.pack(side="left", pady=10)
+        
+        self.start_analysis(load_followers())
+    
+    def start_analysis(self, records):
+        # Score on a worker thread; the GUI drains its results with root.after
+        self.worker = AnalysisWorker(records, self.followers.now)
+        self.worker.start()
+        self.progress_label.config(text=f"Analyzing 0 of {len(records)} followers...")
+        self.poll_id = self.root.after(POLL_INTERVAL_MS, self.poll_analysis)
+    
+    def poll_analysis(self):
+        self.poll_id = None
+        batches, finished, error = [], False, None
+        for kind, payload in self.worker.drain():
+            if kind == "batch":
+                batches.append(payload)
+            elif kind == "done":
+                finished = True
+            else:
+                finished, error = True, payload
+        
+        if batches:
+            self.followers.extend(batches)
+            self.update_views()
+        
+        total = len(self.worker.records)
+        if not finished:
+            self.progress_label.config(text=f"Analyzing {len(self.followers)} of {total} followers...")
+            self.poll_id = self.root.after(POLL_INTERVAL_MS, self.poll_analysis)
+            return
+        
+        self.cancel_btn.config(state="disabled")
+        self.refresh_btn.config(state="normal")
+        if error:
+            self.progress_label.config(text=f"Analysis failed: {error}")
+            messagebox.showerror("Error", f"Analysis failed: {error}")
+        elif self.worker.cancelled.is_set():
+            self.progress_label.config(text=f"Analysis cancelled after {len(self.followers)} of {total} followers")
+        else:
+            self.progress_label.config(text=f"Analysis complete: {total} followers")
+        self.update_views(finished=True)
+    
+    def cancel_analysis(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_btn.config(state="disabled")
+    
+    def refresh_followers(self):
+        # Rescore only followers that are new or whose data changed
+        rescored = self.followers.update(load_followers())
+        self.progress_label.config(text=f"Refreshed: {rescored} of {len(self.followers)} followers rescored")
+        if rescored:
+            self.update_views(finished=True)
+    
+    def stop_analysis(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+    
+    def update_views(self, finished=False):
+        # Refresh every tab from the model as results arrive
+        self.update_dashboard()
+        self.analysis_table.reload(keep_position=True)
+        suspicious = self.followers.select(status="Suspicious")
+        self.suspicious_list.set_positions(suspicious)
+        if finished and not len(suspicious):
+            self.no_accounts_label.pack(pady=50, before=self.suspicious_list.canvas)
+        else:
+            self.no_accounts_label.pack_forget()
     
     def setup_dashboard(self, parent):
         # Welcome message
@@ -141,50 +608,41 @@ class FakeProfileDetector:
         summary_frame = tk.Frame(parent, bg="white", padx=20, pady=20)
         summary_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Create a pie chart of real vs fake accounts
-        fig, ax = plt.subplots(figsize=(5, 4))
-        
-        # Analyze followers and get counts
-        real, fake = self.analyze_followers()
-        
-        # Create pie chart
-        labels = ['Real Accounts', 'Suspicious Accounts']
-        sizes = [real, fake]
-        colors = ['#4CAF50', '#F44336']
-        explode = (0, 0.1)  # explode the 2nd slice (fake accounts)
-        
-        ax.pie(sizes, explode=explode, labels=labels, colors=colors,
-              autopct='%1.1f%%', shadow=True, startangle=90)
-        ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
-        
-        # Create canvas to display the matplotlib figure
-        canvas = FigureCanvasTkAgg(fig, summary_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # The app's one pie chart, reattached for this session
+        self.dashboard_chart.attach(summary_frame)
         
         # Summary stats
         stats_frame = tk.Frame(summary_frame, bg="white")
         stats_frame.pack(fill="x", pady=10)
         
-        total_label = tk.Label(stats_frame, 
-                              text=f"Total Followers: {len(sample_followers)}",
-                              font=("Arial", 12, "bold"),
-                              bg="white")
-        total_label.pack(side="left", padx=20)
+        self.total_label = tk.Label(stats_frame, 
+                                   font=("Arial", 12, "bold"),
+                                   bg="white")
+        self.total_label.pack(side="left", padx=20)
         
-        real_label = tk.Label(stats_frame, 
-                             text=f"Real Accounts: {real}",
-                             font=("Arial", 12),
-                             fg="#4CAF50",
-                             bg="white")
-        real_label.pack(side="left", padx=20)
+        self.real_label = tk.Label(stats_frame, 
+                                  font=("Arial", 12),
+                                  fg="#4CAF50",
+                                  bg="white")
+        self.real_label.pack(side="left", padx=20)
         
-        fake_label = tk.Label(stats_frame, 
-                             text=f"Suspicious Accounts: {fake}",
-                             font=("Arial", 12),
-                             fg="#F44336",
-                             bg="white")
-        fake_label.pack(side="left", padx=20)
+        self.fake_label = tk.Label(stats_frame, 
+                                  font=("Arial", 12),
+                                  fg="#F44336",
+                                  bg="white")
+        self.fake_label.pack(side="left", padx=20)
+        
+        self.update_dashboard()
+    
+    def update_dashboard(self):
+        # Analyze followers and get counts
+        real, fake = self.analyze_followers()
+        
+        self.total_label.config(text=f"Total Followers: {real + fake}")
+        self.real_label.config(text=f"Real Accounts: {real}")
+        self.fake_label.config(text=f"Suspicious Accounts: {fake}")
+        
+        self.dashboard_chart.update((real, fake))
     
     def setup_analysis_tab(self, parent):
         # Create a frame for the analysis view
@@ -198,42 +656,34 @@ class FakeProfileDetector:
                               bg="white")
         title_label.pack(pady=10)
         
-        # Create treeview
-        columns = ("Username", "Profile Pic", "Bio", "Posts", "Creation Date", "Engagement", "Status")
-        tree = ttk.Treeview(analysis_frame, columns=columns, show="headings")
-        
-        # Define headings
-        for col in columns:
-            tree.heading(col, text=col)
-            tree.column(col, width=100, anchor="center")
-        
-        # Add data to the treeview
-        for follower in sample_followers:
-            # Calculate if account is suspicious
-            is_suspicious = self.is_suspicious_account(follower)
-            status = "Suspicious" if is_suspicious else "Genuine"
-            status_color = "#F44336" if is_suspicious else "#4CAF50"
-            
-            # Add row
-            tree.insert("", "end", values=(
-                follower["username"],
-                "Yes" if follower["profile_pic"] else "No",
-                "Yes" if follower["bio"] else "No",
-                follower["posts_count"],
-                follower["creation_date"],
-                f"{follower['engagement_ratio']:.2f}",
-                status
-            ), tags=(status,))
+        # Filters run on the model; the tree only shows the visible window
+        controls = tk.Frame(analysis_frame, bg="white")
+        controls.pack(fill="x", pady=(0, 10))
         
-        # Apply colors
-        tree.tag_configure("Suspicious", background="#FFEBEE")
-        tree.tag_configure("Genuine", background="#E8F5E9")
+        tk.Label(controls, text="Status:", bg="white").pack(side="left")
+        status_box = ttk.Combobox(controls, values=["All", "Suspicious", "Genuine"], 
+                                  state="readonly", width=12)
+        status_box.set("All")
+        status_box.pack(side="left", padx=(5, 15))
+        
+        tk.Label(controls, text="Search:", bg="white").pack(side="left")
+        search_entry = tk.Entry(controls, width=25)
+        search_entry.pack(side="left", padx=5)
+        
+        count_label = tk.Label(controls, bg="white")
+        count_label.pack(side="right")
+        
+        table = self.analysis_table = VirtualTreeview(
+            analysis_frame, self.followers, ANALYSIS_COLUMNS, 
+            on_change=lambda n: count_label.config(text=f"{n} followers"))
+        
+        def apply_filter(event=None):
+            status = status_box.get()
+            table.set_filter(status=None if status == "All" else status, search=search_entry.get())
         
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(analysis_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y")
-        tree.pack(expand=True, fill="both")
+        status_box.bind("<<ComboboxSelected>>", apply_filter)
+        search_entry.bind("<KeyRelease>", apply_filter)
+        table.refresh()
     
     def setup_suspicious_tab(self, parent):
         # Create a frame for suspicious accounts
@@ -247,128 +697,27 @@ class FakeProfileDetector:
                               bg="white")
         title_label.pack(pady=10)
         
-        # Create a frame for each suspicious account
-        suspicious_accounts = [f for f in sample_followers if self.is_suspicious_account(f)]
+        # Shown once analysis finishes without flagging anyone
+        self.no_accounts_label = tk.Label(suspicious_frame, 
+                                         text="No suspicious accounts detected!",
+                                         font=("Arial", 12),
+                                         bg="white")
         
-        if not suspicious_accounts:
-            no_accounts_label = tk.Label(suspicious_frame, 
-                                        text="No suspicious accounts detected!",
-                                        font=("Arial", 12),
-                                        bg="white")
-            no_accounts_label.pack(pady=50)
-            return
-        
-        # Create a canvas with scrollbar for the suspicious accounts
-        canvas = tk.Canvas(suspicious_frame, bg="white")
-        scrollbar = ttk.Scrollbar(suspicious_frame, orient="vertical", command=canvas.yview)
-        
-        # Configure the canvas
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Create a frame inside the canvas
-        accounts_frame = tk.Frame(canvas, bg="white")
-        canvas.create_window((0, 0), window=accounts_frame, anchor="nw")
-        
-        # Add suspicious accounts to the frame
-        for i, account in enumerate(suspicious_accounts):
-            self.create_account_card(accounts_frame, account, i)
-        
-        # Update scroll region
-        accounts_frame.update_idletasks()
-        canvas.config(scrollregion=canvas.bbox("all"))
-    
-    def create_account_card(self, parent, account, index):
-        # Create a frame for each account
-        card = tk.Frame(parent, bg="#FFEBEE", padx=15, pady=15, relief="raised", bd=1)
-        card.pack(fill="x", pady=10, padx=20)
-        
-        # Username header
-        username_label = tk.Label(card, 
-                                 text=account["username"],
-                                 font=("Arial", 14, "bold"),
-                                 bg="#FFEBEE")
-        username_label.pack(anchor="w")
-        
-        # Details
-        details_frame = tk.Frame(card, bg="#FFEBEE")
-        details_frame.pack(fill="x", pady=5)
-        
-        # Left column - Account details
-        left_col = tk.Frame(details_frame, bg="#FFEBEE")
-        left_col.pack(side="left", fill="both", expand=True)
-        
-        tk.Label(left_col, text=f"Created: {account['creation_date']}", 
-                bg="#FFEBEE").pack(anchor="w")
-        tk.Label(left_col, text=f"Posts: {account['posts_count']}", 
-                bg="#FFEBEE").pack(anchor="w")
-        tk.Label(left_col, text=f"Engagement Ratio: {account['engagement_ratio']:.2f}", 
-                bg="#FFEBEE").pack(anchor="w")
-        
-        # Right column - Flags
-        right_col = tk.Frame(details_frame, bg="#FFEBEE")
-        right_col.pack(side="right", fill="both", expand=True)
-        
-        # Flags
-        flags = []
-        if not account["profile_pic"]:
-            flags.append("No Profile Picture")
-        if not account["bio"]:
-            flags.append("No Bio")
-        if account["posts_count"] < 10:
-            flags.append("Low Post Count")
-        if account["engagement_ratio"] < 0.3:
-            flags.append("Low Engagement")
-        
-        tk.Label(right_col, text="Suspicious flags:", font=("Arial", 10, "bold"), 
-                bg="#FFEBEE").pack(anchor="w")
-        
-        for flag in flags:
-            flag_label = tk.Label(right_col, text=f"• {flag}", bg="#FFEBEE")
-            flag_label.pack(anchor="w")
+        # Suspicious accounts are positions into the scored model. Only the
+        # cards in view exist; they are rebound as the list scrolls
+        self.suspicious_list = CardList(suspicious_frame, self.followers, 
+                                        self.followers.select(status="Suspicious"))
     
     def analyze_followers(self):
-        # Count real and fake accounts
-        real_count = 0
-        fake_count = 0
-        
-        for follower in sample_followers:
-            if self.is_suspicious_account(follower):
-                fake_count += 1
-            else:
-                real_count += 1
-                
-        return real_count, fake_count
+        # Count real and fake accounts scored so far
+        if self.followers is None:
+            return 0, 0
+        return self.followers.counts()
     
     def is_suspicious_account(self, account):
-        # Define criteria for suspicious accounts
-        suspicious_flags = 0
-        
-        # Check profile completeness
-        if not account["profile_pic"]:
-            suspicious_flags += 1
-        if not account["bio"]:
-            suspicious_flags += 1
-        if not account["links"]:
-            suspicious_flags += 0.5
-            
-        # Check activity and engagement
-        if account["posts_count"] < 5:
-            suspicious_flags += 1
-        if account["engagement_ratio"] < 0.3:
-            suspicious_flags += 1
-            
-        # Check account age (assuming date format YYYY-MM-DD)
-        creation_date = datetime.datetime.strptime(account["creation_date"], "%Y-%m-%d")
-        today = datetime.datetime.now()
-        account_age = (today - creation_date).days
-        
-        if account_age < 30:  # Less than a month old
-            suspicious_flags += 1
-            
-        # Determine if account is suspicious based on flags
-        return suspicious_flags >= 2
+        # Criteria for suspicious accounts live in rule_profiles.APP_PROFILE:
+        # profile completeness, activity, engagement and account age
+        return APP_PROFILE.evaluate_record(account).label
 
 # Run the application
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+"""
+Compare memory per follower for the list-of-dicts layout collect_followers_data
+used to keep against follower_store.FollowerStore.
+
+Run from the repository root:
+    python benchmarks/bench_follower_store.py --sizes 10000 100000 1000000
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from follower_store import FollowerStore  # noqa: E402
+
+BIOS = ['', 'Photographer | NYC', 'follow back pls', 'DM for promo', 'coffee & code, mostly coffee']
+URLS = ['', '', '', 'https://linktr.ee/', 'https://example.com/shop']
+
+
+def iter_records(num_rows, seed=0):
+    """Yield records shaped like collect_followers_data output, with fresh strings per record"""
+    rng = random.Random(seed)
+    for i in range(num_rows):
+        yield {
+            'username': f"user_{i}_{rng.randint(0, 99999)}",
+            'full_name': f"Name {rng.randint(0, 99999)}" if rng.random() < 0.7 else '',
+            'is_private': rng.random() < 0.4,
+            'has_profile_pic': rng.random() < 0.8,
+            'is_verified': rng.random() < 0.01,
+            'biography': f"{rng.choice(BIOS)} {i}" if rng.random() < 0.6 else '',
+            'mediacount': rng.randint(0, 500),
+            'followers': rng.randint(0, 50000),
+            'followees': rng.randint(0, 7500),
+            'external_url': rng.choice(URLS),
+        }
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    container = build()
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return container, current, peak, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'dicts B/row':>12} {'store B/row':>12} {'ratio':>6} {'dicts s':>8} {'store s':>8} {'to_frame peak B/row':>20}")
+    for size in args.sizes:
+        records, dict_bytes, _, dict_seconds = measure(lambda: list(iter_records(size, args.seed)))
+        del records
+        store, store_bytes, _, store_seconds = measure(lambda: FollowerStore.from_records(iter_records(size, args.seed)))
+        _, _, frame_peak, _ = measure(store.to_frame)
+        del store
+
+        print(f"{size:>10,} {dict_bytes / size:>12.1f} {store_bytes / size:>12.1f} "
+              f"{dict_bytes / store_bytes:>5.1f}x {dict_seconds:>8.2f} {store_seconds:>8.2f} {frame_peak / size:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark the column-wise scorer in scoring.py against the original
+row-by-row DataFrame.apply path, and check both give identical results.
+The row-by-row path uses the frozen original functions in
+benchmarks/reference_scoring.py, not the rule engine.
+
+Run from the repository root:
+    python benchmarks/bench_scoring.py
+    python benchmarks/bench_scoring.py --sizes 10000 100000 1000000 --reference-max 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.reference_scoring import (  # noqa: E402
+    calculate_fake_probability,
+    classify_profile,
+    has_spam_username,
+    has_suspicious_bio,
+)
+from scoring import prepare_followers_frame, score_followers  # noqa: E402
+
+USERNAME_WORDS = np.array(['anna', 'mark', 'f4f_king', 'travel', 'follow_me', 'ab', 'bot_', 'daily', 'like4like', 'x'])
+BIO_CHOICES = np.array(['', 'Photographer', 'follow back pls', 'DM for promo', 'F4F always', '   ', 'coffee & code'])
+
+
+def make_followers(num_rows, seed=0):
+    """Build a synthetic follower frame with the columns collect_followers_data produces"""
+    rng = np.random.default_rng(seed)
+    words = USERNAME_WORDS[rng.integers(0, len(USERNAME_WORDS), num_rows)]
+    digits = rng.integers(0, 100000, num_rows).astype(str)
+    usernames = pd.Series(words, dtype=object) + pd.Series(digits, dtype=object)
+    return pd.DataFrame({
+        'username': usernames,
+        'full_name': np.where(rng.random(num_rows) < 0.3, '', 'Some Name').astype(object),
+        'is_private': rng.random(num_rows) < 0.4,
+        'has_profile_pic': rng.random(num_rows) < 0.8,
+        'is_verified': rng.random(num_rows) < 0.01,
+        'biography': BIO_CHOICES[rng.integers(0, len(BIO_CHOICES), num_rows)].astype(object),
+        'mediacount': rng.integers(0, 200, num_rows),
+        'followers': rng.integers(0, 30000, num_rows),
+        'followees': rng.integers(0, 7500, num_rows),
+        'external_url': '',
+    })
+
+
+def score_by_rows(df):
+    """The original per-row path: one Python call per follower, original rules"""
+    df = df.copy()
+    df['spam_username'] = df['username'].apply(has_spam_username)
+    df['suspicious_bio'] = df['biography'].apply(has_suspicious_bio)
+    df['fake_probability'] = df.apply(calculate_fake_probability, axis=1)
+    df['classification'] = df['fake_probability'].apply(classify_profile)
+    return df
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--reference-max', type=int, default=100_000,
+                        help='largest size to also run (and compare against) the row-by-row path')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'vectorized rows/s':>18} {'row-apply rows/s':>17} {'speedup':>8} identical")
+    for size in args.sizes:
+        frame = prepare_followers_frame(make_followers(size, args.seed))
+        vectorized, vec_seconds = time_call(score_followers, frame.copy())
+
+        row_rate = speedup = identical = '-'
+        if size <= args.reference_max:
+            reference, ref_seconds = time_call(score_by_rows, frame)
+            identical = (
+                np.array_equal(reference['fake_probability'].to_numpy(), vectorized['fake_probability'].to_numpy())
+                and reference['spam_username'].equals(vectorized['spam_username'])
+                and reference['suspicious_bio'].equals(vectorized['suspicious_bio'])
+                and reference['classification'].equals(vectorized['classification'])
+            )
+            row_rate = f"{size / ref_seconds:,.0f}"
+            speedup = f"{ref_seconds / vec_seconds:.0f}x"
+
+        print(f"{size:>10,} {size / vec_seconds:>18,.0f} {row_rate:>17} {speedup:>8} {identical}")
+
+
+if __name__ == "__main__":
+    main()
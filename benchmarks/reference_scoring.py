@@ -0,0 +1,231 @@
+"""
+Frozen copies of the original hand-written per-row scorers, from before the
+rules moved into rule_profiles.py. They are the reference the rule engine is
+checked against (benchmarks/bench_scoring.py, tests/test_rule_profiles.py),
+so do not change them when the profiles change; a profile that stops
+matching them changes results.
+"""
+import datetime
+import re
+
+
+# -----------------------------
+# tryyy.py: InstagramFakeProfileDetector.detect_fake_profiles
+# -----------------------------
+
+def has_spam_username(username):
+    # Check for patterns like many numbers, follow/like keywords, etc.
+    spam_patterns = [
+        r'\d{4,}',  # 4+ consecutive numbers
+        r'follow|flw|f4f|l4l|like4like|spam|_bot|\.bot|bot_',  # Follow/like related patterns
+        r'^[a-z]{1,2}\d{4,}',  # Short character prefix with numbers
+    ]
+    for pattern in spam_patterns:
+        if re.search(pattern, username, re.IGNORECASE):
+            return True
+    return False
+
+
+def has_suspicious_bio(bio):
+    if not isinstance(bio, str):
+        return False
+
+    spam_bio_patterns = [
+        r'follow for follow',
+        r'follow back',
+        r'f4f',
+        r'l4l',
+        r'dm for promo',
+    ]
+    for pattern in spam_bio_patterns:
+        if re.search(pattern, bio, re.IGNORECASE):
+            return True
+    return False
+
+
+def calculate_fake_probability(row):
+    score = 0
+
+    # Extreme follower ratios
+    if row['follower_ratio'] < 0.01:  # Very few followers compared to followees
+        score += 3
+    elif row['follower_ratio'] > 50:  # Extremely high followers compared to followees
+        score += 2
+
+    # No profile picture
+    if not row['has_profile_pic']:
+        score += 2
+
+    # No posts or very few posts
+    if row['mediacount'] == 0:
+        score += 3
+    elif row['mediacount'] < 3:
+        score += 1
+
+    # Suspicious username
+    if row['spam_username']:
+        score += 2
+
+    # Suspicious biography
+    if row['suspicious_bio']:
+        score += 2
+
+    # No biography
+    if not isinstance(row['biography'], str) or row['biography'].strip() == '':
+        score += 1
+
+    # No full name
+    if not isinstance(row['full_name'], str) or row['full_name'].strip() == '':
+        score += 1
+
+    # Verified accounts are not fake
+    if row['is_verified']:
+        score = 0
+
+    # Very high followers usually not fake
+    if row['followers'] > 10000 and row['mediacount'] > 30:
+        score = max(0, score - 2)
+
+    # Convert score to probability (0-100%)
+    max_score = 14
+    probability = min(100, (score / max_score) * 100)
+
+    return probability
+
+
+def classify_profile(probability):
+    if probability < 30:
+        return "Likely Real"
+    elif probability < 60:
+        return "Suspicious"
+    else:
+        return "Likely Fake"
+
+
+# -----------------------------
+# insta_fake_follower_detection.py: calculate_fake_score
+# -----------------------------
+
+def calculate_fake_score(row):
+    """
+    Calculate a fake score (0 to 1) for a follower based on heuristics.
+    """
+    score = 0
+    # Low number of posts (0 or 1)
+    if row['posts'] <= 1:
+        score += 0.3
+    # High following-to-follower ratio (>2)
+    if row['followers'] == 0:
+        ratio = float('inf')
+    else:
+        ratio = row['following'] / (row['followers'] + 1e-6)
+    if ratio > 2:
+        score += 0.3
+    # Missing profile picture
+    if not row['has_profile_pic']:
+        score += 0.2
+    # Missing bio
+    if not row['bio']:
+        score += 0.2
+    return min(score, 1.0)
+
+
+# -----------------------------
+# try1.py: analyze_follower (Streamlit app)
+# -----------------------------
+
+def analyze_follower(f):
+    score = 0
+    reasons = []
+    if f["posts"] < 3:
+        score += 30
+        reasons.append("Very few posts")
+    if f["followers"] > 0 and (f["following"] / f["followers"]) > 2:
+        score += 30
+        reasons.append("High following/follower ratio")
+    if not f["profile_pic"]:
+        score += 20
+        reasons.append("No profile picture")
+    if not f["bio"]:
+        score += 20
+        reasons.append("No bio")
+    label = "Suspicious/Fake" if score >= 50 else "Real"
+    return label, score, reasons
+
+
+# -----------------------------
+# try.py: FakeProfileDetector.analyze_profile (instagrapi)
+# Takes the indicators dict analyze_profile built from the user object.
+# -----------------------------
+
+def analyze_indicators(indicators, fake_indicator_threshold=0.6):
+    fake_score = 0
+
+    # Calculate fake score
+    if indicators['is_private']:
+        fake_score += 0.2
+
+    if indicators['follower_count'] < 100:
+        fake_score += 0.3
+
+    if indicators['following_count'] > 1000:
+        fake_score += 0.4
+
+    if indicators['post_count'] < 3:
+        fake_score += 0.3
+
+    if not indicators['has_profile_pic']:
+        fake_score += 0.25
+
+    if indicators['username_digits'] > 4:
+        fake_score += 0.15
+
+    return min(fake_score, 1.0), fake_score >= fake_indicator_threshold
+
+
+# -----------------------------
+# app.py: FakeProfileDetector (Tk app)
+# -----------------------------
+
+def is_suspicious_account(account):
+    # Define criteria for suspicious accounts
+    suspicious_flags = 0
+
+    # Check profile completeness
+    if not account["profile_pic"]:
+        suspicious_flags += 1
+    if not account["bio"]:
+        suspicious_flags += 1
+    if not account["links"]:
+        suspicious_flags += 0.5
+
+    # Check activity and engagement
+    if account["posts_count"] < 5:
+        suspicious_flags += 1
+    if account["engagement_ratio"] < 0.3:
+        suspicious_flags += 1
+
+    # Check account age (assuming date format YYYY-MM-DD)
+    creation_date = datetime.datetime.strptime(account["creation_date"], "%Y-%m-%d")
+    today = datetime.datetime.now()
+    account_age = (today - creation_date).days
+
+    if account_age < 30:  # Less than a month old
+        suspicious_flags += 1
+
+    # Determine if account is suspicious based on flags
+    return suspicious_flags >= 2
+
+
+def account_flags(account):
+    # Flags listed on each suspicious account card
+    flags = []
+    if not account["profile_pic"]:
+        flags.append("No Profile Picture")
+    if not account["bio"]:
+        flags.append("No Bio")
+    if account["posts_count"] < 10:
+        flags.append("Low Post Count")
+    if account["engagement_ratio"] < 0.3:
+        flags.append("Low Engagement")
+    return flags
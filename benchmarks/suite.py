@@ -0,0 +1,265 @@
+"""
+Benchmark suite: time and memory-profile every scoring path in the repo,
+plus the CSV and snapshot load/export steps, on a seeded synthetic population.
+
+Everything runs offline. Results are written as JSON so a change can be
+compared against a saved baseline:
+
+    python benchmarks/suite.py --sizes 1000 100000 1000000 --output after.json
+    python benchmarks/suite.py --sizes 1000 100000 --output after.json --baseline before.json
+
+The population comes from insta_fake_follower_detection.generate_dummy_followers
+with heavy-tailed counts and is adapted to the field names each scorer
+expects. Peak memory comes from tracemalloc, so buffers allocated by Arrow
+itself are not counted.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from insta_fake_follower_detection import calculate_fake_score, generate_dummy_followers  # noqa: E402
+from rule_profiles import APP_PROFILE, INSTA_PROFILE, TRY1_PROFILE, TRY_PROFILE  # noqa: E402
+from scoring import prepare_followers_frame, score_followers, score_record  # noqa: E402
+from snapshot_store import HAVE_PYARROW, raw_schema, read_snapshot, write_snapshot  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+SPAM_BIOS = np.array(['follow back', 'F4F', 'DM for promo', 'l4l daily'], dtype=object)
+
+
+# -----------------------------
+# Population and per-scorer adapters
+# -----------------------------
+
+def make_population(num_rows, seed):
+    return generate_dummy_followers(num_rows, seed=seed, heavy_tailed=True)
+
+
+def to_tryyy(population, seed):
+    """Fields produced by tryyy.collect_followers_data"""
+    rng = np.random.default_rng(seed)
+    n = len(population)
+    usernames = population['username'].to_numpy(dtype=object).copy()
+    spammy = rng.random(n) < 0.05
+    usernames[spammy] = usernames[spammy] + 'bot_' + rng.integers(1000, 99999, spammy.sum()).astype(str).astype(object)
+    bios = population['bio'].to_numpy(dtype=object).copy()
+    spam_bio = rng.random(n) < 0.03
+    bios[spam_bio] = SPAM_BIOS[rng.integers(0, len(SPAM_BIOS), spam_bio.sum())]
+    return pd.DataFrame({
+        'username': usernames,
+        'full_name': np.where(rng.random(n) < 0.25, '', 'Full Name').astype(object),
+        'is_private': rng.random(n) < 0.4,
+        'has_profile_pic': population['has_profile_pic'].to_numpy(),
+        'is_verified': rng.random(n) < 0.01,
+        'biography': bios,
+        'mediacount': population['posts'].to_numpy(),
+        'followers': population['followers'].to_numpy(),
+        'followees': population['following'].to_numpy(),
+        'external_url': np.where(rng.random(n) < 0.1, 'https://example.com', '').astype(object),
+    })
+
+
+def to_try1(population):
+    """Fields of the Streamlit demo data in try1.py"""
+    return pd.DataFrame({
+        'username': population['username'],
+        'posts': population['posts'],
+        'followers': population['followers'],
+        'following': population['following'],
+        'profile_pic': population['has_profile_pic'],
+        'bio': population['bio'].astype(bool),
+    })
+
+
+def to_try(population, seed):
+    """Indicator dicts built by try.FakeProfileDetector.profile_indicators"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'is_private': rng.random(len(population)) < 0.4,
+        'follower_count': population['followers'],
+        'following_count': population['following'],
+        'post_count': population['posts'],
+        'has_profile_pic': population['has_profile_pic'],
+        'username_digits': population['username'].str.count(r'\d'),
+        'fullname_length': rng.integers(0, 30, len(population)),
+    })
+
+
+def to_app(population, seed):
+    """Fields of the sample accounts in app.py"""
+    rng = np.random.default_rng(seed)
+    created = pd.Timestamp('2026-01-01') - pd.to_timedelta(rng.integers(0, 3000, len(population)), unit='D')
+    return pd.DataFrame({
+        'username': population['username'],
+        'profile_pic': population['has_profile_pic'],
+        'bio': population['bio'].astype(bool),
+        'links': rng.random(len(population)) < 0.5,
+        'posts_count': population['posts'],
+        'creation_date': created.strftime('%Y-%m-%d'),
+        'engagement_ratio': rng.random(len(population)),
+    })
+
+
+# -----------------------------
+# Cases
+# -----------------------------
+
+def each_record(frame, func):
+    for record in frame.to_dict('records'):
+        func(record)
+
+
+def build_cases(population, seed, record_max, workdir):
+    """Return [(name, setup, run)]; setup output is passed to run and not measured"""
+    tryyy_raw = to_tryyy(population, seed)
+    try1_frame = to_try1(population)
+    try_frame = to_try(population, seed)
+    app_frame = to_app(population, seed)
+    record_slice = slice(0, record_max)
+
+    csv_path = os.path.join(workdir, 'followers.csv')
+    snapshot_path = os.path.join(workdir, 'followers.arrow')
+
+    cases = [
+        ('tryyy.columns', lambda: tryyy_raw.copy(), lambda df: score_followers(prepare_followers_frame(df))),
+        ('insta.columns', lambda: population, INSTA_PROFILE.evaluate),
+        ('try1.columns', lambda: try1_frame, lambda df: TRY1_PROFILE.evaluate(df, reasons=True)),
+        ('try.columns', lambda: try_frame, TRY_PROFILE.evaluate),
+        ('app.columns', lambda: app_frame, APP_PROFILE.evaluate),
+        ('csv.export', lambda: tryyy_raw, lambda df: df.to_csv(csv_path, index=False)),
+        ('csv.load', lambda: csv_path, pd.read_csv),
+    ]
+    if HAVE_PYARROW:
+        cases += [
+            ('snapshot.export', lambda: tryyy_raw,
+             lambda df: write_snapshot(df, snapshot_path, schema=raw_schema())),
+            ('snapshot.load', lambda: snapshot_path, read_snapshot),
+        ]
+    if record_max:
+        cases += [
+            ('tryyy.records', lambda: tryyy_raw.iloc[record_slice], lambda df: each_record(df, score_record)),
+            ('insta.records', lambda: population.iloc[record_slice], lambda df: each_record(df, calculate_fake_score)),
+            ('try1.records', lambda: try1_frame.iloc[record_slice],
+             lambda df: each_record(df, TRY1_PROFILE.evaluate_record)),
+            ('try.records', lambda: try_frame.iloc[record_slice], lambda df: each_record(df, TRY_PROFILE.evaluate_record)),
+            ('app.records', lambda: app_frame.iloc[record_slice], lambda df: each_record(df, APP_PROFILE.evaluate_record)),
+        ]
+    return cases
+
+
+def measure(setup, run, repeat):
+    """Best wall time over repeat runs, then one traced run for peak memory"""
+    best = float('inf')
+    for _ in range(repeat):
+        argument = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(argument)
+        best = min(best, time.perf_counter() - start)
+
+    argument = setup()
+    gc.collect()
+    tracemalloc.start()
+    run(argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_suite(sizes, seed, repeat, record_max, only=None):
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            population = make_population(size, seed)
+            for name, setup, run in build_cases(population, seed, record_max, workdir):
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+                rows = min(size, record_max) if name.endswith('.records') else size
+                seconds, peak = measure(setup, run, repeat)
+                results.append({
+                    'case': name,
+                    'rows': rows,
+                    'population': size,
+                    'seconds': seconds,
+                    'rows_per_second': rows / seconds if seconds else None,
+                    'peak_bytes': peak,
+                    'peak_bytes_per_row': peak / rows if rows else None,
+                })
+                print(f"{name:<16} {rows:>10,} rows {seconds:>9.4f}s {rows / seconds:>14,.0f} rows/s "
+                      f"{peak / 2**20:>9.1f} MiB peak", flush=True)
+    return results
+
+
+def environment():
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'pyarrow': HAVE_PYARROW,
+    }
+
+
+def compare(results, baseline_path, tolerance):
+    """Print speed and memory ratios against a baseline; return the list of regressions"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(r['case'], r['rows']): r for r in json.load(f)['results']}
+
+    regressions = []
+    print(f"\nCompared with {baseline_path} (tolerance {tolerance:.0%}):")
+    for result in results:
+        before = baseline.get((result['case'], result['rows']))
+        if before is None:
+            continue
+        time_ratio = result['seconds'] / before['seconds']
+        memory_ratio = result['peak_bytes'] / before['peak_bytes'] if before['peak_bytes'] else 1.0
+        flag = ''
+        if time_ratio > 1 + tolerance or memory_ratio > 1 + tolerance:
+            flag = '  REGRESSION'
+            regressions.append(result['case'])
+        print(f"{result['case']:<16} {result['rows']:>10,} rows  time x{time_ratio:.2f}  memory x{memory_ratio:.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='population sizes, e.g. 1000 ... 10000000')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case; the best is kept')
+    parser.add_argument('--record-max', type=int, default=100_000,
+                        help='rows used for the per-record paths (0 to skip them)')
+    parser.add_argument('--only', nargs='+', help='run only cases starting with these prefixes')
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', help='earlier --output file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.10)
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.seed, args.repeat, args.record_max, args.only)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'seed': args.seed, 'results': results}, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 import instaloader
 from datetime import datetime
+from types import SimpleNamespace
+
+from profile_cache import ProfileCache, profile_to_record
 
 # Function to check if a profile is fake
 def is_fake_profile(profile):
@@ -25,14 +28,25 @@ def is_fake_profile(profile):
 
     return False  # Assume real
 
+# Function to look up a profile, checking the on-disk cache first
+def load_profile(context, username, cache):
+    cached = cache.get(username=username)
+    if cached is not None:
+        return SimpleNamespace(**cached)
+
+    profile = instaloader.Profile.from_username(context, username)
+    cache.put(username, profile_to_record(profile))
+    return profile
+
 # Create an Instaloader object
 L = instaloader.Instaloader()
+cache = ProfileCache()
 
 # Input Instagram username
 username = input("Enter Instagram username: ")
 
 # Fetch profile data
-profile = instaloader.Profile.from_username(L.context, username)
+profile = load_profile(L.context, username, cache)
 
 # Print profile details
 print("\nProfile Details:")
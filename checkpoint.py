@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+import shutil
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# Durable, resumable follower collection state
+# -----------------------------
+
+DEFAULT_CHECKPOINT_DIR = "checkpoints"
+
+
+class CollectionCheckpoint:
+    """
+    On-disk state of one follower collection run.
+
+    records.jsonl is an append-only log with two kinds of lines:
+    {"queued": {...}} when a follower is pulled from the follower list, and
+    {"collected": {...}} once its details are in. iterator.json holds the
+    frozen follower-iterator position. A restarted run reloads the collected
+    records, re-enriches followers that were queued but never finished, and
+    resumes the follower list where it left off. Only usernames of collected
+    followers are kept in memory; the records themselves stay on disk.
+    """
+
+    def __init__(self, target, directory=DEFAULT_CHECKPOINT_DIR, fsync_every=50):
+        self.directory = os.path.join(directory, target)
+        self.records_path = os.path.join(self.directory, "records.jsonl")
+        self.iterator_path = os.path.join(self.directory, "iterator.json")
+        self.fsync_every = fsync_every
+        self.collected = set()
+        self.queued = {}
+        self._log = None
+        self._unsynced = 0
+        self._load()
+
+    def _iter_entries(self):
+        if not os.path.exists(self.records_path):
+            return
+        with open(self.records_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partial last line behind
+                    logger.warning(f"Ignoring unreadable checkpoint line {line_number} in {self.records_path}")
+
+    def _load(self):
+        for entry in self._iter_entries():
+            if "collected" in entry:
+                username = entry["collected"]["username"]
+                self.collected.add(username)
+                self.queued.pop(username, None)
+            elif "queued" in entry:
+                record = entry["queued"]
+                if record["username"] not in self.collected:
+                    self.queued[record["username"]] = record
+        if self.collected or self.queued:
+            logger.info(f"Resuming from checkpoint: {len(self.collected)} collected, "
+                        f"{len(self.queued)} unfinished")
+
+    @property
+    def is_resuming(self):
+        return bool(self.collected or self.queued)
+
+    def seen(self, username):
+        """True if the follower was already queued or collected"""
+        return username in self.collected or username in self.queued
+
+    def _append(self, entry):
+        if self._log is None:
+            os.makedirs(self.directory, exist_ok=True)
+            needs_newline = False
+            if os.path.exists(self.records_path) and os.path.getsize(self.records_path) > 0:
+                # Terminate a partial line left by a crash so the next entry starts clean
+                with open(self.records_path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    needs_newline = f.read(1) != b"\n"
+            self._log = open(self.records_path, "a", encoding="utf-8")
+            if needs_newline:
+                self._log.write("\n")
+        self._log.write(json.dumps(entry) + "\n")
+        self._log.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            os.fsync(self._log.fileno())
+            self._unsynced = 0
+
+    def mark_queued(self, record):
+        self.queued[record["username"]] = record
+        self._append({"queued": record})
+
+    def mark_collected(self, record):
+        self.queued.pop(record["username"], None)
+        self.collected.add(record["username"])
+        self._append({"collected": record})
+
+    def iter_collected_records(self):
+        """Stream the collected records back from disk"""
+        seen = set()
+        for entry in self._iter_entries():
+            record = entry.get("collected")
+            if record is not None and record["username"] not in seen:
+                seen.add(record["username"])
+                yield record
+
+    def save_iterator_state(self, state):
+        """Atomically replace the stored follower-iterator state"""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.iterator_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.iterator_path)
+
+    def load_iterator_state(self):
+        if not os.path.exists(self.iterator_path):
+            return None
+        try:
+            with open(self.iterator_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read iterator state, starting the follower list over: {str(e)}")
+            return None
+
+    def close(self):
+        if self._log is not None:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._log.close()
+            self._log = None
+            self._unsynced = 0
+
+    def clear(self):
+        """Remove the checkpoint once the run has finished"""
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.collected = set()
+        self.queued = {}
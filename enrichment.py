@@ -0,0 +1,101 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# Concurrent follower enrichment under a shared request budget
+# -----------------------------
+
+DETAIL_FIELDS = ('biography', 'mediacount', 'followers', 'followees', 'external_url')
+
+EMPTY_DETAILS = {
+    'biography': '',
+    'mediacount': 0,
+    'followers': 0,
+    'followees': 0,
+    'external_url': '',
+}
+
+
+class RequestBudget:
+    """
+    Sliding-window request limiter shared by every worker thread.
+    At most max_requests calls to acquire() return within any window of
+    window_seconds; callers past the budget block until a slot frees up.
+    """
+
+    def __init__(self, max_requests=30, window_seconds=60.0):
+        if max_requests < 1:
+            raise ValueError("max_requests must be at least 1")
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._sent = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent, then record it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self.window_seconds:
+                    self._sent.popleft()
+                if len(self._sent) < self.max_requests:
+                    self._sent.append(now)
+                    return
+                wait_for = self.window_seconds - (now - self._sent[0])
+            time.sleep(max(wait_for, 0.01))
+
+
+def call_with_retries(func, *args, attempts=4, base_delay=1.0, max_delay=60.0, retry_on=(Exception,)):
+    """
+    Call func(*args), retrying errors listed in retry_on up to attempts times
+    in total. Waits grow exponentially from base_delay (capped at max_delay)
+    with full jitter, so parallel workers do not retry in lockstep. The last
+    error is re-raised; errors not in retry_on are raised immediately.
+    """
+    for attempt in range(attempts):
+        try:
+            return func(*args)
+        except retry_on as e:
+            if attempt == attempts - 1:
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            logger.debug(f"Attempt {attempt + 1} of {attempts} failed ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def iter_concurrent(func, items, workers=4, max_in_flight=None):
+    """
+    Apply func to each item on a thread pool and yield (item, result, error)
+    tuples as calls complete. Items are pulled lazily so at most
+    max_in_flight calls (default 2 * workers) are pending at once; error is
+    the exception raised by func, or None.
+    """
+    max_in_flight = max_in_flight or workers * 2
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_in_flight:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(func, item)] = item
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                yield item, (None if error else future.result()), error
+
@@ -0,0 +1,95 @@
+import json
+import logging
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from snapshot_store import HAVE_PYARROW, read_snapshot, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# Per-target follower history for incremental (delta) runs
+# -----------------------------
+
+DEFAULT_HISTORY_DIR = "follower_history"
+
+DELTA_NEW = "new"
+DELTA_UNCHANGED = "unchanged"
+DELTA_LEFT = "left"
+
+
+class FollowerHistory:
+    """
+    The scored followers of a target's last run, kept on disk so the next
+    run only has to analyze followers who joined since. results holds the
+    scored rows (Parquet with pyarrow, CSV otherwise) and meta.json records
+    when they were saved.
+    """
+
+    def __init__(self, target, directory=DEFAULT_HISTORY_DIR):
+        self.directory = os.path.join(directory, target)
+        extension = "parquet" if HAVE_PYARROW else "csv"
+        self.results_path = os.path.join(self.directory, f"results.{extension}")
+        self.meta_path = os.path.join(self.directory, "meta.json")
+
+    def load(self):
+        """Scored followers of the last run, or None if there is none"""
+        if not os.path.exists(self.results_path):
+            return None
+        try:
+            if HAVE_PYARROW:
+                return read_snapshot(self.results_path)
+            return pd.read_csv(self.results_path)
+        except Exception as e:
+            logger.warning(f"Could not read follower history, analyzing everyone again: {str(e)}")
+            return None
+
+    def load_meta(self):
+        if not os.path.exists(self.meta_path):
+            return {}
+        with open(self.meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, results):
+        """Replace the stored results with this run's scored followers"""
+        os.makedirs(self.directory, exist_ok=True)
+        if HAVE_PYARROW:
+            write_snapshot(results, self.results_path)
+        else:
+            tmp_path = self.results_path + ".tmp"
+            results.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, self.results_path)
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": datetime.now().isoformat(timespec="seconds"),
+                       "followers": len(results)}, f)
+        os.replace(tmp_path, self.meta_path)
+
+
+def diff_followers(previous_usernames, current_usernames):
+    """Split usernames into (joined, stayed, left) sets"""
+    previous_usernames = set(previous_usernames)
+    current_usernames = set(current_usernames)
+    return (current_usernames - previous_usernames,
+            current_usernames & previous_usernames,
+            previous_usernames - current_usernames)
+
+
+def merge_delta(previous, new_results, current_usernames):
+    """
+    Combine last run's rows with the newly scored followers into one report
+    with a delta_status column: new, unchanged, or left (no longer
+    following). Rows are not sorted; see sort_results in tryyy.py.
+    """
+    current = previous['username'].isin(set(current_usernames))
+    parts = [
+        previous[current].assign(delta_status=DELTA_UNCHANGED),
+        new_results.assign(delta_status=DELTA_NEW),
+        previous[~current].assign(delta_status=DELTA_LEFT),
+    ]
+    merged = pd.concat([part for part in parts if len(part)], ignore_index=True)
+    if merged.empty:
+        return previous.assign(delta_status=pd.Series(dtype=object))
+    return merged
@@ -0,0 +1,278 @@
+import queue
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from rule_profiles import APP_FLAG_PROFILE, APP_PROFILE
+
+# -----------------------------
+# Scored follower model shared by the Tk app's tabs
+# -----------------------------
+
+STATUS_SUSPICIOUS = "Suspicious"
+STATUS_GENUINE = "Genuine"
+
+# Columns added by scoring; everything else is follower data
+DERIVED_COLUMNS = ('created', 'account_age_days', 'score', 'suspicious', 'status', 'flags')
+
+
+def score_batch(records, now):
+    """Score records (list of dicts or DataFrame) into a frame with the derived columns"""
+    frame = records.reset_index(drop=True) if isinstance(records, pd.DataFrame) else pd.DataFrame(list(records))
+    frame['created'] = pd.to_datetime(frame['creation_date'], format="%Y-%m-%d")
+    frame['account_age_days'] = (now - frame['created']).dt.days.to_numpy()
+    scored = APP_PROFILE.evaluate(frame)
+    suspicious = scored['label'].astype(bool).to_numpy()
+    frame['score'] = scored['score']
+    frame['suspicious'] = suspicious
+    frame['status'] = np.where(suspicious, STATUS_SUSPICIOUS, STATUS_GENUINE).astype(object)
+    frame['flags'] = APP_FLAG_PROFILE.evaluate(frame, reasons=True)['reasons']
+    return frame
+
+
+def _common_dtype(first, second):
+    try:
+        return np.promote_types(first, second)
+    except TypeError:
+        return np.dtype(object)
+
+
+class ScoredFollowers:
+    """
+    Follower records plus their score, status and card flags, computed once
+    per dataset. Creation dates are parsed once and ages are measured against
+    the time the model was built. update() rescores only the rows that
+    actually change.
+
+    Rows live in one NumPy buffer per column whose capacity doubles as
+    batches arrive, so appending copies only the new rows. Views read the
+    columns and take() the rows they show; frame builds a full DataFrame
+    and is for callers that really want one.
+    """
+
+    def __init__(self, records=(), now=None):
+        self.now = pd.Timestamp(now if now is not None else datetime.now())
+        self._columns = {}
+        self._size = 0
+        self._capacity = 0
+        self._positions = {}
+        self._frame = None
+        if len(records):
+            self.extend([score_batch(records, self.now)])
+
+    def _score(self, frame):
+        return score_batch(frame, self.now)
+
+    def column(self, name):
+        """A column's values for every row (a view of the buffer; do not modify)"""
+        return self._columns[name][:self._size]
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    def _reserve(self, rows):
+        if rows <= self._capacity:
+            return
+        self._capacity = max(rows, 2 * self._capacity, 1024)
+        for name, values in self._columns.items():
+            grown = np.empty(self._capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._columns[name] = grown
+
+    def _store(self, name, start, values):
+        """Write values into rows start.. of column name, widening its dtype if needed"""
+        buffer = self._columns.get(name)
+        if buffer is None:
+            buffer = np.empty(self._capacity, dtype=values.dtype)
+            if values.dtype == object:
+                buffer[:start] = None
+            elif start:
+                buffer = buffer.astype(object)
+                buffer[:start] = None
+        else:
+            dtype = _common_dtype(buffer.dtype, values.dtype)
+            if dtype != buffer.dtype:
+                buffer = buffer.astype(dtype)
+        buffer[start:start + len(values)] = values
+        self._columns[name] = buffer
+
+    def _append(self, frame):
+        start = self._size
+        self._reserve(start + len(frame))
+        for name in frame.columns:
+            self._store(name, start, frame[name].to_numpy())
+        for name in self._columns:
+            if name not in frame.columns:
+                self._store(name, start, np.full(len(frame), None, dtype=object))
+        self._size += len(frame)
+        for offset, username in enumerate(frame['username']):
+            self._positions[username] = start + offset
+
+    def _overwrite(self, positions, frame):
+        """Write frame's rows over the rows at positions; columns frame lacks keep their values"""
+        for name in frame.columns:
+            if name not in self._columns:
+                self._columns[name] = np.full(self._capacity, None, dtype=object)
+            values = frame[name].to_numpy()
+            buffer = self._columns[name]
+            dtype = _common_dtype(buffer.dtype, values.dtype)
+            if dtype != buffer.dtype:
+                buffer = self._columns[name] = buffer.astype(dtype)
+            buffer[positions] = values
+
+    def extend(self, scored_frames):
+        """
+        Add frames already scored by score_batch (e.g. by AnalysisWorker).
+        There is one row per username: a follower seen again, in the same
+        frame or an earlier one, replaces the row it had.
+        """
+        for frame in scored_frames:
+            if not len(frame):
+                continue
+            if frame['username'].duplicated().any():
+                # Each follower keeps the place it first appeared at, with its latest data
+                latest = frame.drop_duplicates('username', keep='last')
+                order = pd.Index(latest['username']).get_indexer(frame['username'].drop_duplicates())
+                frame = latest.iloc[order]
+            frame = frame.reset_index(drop=True)
+            existing = np.array([self._positions.get(username, -1) for username in frame['username']])
+            known = existing >= 0
+            if known.any():
+                self._overwrite(existing[known], frame[known])
+            if not known.all():
+                self._append(frame[~known].reset_index(drop=True))
+            self._frame = None
+
+    def take(self, positions):
+        """DataFrame of the rows at positions, in that order"""
+        positions = np.asarray(positions, dtype=np.intp)
+        return pd.DataFrame({name: self.column(name)[positions] for name in self._columns})
+
+    def row(self, position):
+        """One row as a Series"""
+        return pd.Series({name: self.column(name)[position] for name in self._columns})
+
+    @property
+    def frame(self):
+        """Every row as a DataFrame; built on demand and kept until the data changes"""
+        if self._frame is None:
+            self._frame = self.take(np.arange(self._size))
+        return self._frame
+
+    def _data_columns(self):
+        return [column for column in self._columns if column not in DERIVED_COLUMNS]
+
+    def _changed(self, position, record):
+        for key, value in record.items():
+            if key not in self._columns or self._columns[key][position] != value:
+                return True
+        return False
+
+    def update(self, records):
+        """
+        Insert or replace followers (matched by username), rescoring only rows
+        whose data changed. Returns the number of rows rescored.
+        """
+        changed, added = {}, []
+        # The last record for a username wins, as in extend()
+        for record in {record['username']: record for record in records}.values():
+            position = self._positions.get(record['username'])
+            if position is None:
+                added.append(record)
+            elif self._changed(position, record):
+                changed[position] = record
+
+        if changed:
+            positions = list(changed)
+            current = self.take(positions)[self._data_columns()].to_dict('records')
+            merged = pd.DataFrame([{**old, **changed[p]} for old, p in zip(current, positions)])
+            self._overwrite(positions, self._score(merged))
+            self._frame = None
+
+        if added:
+            self.extend([self._score(added)])
+
+        return len(changed) + len(added)
+
+    def __len__(self):
+        return self._size
+
+    def counts(self):
+        """(real, suspicious) totals"""
+        if not self._size:
+            return 0, 0
+        fake = int(self.column('suspicious').sum())
+        return self._size - fake, fake
+
+    def suspicious_rows(self):
+        return self.take(np.flatnonzero(self.column('suspicious')))
+
+    def select(self, status=None, search=None, sort_by=None, descending=False):
+        """
+        Row positions matching a status and a username substring, optionally
+        sorted by a column. Works on the data only, so it is cheap to call
+        for any filter or sort the UI asks for.
+        """
+        if not self._size:
+            return np.empty(0, dtype=np.intp)
+        mask = np.ones(self._size, dtype=bool)
+        if status:
+            mask &= self.column('status') == status
+        if search:
+            usernames = pd.Series(self.column('username'), copy=False)
+            mask &= usernames.str.contains(search, case=False, regex=False).to_numpy(dtype=bool)
+        positions = np.flatnonzero(mask)
+        if sort_by is not None:
+            values = pd.Series(self.column(sort_by)[positions])
+            order = values.sort_values(ascending=not descending, kind='stable').index.to_numpy()
+            positions = positions[order]
+        return positions
+
+    def rows(self, frame=None):
+        """Iterate rows as dicts (all rows, or those of a filtered frame)"""
+        frame = self.frame if frame is None else frame
+        columns = list(frame.columns)
+        for values in frame.itertuples(index=False, name=None):
+            yield dict(zip(columns, values))
+
+
+class AnalysisWorker(threading.Thread):
+    """
+    Scores followers on a background thread, putting ('batch', frame)
+    messages on a queue as each batch is done, then ('done', None) or
+    ('error', message). cancel() stops it after the current batch.
+    """
+
+    def __init__(self, records, now, batch_size=5000):
+        super().__init__(daemon=True)
+        self.records = records
+        self.now = now
+        self.batch_size = batch_size
+        self.results = queue.Queue()
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            for start in range(0, len(self.records), self.batch_size):
+                if self.cancelled.is_set():
+                    break
+                batch = self.records[start:start + self.batch_size]
+                self.results.put(('batch', score_batch(batch, self.now)))
+            self.results.put(('done', None))
+        except Exception as e:
+            self.results.put(('error', str(e)))
+
+    def drain(self):
+        """Collect every message waiting on the queue without blocking"""
+        messages = []
+        while True:
+            try:
+                messages.append(self.results.get_nowait())
+            except queue.Empty:
+                return messages
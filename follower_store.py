@@ -0,0 +1,171 @@
+from array import array
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+# -----------------------------
+# Compact, column-oriented storage for collected follower records
+# -----------------------------
+
+FLAG_FIELDS = ('is_private', 'has_profile_pic', 'is_verified')
+COUNT_FIELDS = ('mediacount', 'followers', 'followees')
+TEXT_FIELDS = ('username', 'full_name', 'biography')
+CATEGORY_FIELDS = ('external_url',)
+
+FIELDS = ('username', 'full_name', 'is_private', 'has_profile_pic', 'is_verified',
+          'biography', 'mediacount', 'followers', 'followees', 'external_url')
+
+# Counts are stored as uint32; anything larger is clamped
+_COUNT_MAX = 2 ** 32 - 1
+
+
+class _TextColumn:
+    """Strings packed end to end as UTF-8 with an offsets array, like an Arrow string column"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array('q', [0])
+
+    def append(self, value):
+        if isinstance(value, str) and value:
+            self.data += value.encode('utf-8')
+        self.offsets.append(len(self.data))
+
+    def get(self, index):
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+    @property
+    def nbytes(self):
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+    def to_series(self, length):
+        if pa is not None:
+            # Wrap the packed buffers directly, no per-string Python objects
+            arrow = pa.LargeStringArray.from_buffers(
+                length, pa.py_buffer(self.offsets.tobytes()), pa.py_buffer(bytes(self.data))
+            )
+            return arrow.to_pandas()
+        return pd.Series([self.get(i) for i in range(length)], dtype=object)
+
+
+class _CategoryColumn:
+    """Low-cardinality strings stored once, referenced by uint32 codes"""
+
+    def __init__(self):
+        self.codes = array('I')
+        self.values = []
+        self._lookup = {}
+
+    def append(self, value):
+        value = value if isinstance(value, str) else ''
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def get(self, index):
+        return self.values[self.codes[index]]
+
+    @property
+    def nbytes(self):
+        return self.codes.itemsize * len(self.codes) + sum(len(v) for v in self.values)
+
+    def to_series(self, length):
+        categories = pd.Index(self.values, dtype=object)
+        codes = np.frombuffer(self.codes, dtype=np.uint32)[:length].astype(np.int32)
+        return pd.Series(pd.Categorical.from_codes(codes, categories=categories)).astype(object)
+
+
+class FollowerStore:
+    """
+    Follower records kept as fixed-schema columns instead of a list of dicts.
+    Boolean fields are bit-packed into one byte per follower, counts use
+    uint32, free text is packed UTF-8 and external URLs are categorical.
+    """
+
+    def __init__(self):
+        self._flags = array('B')
+        self._counts = {field: array('I') for field in COUNT_FIELDS}
+        self._text = {field: _TextColumn() for field in TEXT_FIELDS}
+        self._categories = {field: _CategoryColumn() for field in CATEGORY_FIELDS}
+
+    @classmethod
+    def from_records(cls, records):
+        store = cls()
+        for record in records:
+            store.append(record)
+        return store
+
+    def append(self, record):
+        flags = 0
+        for bit, field in enumerate(FLAG_FIELDS):
+            if record.get(field):
+                flags |= 1 << bit
+        self._flags.append(flags)
+        for field in COUNT_FIELDS:
+            value = record.get(field)
+            if value is None or value != value:  # missing or NaN
+                value = 0
+            self._counts[field].append(min(max(int(value), 0), _COUNT_MAX))
+        for field in TEXT_FIELDS:
+            self._text[field].append(record.get(field))
+        for field in CATEGORY_FIELDS:
+            self._categories[field].append(record.get(field))
+
+    def __len__(self):
+        return len(self._flags)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("follower index out of range")
+        record = {}
+        for field in FIELDS:
+            if field in FLAG_FIELDS:
+                record[field] = bool(self._flags[index] >> FLAG_FIELDS.index(field) & 1)
+            elif field in COUNT_FIELDS:
+                record[field] = self._counts[field][index]
+            elif field in TEXT_FIELDS:
+                record[field] = self._text[field].get(index)
+            else:
+                record[field] = self._categories[field].get(index)
+        return record
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self):
+        """Approximate bytes held by the store"""
+        total = self._flags.itemsize * len(self._flags)
+        total += sum(column.itemsize * len(column) for column in self._counts.values())
+        total += sum(column.nbytes for column in self._text.values())
+        total += sum(column.nbytes for column in self._categories.values())
+        return total
+
+    def bytes_per_follower(self):
+        return self.nbytes / len(self) if len(self) else 0.0
+
+    def to_frame(self):
+        """Build a typed DataFrame with the same columns collect_followers_data produces"""
+        length = len(self)
+        flags = np.frombuffer(self._flags, dtype=np.uint8)[:length]
+        columns = {}
+        for field in FIELDS:
+            if field in FLAG_FIELDS:
+                columns[field] = (flags >> FLAG_FIELDS.index(field) & 1).astype(bool)
+            elif field in COUNT_FIELDS:
+                columns[field] = np.frombuffer(self._counts[field], dtype=np.uint32)[:length].astype(np.int64)
+            elif field in TEXT_FIELDS:
+                columns[field] = self._text[field].to_series(length)
+            else:
+                columns[field] = self._categories[field].to_series(length)
+        return pd.DataFrame(columns)
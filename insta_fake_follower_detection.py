@@ -1,56 +1,95 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import random
+
+from rule_profiles import INSTA_PROFILE
 
 # -----------------------------
 # Instagram Fake Follower Detection
 # -----------------------------
 
-def generate_dummy_followers(num_followers=50):
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def _dummy_followers_chunk(rng, start, count, heavy_tailed=False):
+    """Draw `count` followers numbered from start+1 as typed columns"""
+    usernames = 'user_' + pd.Series(np.arange(start + 1, start + count + 1)).astype(str)
+
+    # Posts: 0 (20%), 1-10 (50%) or 11-100 (30%)
+    band = rng.choice(3, size=count, p=[0.2, 0.5, 0.3])
+    posts = np.where(band == 1, rng.integers(1, 11, count), rng.integers(11, 101, count))
+    posts[band == 0] = 0
+
+    if heavy_tailed:
+        followers = np.minimum(rng.lognormal(5.0, 1.5, count), 5_000_000).astype(np.int32)
+        following = np.minimum(rng.lognormal(5.5, 1.0, count), 7500).astype(np.int32)
+    else:
+        # Uniform, as the original demo generated them
+        followers = rng.integers(0, 1001, count, dtype=np.int32)
+        following = rng.integers(0, 3001, count, dtype=np.int32)
+    has_profile_pic = rng.random(count) < 0.85
+    has_bio = rng.random(count) < 0.7
+    bio = ('Bio of ' + usernames).where(has_bio, '')
+
+    return pd.DataFrame({
+        "username": usernames,
+        "posts": posts.astype(np.int32),
+        "followers": followers,
+        "following": following,
+        "has_profile_pic": has_profile_pic,
+        "bio": bio,
+    })
+
+
+def iter_dummy_followers(num_followers=50, chunk_size=DEFAULT_CHUNK_SIZE, seed=None, heavy_tailed=False):
+    """
+    Yield dummy followers as DataFrames of at most chunk_size rows, so very
+    large populations can be generated and processed out of core.
+    The same seed and chunk_size always give the same followers.
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, num_followers, chunk_size):
+        yield _dummy_followers_chunk(rng, start, min(chunk_size, num_followers - start), heavy_tailed)
+
+
+def generate_dummy_followers(num_followers=50, seed=None, chunk_size=DEFAULT_CHUNK_SIZE, heavy_tailed=False):
     """
     Generate a DataFrame with dummy follower data.
     Each follower has: username, posts, followers, following, has_profile_pic, bio
+    Follower (0-1000) and following (0-3000) counts are uniform; with
+    heavy_tailed they are log-normal like real audiences instead. Pass a
+    seed to get the same population every time.
     """
-    followers = []
-    for i in range(num_followers):
-        username = f"user_{i+1}"
-        posts = random.choices([0, random.randint(1, 10), random.randint(11, 100)], [0.2, 0.5, 0.3])[0]
-        followers_count = random.randint(0, 1000)
-        following_count = random.randint(0, 3000)
-        has_profile_pic = random.choices([True, False], [0.85, 0.15])[0]
-        bio = random.choices(["", f"Bio of {username}"], [0.3, 0.7])[0]
-        followers.append({
-            "username": username,
-            "posts": posts,
-            "followers": followers_count,
-            "following": following_count,
-            "has_profile_pic": has_profile_pic,
-            "bio": bio
-        })
-    return pd.DataFrame(followers)
+    chunks = list(iter_dummy_followers(num_followers, chunk_size=chunk_size, seed=seed, heavy_tailed=heavy_tailed))
+    if not chunks:
+        return _dummy_followers_chunk(np.random.default_rng(seed), 0, 0, heavy_tailed)
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
 
 def calculate_fake_score(row):
     """
-    Calculate a fake score (0 to 1) for a follower based on heuristics.
+    Calculate a fake score (0 to 1) for a single follower.
+    The rules and weights live in rule_profiles.INSTA_PROFILE.
     """
-    score = 0
-    # Low number of posts (0 or 1)
-    if row['posts'] <= 1:
-        score += 0.3
-    # High following-to-follower ratio (>2)
-    if row['followers'] == 0:
-        ratio = float('inf')
-    else:
-        ratio = row['following'] / (row['followers'] + 1e-6)
-    if ratio > 2:
-        score += 0.3
-    # Missing profile picture
-    if not row['has_profile_pic']:
-        score += 0.2
-    # Missing bio
-    if not row['bio']:
-        score += 0.2
-    return min(score, 1.0)
+    return INSTA_PROFILE.evaluate_record(row).score
+
+
+def calculate_fake_scores(df):
+    """
+    Fake scores (0 to 1) for every follower in df at once; the whole-column
+    equivalent of calculate_fake_score.
+    """
+    return INSTA_PROFILE.evaluate(df)['score']
+
+
+def label_followers(df):
+    """Add fake_score and label columns to df for every follower at once"""
+    scored = INSTA_PROFILE.evaluate(df)
+    df['fake_score'] = scored['score']
+    df['label'] = scored['label']
+    return df
+
 
 def main():
     print("=== Instagram Fake Follower Detection ===")
@@ -60,9 +99,8 @@ def main():
     # Simulate or load follower data
     df = generate_dummy_followers(num_followers=50)
 
-    # Calculate fake score for each follower
-    df['fake_score'] = df.apply(calculate_fake_score, axis=1)
-    df['label'] = df['fake_score'].apply(lambda x: 'Fake' if x > 0.5 else 'Real')
+    # Calculate fake score and label for every follower at once
+    label_followers(df)
 
     # Output pie chart
     counts = df['label'].value_counts()
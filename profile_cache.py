@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# SQLite-backed cache for detailed profile lookups
+# -----------------------------
+
+DEFAULT_CACHE_PATH = "profile_cache.sqlite3"
+
+# Fields kept for every cached profile; enough for tryyy.py and case1.py
+PROFILE_FIELDS = (
+    'username',
+    'userid',
+    'full_name',
+    'is_private',
+    'is_verified',
+    'biography',
+    'mediacount',
+    'followers',
+    'followees',
+    'external_url',
+)
+
+
+def profile_to_record(profile):
+    """Pull the cached fields out of an instaloader Profile"""
+    record = {field: getattr(profile, field, None) for field in PROFILE_FIELDS}
+    if record['userid'] is not None:
+        record['userid'] = str(record['userid'])
+    return record
+
+
+class ProfileCache:
+    """
+    Username-keyed (and, when known, user-id-keyed) cache of profile details.
+    Entries older than ttl_seconds are treated as missing; once the cache
+    holds more than max_entries rows the oldest are evicted. The database is
+    opened in WAL mode with one connection per thread, so several threads and
+    several processes can read and write the same file at once.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_seconds=7 * 24 * 3600, max_entries=500_000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._puts_since_trim = 0
+        self._trim_lock = threading.Lock()
+        self._create_schema()
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self):
+        conn = self._connect()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS profiles (
+                username   TEXT PRIMARY KEY,
+                userid     TEXT,
+                data       TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_userid ON profiles(userid)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_fetched_at ON profiles(fetched_at)")
+
+    def get(self, username=None, userid=None):
+        """Return the cached record for a username or user id, or None if missing or expired"""
+        if username is None and userid is None:
+            return None
+        oldest = time.time() - self.ttl_seconds
+        conn = self._connect()
+        row = None
+        if userid is not None:
+            row = conn.execute(
+                "SELECT data FROM profiles WHERE userid = ? AND fetched_at >= ? "
+                "ORDER BY fetched_at DESC LIMIT 1",
+                (str(userid), oldest),
+            ).fetchone()
+        if row is None and username is not None:
+            row = conn.execute(
+                "SELECT data FROM profiles WHERE username = ? AND fetched_at >= ?",
+                (username, oldest),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, username, record, userid=None):
+        """Store a record for username, replacing any previous entry"""
+        userid = userid if userid is not None else record.get('userid')
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO profiles (username, userid, data, fetched_at) VALUES (?, ?, ?, ?)",
+            (username, None if userid is None else str(userid), json.dumps(record), time.time()),
+        )
+
+        # Trimming needs a full count, so only do it every so often
+        with self._trim_lock:
+            self._puts_since_trim += 1
+            trim = self._puts_since_trim >= 1000
+            if trim:
+                self._puts_since_trim = 0
+        if trim:
+            self.trim()
+
+    def trim(self):
+        """Drop expired entries, then the oldest ones beyond max_entries"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM profiles WHERE fetched_at < ?", (time.time() - self.ttl_seconds,))
+            (count,) = conn.execute("SELECT COUNT(*) FROM profiles").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM profiles WHERE username IN "
+                    "(SELECT username FROM profiles ORDER BY fetched_at ASC LIMIT ?)",
+                    (excess,),
+                )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"Could not trim profile cache: {str(e)}")
+
+    def __len__(self):
+        (count,) = self._connect().execute("SELECT COUNT(*) FROM profiles").fetchone()
+        return count
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
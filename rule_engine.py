@@ -0,0 +1,332 @@
+import operator
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# Declarative scoring rules compiled into column and record evaluators
+# -----------------------------
+
+COMPARATORS = {
+    'lt': (operator.lt, np.less),
+    'le': (operator.le, np.less_equal),
+    'gt': (operator.gt, np.greater),
+    'ge': (operator.ge, np.greater_equal),
+    'eq': (operator.eq, np.equal),
+    'ne': (operator.ne, np.not_equal),
+    'true': (lambda value, _: bool(value), None),
+    'false': (lambda value, _: not value, None),
+}
+
+ACTIONS = ('add', 'set', 'reduce')
+
+
+class Rule(NamedTuple):
+    """
+    One heuristic: when `feature <comparator> threshold` holds, apply weight.
+
+    action is 'add' (score += weight), 'set' (score = weight) or 'reduce'
+    (score = max(0, score - weight)). Rules sharing a group are exclusive, like
+    an if/elif chain: only the first matching rule of the group applies.
+    `also` holds extra (feature, comparator, threshold) conditions that must
+    all be true as well. reason is the text reported when the rule fires.
+    """
+    feature: str
+    comparator: str
+    threshold: object = None
+    weight: float = 0
+    reason: str = None
+    group: str = None
+    action: str = 'add'
+    also: tuple = ()
+
+
+class Feature(NamedTuple):
+    """A derived input: column(frame) for batches, record(dict) for single lookups"""
+    name: str
+    column: object
+    record: object
+
+
+class RuleResult(NamedTuple):
+    score: float
+    label: object
+    reasons: list
+
+
+def _truthy_column(values):
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    return values.astype(bool).to_numpy()
+
+
+def _condition_column(values, comparator, threshold):
+    if comparator == 'true':
+        return _truthy_column(values)
+    if comparator == 'false':
+        return ~_truthy_column(values)
+    array = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+    with np.errstate(invalid='ignore'):
+        return np.asarray(COMPARATORS[comparator][1](array, threshold), dtype=bool)
+
+
+def _condition_record(value, comparator, threshold):
+    return bool(COMPARATORS[comparator][0](value, threshold))
+
+
+class RuleProfile:
+    """
+    A named, ordered set of rules plus how to turn the summed score into an
+    output value and a label.
+
+    The output value is score / divisor * multiplier, capped at cap (each step
+    optional). bands is a list of (comparator, threshold, label) checked in
+    order against that value; default_label is used when none match.
+    """
+
+    def __init__(self, name, rules, features=(), divisor=None, multiplier=None, cap=None,
+                 bands=(), default_label=None, version=1):
+        for rule in rules:
+            if rule.comparator not in COMPARATORS:
+                raise ValueError(f"Unknown comparator {rule.comparator!r} in profile {name}")
+            if rule.action not in ACTIONS:
+                raise ValueError(f"Unknown action {rule.action!r} in profile {name}")
+            for _, comparator, _ in rule.also:
+                if comparator not in COMPARATORS:
+                    raise ValueError(f"Unknown comparator {comparator!r} in profile {name}")
+        self.name = name
+        self.rules = tuple(rules)
+        self.features = {feature.name: feature for feature in features}
+        self.divisor = divisor
+        self.multiplier = multiplier
+        self.cap = cap
+        self.bands = tuple(bands)
+        self.default_label = default_label
+        self.version = version
+        # Integer weights keep integer scores, exactly like the hand-written rules
+        self.score_dtype = np.int64 if all(float(rule.weight).is_integer() for rule in rules) else np.float64
+
+    @property
+    def key(self):
+        """Identifies the rule set, e.g. for cache keys"""
+        return f"{self.name}:v{self.version}"
+
+    def _finalize(self, score):
+        value = score
+        if self.divisor is not None:
+            value = value / self.divisor
+        if self.multiplier is not None:
+            value = value * self.multiplier
+        if self.cap is not None:
+            value = np.minimum(self.cap, value) if isinstance(value, np.ndarray) else min(self.cap, value)
+        return value
+
+    def label_for(self, value):
+        """Label for a single output value"""
+        for comparator, threshold, label in self.bands:
+            if _condition_record(value, comparator, threshold):
+                return label
+        return self.default_label
+
+    def label_column(self, values):
+        """Labels for an array of output values"""
+        conditions = [_condition_column(values, comparator, threshold) for comparator, threshold, _ in self.bands]
+        labels = np.empty(len(values), dtype=object)
+        labels[:] = self.default_label
+        assigned = np.zeros(len(values), dtype=bool)
+        for condition, (_, _, label) in zip(conditions, self.bands):
+            take = condition & ~assigned
+            labels[take] = label
+            assigned |= take
+        return labels
+
+    # Column path -------------------------------------------------------
+
+    def _column(self, frame, name, cache):
+        if name not in cache:
+            # A column already in frame wins, so callers can precompute features
+            if name in self.features and name not in frame.columns:
+                cache[name] = self.features[name].column(frame)
+            else:
+                cache[name] = frame[name]
+        return cache[name]
+
+    def evaluate(self, frame, reasons=False):
+        """
+        Score every row of frame at once.
+        Returns a DataFrame with score, label and (optionally) reasons columns,
+        indexed like frame.
+        """
+        length = len(frame)
+        cache = {}
+        score = np.zeros(length, dtype=self.score_dtype)
+        claimed = {}
+        fired_reasons = [] if reasons else None
+
+        for rule in self.rules:
+            mask = _condition_column(self._column(frame, rule.feature, cache), rule.comparator, rule.threshold)
+            for feature, comparator, threshold in rule.also:
+                mask = mask & _condition_column(self._column(frame, feature, cache), comparator, threshold)
+            if rule.group is not None:
+                taken = claimed.get(rule.group, np.zeros(length, dtype=bool))
+                mask = mask & ~taken
+                claimed[rule.group] = taken | mask
+
+            if rule.action == 'add':
+                score = score + np.where(mask, rule.weight, 0).astype(self.score_dtype)
+            elif rule.action == 'set':
+                score = np.where(mask, rule.weight, score).astype(self.score_dtype)
+            else:
+                score = np.where(mask, np.maximum(0, score - rule.weight), score).astype(self.score_dtype)
+
+            if reasons and rule.reason:
+                fired_reasons.append((mask, rule.reason))
+
+        value = self._finalize(score)
+        result = pd.DataFrame({'score': value, 'label': self.label_column(value)}, index=frame.index)
+        if reasons:
+            lists = [[] for _ in range(length)]
+            for mask, reason in fired_reasons:
+                for position in np.flatnonzero(mask):
+                    lists[position].append(reason)
+            result['reasons'] = lists
+        return result
+
+    # Bounds with missing inputs ----------------------------------------
+
+    def _additive_groups(self):
+        """
+        Groups whose rules all add and have no set or reduce rule between
+        them, mapped to the index of their last rule. Such a group adds the
+        weight of at most one rule, so bounds() applies it in one step there.
+        """
+        spans = {}
+        for index, rule in enumerate(self.rules):
+            if rule.group is not None:
+                spans.setdefault(rule.group, []).append(index)
+        additive = {}
+        for group, indices in spans.items():
+            span = self.rules[indices[0]:indices[-1] + 1]
+            if all(rule.action == 'add' for rule in span):
+                additive[group] = indices[-1]
+        return additive
+
+    def bounds(self, frame, unknown=()):
+        """
+        Lowest and highest output value each row can still reach when the
+        inputs named in unknown (columns or features) are not known yet.
+        Rules that depend on an unknown input may or may not fire. Returns a
+        DataFrame with low, high, low_label, high_label and decided, which is
+        True when every reachable value gets the same label (bands are
+        assumed to be ordered thresholds, as in every profile here).
+
+        The bounds are exact when unknown inputs only feed one rule or one
+        exclusive group each; inputs shared between rules can leave them
+        wider than what is reachable, never narrower.
+        """
+        unknown = set(unknown)
+        length = len(frame)
+        cache = {}
+        low = np.zeros(length, dtype=self.score_dtype)
+        high = np.zeros(length, dtype=self.score_dtype)
+        claimed_certain, claimed_possible = {}, {}
+        additive = self._additive_groups()
+        # Per additive group: largest and smallest weight that may apply, and
+        # whether some rule of the group fires for sure
+        largest, smallest, sure = {}, {}, {}
+
+        for index, rule in enumerate(self.rules):
+            certain = np.ones(length, dtype=bool)
+            possible = np.ones(length, dtype=bool)
+            for feature, comparator, threshold in ((rule.feature, rule.comparator, rule.threshold),) + tuple(rule.also):
+                if feature in unknown:
+                    certain = np.zeros(length, dtype=bool)
+                else:
+                    condition = _condition_column(self._column(frame, feature, cache), comparator, threshold)
+                    certain = certain & condition
+                    possible = possible & condition
+            if rule.group is not None:
+                # Cannot fire if an earlier rule of the group matches for sure,
+                # and fires for sure only if no earlier rule could have
+                matches = certain
+                certain = certain & ~claimed_possible.get(rule.group, np.zeros(length, dtype=bool))
+                possible = possible & ~claimed_certain.get(rule.group, np.zeros(length, dtype=bool))
+                claimed_certain[rule.group] = claimed_certain.get(rule.group, False) | matches
+                claimed_possible[rule.group] = claimed_possible.get(rule.group, False) | possible
+
+            weight = rule.weight
+            if rule.group in additive:
+                group = rule.group
+                largest[group] = np.where(possible, np.maximum(largest.get(group, -np.inf), weight),
+                                          largest.get(group, -np.inf))
+                smallest[group] = np.where(possible, np.minimum(smallest.get(group, np.inf), weight),
+                                           smallest.get(group, np.inf))
+                sure[group] = claimed_certain[group]
+                if index == additive[group]:
+                    # Adding nothing is only possible when no rule must fire
+                    raise_high = np.where(sure[group], largest[group], np.maximum(largest[group], 0))
+                    raise_low = np.where(sure[group], smallest[group], np.minimum(smallest[group], 0))
+                    high = (high + raise_high).astype(self.score_dtype)
+                    low = (low + raise_low).astype(self.score_dtype)
+            elif rule.action == 'add':
+                raise_low, raise_high = (certain, possible) if weight >= 0 else (possible, certain)
+                low = low + np.where(raise_low, weight, 0).astype(self.score_dtype)
+                high = high + np.where(raise_high, weight, 0).astype(self.score_dtype)
+            elif rule.action == 'set':
+                maybe = possible & ~certain
+                low = np.where(certain, weight, np.where(maybe, np.minimum(low, weight), low)).astype(self.score_dtype)
+                high = np.where(certain, weight, np.where(maybe, np.maximum(high, weight), high)).astype(self.score_dtype)
+            else:
+                low = np.where(possible, np.maximum(0, low - weight), low).astype(self.score_dtype)
+                high = np.where(certain, np.maximum(0, high - weight), high).astype(self.score_dtype)
+
+        low, high = self._finalize(low), self._finalize(high)
+        low_labels, high_labels = self.label_column(low), self.label_column(high)
+        return pd.DataFrame({
+            'low': low,
+            'high': high,
+            'low_label': low_labels,
+            'high_label': high_labels,
+            'decided': low_labels == high_labels,
+        }, index=frame.index)
+
+    # Record path -------------------------------------------------------
+
+    def _value(self, record, name, cache):
+        if name not in cache:
+            if name in self.features and name not in record:
+                cache[name] = self.features[name].record(record)
+            else:
+                cache[name] = record[name]
+        return cache[name]
+
+    def evaluate_record(self, record):
+        """Score a single record (dict or Series) without building a frame"""
+        cache = {}
+        score = 0
+        claimed = set()
+        reasons = []
+
+        for rule in self.rules:
+            if rule.group is not None and rule.group in claimed:
+                continue
+            if not _condition_record(self._value(record, rule.feature, cache), rule.comparator, rule.threshold):
+                continue
+            if not all(_condition_record(self._value(record, feature, cache), comparator, threshold)
+                       for feature, comparator, threshold in rule.also):
+                continue
+            if rule.group is not None:
+                claimed.add(rule.group)
+
+            if rule.action == 'add':
+                score += rule.weight
+            elif rule.action == 'set':
+                score = rule.weight
+            else:
+                score = max(0, score - rule.weight)
+
+            if rule.reason:
+                reasons.append(rule.reason)
+
+        value = self._finalize(score)
+        return RuleResult(value, self.label_for(value), reasons)
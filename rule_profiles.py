@@ -0,0 +1,185 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from rule_engine import Feature, Rule, RuleProfile
+
+# -----------------------------
+# Rule profiles: each app's heuristics and weights
+# -----------------------------
+
+CLASS_LIKELY_REAL = "Likely Real"
+CLASS_SUSPICIOUS = "Suspicious"
+CLASS_LIKELY_FAKE = "Likely Fake"
+# Followers whose missing details could still move them between classes
+CLASS_UNDETERMINED = "Undetermined"
+
+
+def is_blank_text(value):
+    """True if the value is not a string or is only whitespace"""
+    return not isinstance(value, str) or value.strip() == ''
+
+
+def blank_text_column(series):
+    """Column version of is_blank_text"""
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return pd.Series(True, index=series.index)
+    # .str yields NaN for non-string cells, so those count as blank too
+    stripped = series.str.strip()
+    return (stripped.isna() | stripped.eq('')).astype(bool)
+
+
+# tryyy.py: InstagramFakeProfileDetector.detect_fake_profiles
+# Expects follower_ratio, spam_username and suspicious_bio to be computed already
+# (see scoring.prepare_followers_frame and scoring.score_followers).
+TRYYY_MAX_SCORE = 14
+
+TRYYY_PROFILE = RuleProfile(
+    'tryyy',
+    rules=[
+        Rule('follower_ratio', 'lt', 0.01, 3, "Very few followers compared to followees", group='ratio'),
+        Rule('follower_ratio', 'gt', 50, 2, "Extremely high followers compared to followees", group='ratio'),
+        Rule('has_profile_pic', 'false', None, 2, "No profile picture"),
+        Rule('mediacount', 'eq', 0, 3, "No posts", group='posts'),
+        Rule('mediacount', 'lt', 3, 1, "Very few posts", group='posts'),
+        Rule('spam_username', 'true', None, 2, "Suspicious username"),
+        # A blank biography never matches the spam patterns, so at most one
+        # of these fires; the group tells RuleProfile.bounds as much
+        Rule('suspicious_bio', 'true', None, 2, "Suspicious biography", group='bio'),
+        Rule('bio_blank', 'true', None, 1, "No biography", group='bio'),
+        Rule('full_name_blank', 'true', None, 1, "No full name"),
+        # Verified accounts are not fake
+        Rule('is_verified', 'true', None, 0, action='set'),
+        # Very high followers usually not fake
+        Rule('followers', 'gt', 10000, 2, action='reduce', also=(('mediacount', 'gt', 30),)),
+    ],
+    features=[
+        Feature('bio_blank',
+                lambda frame: blank_text_column(frame['biography']),
+                lambda record: is_blank_text(record['biography'])),
+        Feature('full_name_blank',
+                lambda frame: blank_text_column(frame['full_name']),
+                lambda record: is_blank_text(record['full_name'])),
+    ],
+    divisor=TRYYY_MAX_SCORE,
+    multiplier=100,
+    cap=100,
+    bands=[('lt', 30, CLASS_LIKELY_REAL), ('lt', 60, CLASS_SUSPICIOUS)],
+    default_label=CLASS_LIKELY_FAKE,
+)
+
+
+# insta_fake_follower_detection.py: calculate_fake_score
+def _insta_ratio_column(frame):
+    followers = frame['followers'].to_numpy(dtype=float)
+    following = frame['following'].to_numpy(dtype=float)
+    ratio = np.full(len(frame), np.inf)
+    np.divide(following, followers + 1e-6, out=ratio, where=followers != 0)
+    return ratio
+
+
+def _insta_ratio_record(record):
+    if record['followers'] == 0:
+        return float('inf')
+    return record['following'] / (record['followers'] + 1e-6)
+
+
+INSTA_PROFILE = RuleProfile(
+    'insta_fake_follower_detection',
+    rules=[
+        Rule('posts', 'le', 1, 0.3, "Low number of posts"),
+        Rule('following_ratio', 'gt', 2, 0.3, "High following-to-follower ratio"),
+        Rule('has_profile_pic', 'false', None, 0.2, "Missing profile picture"),
+        Rule('bio', 'false', None, 0.2, "Missing bio"),
+    ],
+    features=[Feature('following_ratio', _insta_ratio_column, _insta_ratio_record)],
+    cap=1.0,
+    bands=[('gt', 0.5, 'Fake')],
+    default_label='Real',
+)
+
+
+# try1.py: analyze_follower (Streamlit app)
+def _try1_ratio_column(frame):
+    followers = frame['followers'].to_numpy(dtype=float)
+    following = frame['following'].to_numpy(dtype=float)
+    ratio = np.full(len(frame), np.nan)
+    np.divide(following, followers, out=ratio, where=followers > 0)
+    return ratio
+
+
+def _try1_ratio_record(record):
+    if record['followers'] > 0:
+        return record['following'] / record['followers']
+    return float('nan')
+
+
+TRY1_PROFILE = RuleProfile(
+    'try1',
+    rules=[
+        Rule('posts', 'lt', 3, 30, "Very few posts"),
+        Rule('following_ratio', 'gt', 2, 30, "High following/follower ratio"),
+        Rule('profile_pic', 'false', None, 20, "No profile picture"),
+        Rule('bio', 'false', None, 20, "No bio"),
+    ],
+    features=[Feature('following_ratio', _try1_ratio_column, _try1_ratio_record)],
+    bands=[('ge', 50, "Suspicious/Fake")],
+    default_label="Real",
+)
+
+
+# try.py: FakeProfileDetector.analyze_profile (instagrapi)
+# Works on the indicators dict that analyze_profile builds for each user.
+TRY_PROFILE = RuleProfile(
+    'try',
+    rules=[
+        Rule('is_private', 'true', None, 0.2, "Private account"),
+        Rule('follower_count', 'lt', 100, 0.3, "Fewer than 100 followers"),
+        Rule('following_count', 'gt', 1000, 0.4, "Follows more than 1000 accounts"),
+        Rule('post_count', 'lt', 3, 0.3, "Fewer than 3 posts"),
+        Rule('has_profile_pic', 'false', None, 0.25, "No profile picture"),
+        Rule('username_digits', 'gt', 4, 0.15, "Many digits in username"),
+    ],
+    cap=1.0,
+    bands=[('ge', 0.6, True)],
+    default_label=False,
+)
+
+
+# app.py: FakeProfileDetector.is_suspicious_account (Tk app)
+def _account_age_column(frame):
+    created = pd.to_datetime(frame['creation_date'], format="%Y-%m-%d")
+    return (pd.Timestamp(datetime.now()) - created).dt.days.to_numpy()
+
+
+def _account_age_record(record):
+    creation_date = datetime.strptime(record["creation_date"], "%Y-%m-%d")
+    return (datetime.now() - creation_date).days
+
+
+APP_PROFILE = RuleProfile(
+    'app',
+    rules=[
+        Rule('profile_pic', 'false', None, 1, "No Profile Picture"),
+        Rule('bio', 'false', None, 1, "No Bio"),
+        Rule('links', 'false', None, 0.5, "No Links"),
+        Rule('posts_count', 'lt', 5, 1, "Low Post Count"),
+        Rule('engagement_ratio', 'lt', 0.3, 1, "Low Engagement"),
+        Rule('account_age_days', 'lt', 30, 1, "New Account"),  # Less than a month old
+    ],
+    features=[Feature('account_age_days', _account_age_column, _account_age_record)],
+    bands=[('ge', 2, True)],
+    default_label=False,
+)
+
+# app.py: flags listed on each suspicious account card
+APP_FLAG_PROFILE = RuleProfile(
+    'app_flags',
+    rules=[
+        Rule('profile_pic', 'false', None, 1, "No Profile Picture"),
+        Rule('bio', 'false', None, 1, "No Bio"),
+        Rule('posts_count', 'lt', 10, 1, "Low Post Count"),
+        Rule('engagement_ratio', 'lt', 0.3, 1, "Low Engagement"),
+    ],
+)
@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+
+from rule_profiles import (
+    CLASS_LIKELY_FAKE,
+    CLASS_LIKELY_REAL,
+    CLASS_SUSPICIOUS,
+    CLASS_UNDETERMINED,
+    TRYYY_PROFILE,
+)
+from spam_patterns import BIO_SPAM_MATCHER, NO_MATCH, USERNAME_SPAM_MATCHER
+
+# -----------------------------
+# Column-wise scoring for tryyy.py follower data
+# The rules themselves live in rule_profiles.TRYYY_PROFILE.
+# -----------------------------
+
+
+def prepare_followers_frame(df):
+    """Fill missing values and add the ratio features used by the rules"""
+    df['followers'] = df['followers'].fillna(0).astype(int)
+    df['followees'] = df['followees'].fillna(0).astype(int)
+    df['mediacount'] = df['mediacount'].fillna(0).astype(int)
+    df['biography'] = df['biography'].fillna('')
+    df['external_url'] = df['external_url'].fillna('')
+
+    df['follower_ratio'] = df['followers'] / (df['followees'] + 1)  # Add 1 to avoid division by zero
+    df['content_ratio'] = df['mediacount'] / (df['followers'] + 1)  # Add 1 to avoid division by zero
+    return df
+
+
+def _label_series(labels, index):
+    # Same dtype inference pandas applies to the result of Series.apply
+    return pd.Series(labels, index=index, dtype=object).infer_objects()
+
+
+def score_followers(df, report_patterns=False):
+    """
+    Add spam flags, fake_probability and classification columns in place.
+    With report_patterns=True also add spam_username_pattern and
+    suspicious_bio_pattern holding the index of the pattern that fired.
+    """
+    if report_patterns:
+        df['spam_username_pattern'] = USERNAME_SPAM_MATCHER.which_column(df['username'])
+        df['suspicious_bio_pattern'] = BIO_SPAM_MATCHER.which_column(df['biography'])
+        df['spam_username'] = df['spam_username_pattern'] != NO_MATCH
+        df['suspicious_bio'] = df['suspicious_bio_pattern'] != NO_MATCH
+    else:
+        df['spam_username'] = USERNAME_SPAM_MATCHER.match_column(df['username'])
+        df['suspicious_bio'] = BIO_SPAM_MATCHER.match_column(df['biography'])
+
+    result = TRYYY_PROFILE.evaluate(df)
+    df['fake_probability'] = result['score'].astype(float)
+    df['classification'] = _label_series(result['label'].to_numpy(), df.index)
+    return df
+
+
+def has_spam_username(username):
+    """Check a single username for spam patterns"""
+    return USERNAME_SPAM_MATCHER.matches(username)
+
+
+def has_suspicious_bio(bio):
+    """Check a single biography for spam patterns"""
+    return BIO_SPAM_MATCHER.matches(bio)
+
+
+def calculate_fake_probability(row):
+    """Score a single follower record through the rule profile's record path"""
+    return float(TRYYY_PROFILE.evaluate_record(row).score)
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def score_record(record):
+    """
+    Score one follower dict as it arrives, matching what
+    prepare_followers_frame + score_followers give for the same row.
+    """
+    row = dict(record)
+    for field in ('followers', 'followees', 'mediacount'):
+        row[field] = 0 if _is_missing(row.get(field)) else int(row[field])
+    for field in ('biography', 'external_url'):
+        if _is_missing(row.get(field)):
+            row[field] = ''
+
+    row['follower_ratio'] = row['followers'] / (row['followees'] + 1)
+    row['content_ratio'] = row['mediacount'] / (row['followers'] + 1)
+    row['spam_username'] = has_spam_username(row['username'])
+    row['suspicious_bio'] = has_suspicious_bio(row['biography'])
+    result = TRYYY_PROFILE.evaluate_record(row)
+    row['fake_probability'] = float(result.score)
+    row['classification'] = result.label
+    return row
+
+
+# Inputs that need a detail lookup (Profile.from_username); the follower
+# list itself only gives username, full_name, is_private, has_profile_pic
+# and is_verified
+DETAIL_INPUTS = ('followers', 'followees', 'mediacount', 'biography', 'external_url',
+                 'follower_ratio', 'content_ratio', 'suspicious_bio', 'bio_blank')
+
+
+def score_bounds(df):
+    """
+    Range fake_probability can still take for followers known only by their
+    basic fields. Returns low/high probabilities and labels plus decided,
+    True where the details cannot change the classification.
+    """
+    frame = df[['username', 'full_name', 'has_profile_pic', 'is_verified']].copy()
+    frame['spam_username'] = USERNAME_SPAM_MATCHER.match_column(frame['username'])
+    bounds = TRYYY_PROFILE.bounds(frame, unknown=DETAIL_INPUTS)
+    return pd.DataFrame({
+        'username': df['username'],
+        'fake_probability_low': bounds['low'].astype(float),
+        'fake_probability_high': bounds['high'].astype(float),
+        'classification_low': bounds['low_label'],
+        'classification_high': bounds['high_label'],
+        'decided': bounds['decided'],
+    }, index=df.index)
+
+
+def score_unfetched(df):
+    """
+    Rescore rows whose details were never fetched (details_fetched False,
+    as left by tiered collection) from their basic fields alone: they keep
+    a classification only where score_bounds decides it and are otherwise
+    CLASS_UNDETERMINED, with fake_probability set only where the range is
+    a single value. Their detail columns go back to missing rather than
+    the zeros prepare_followers_frame filled in.
+    """
+    unfetched = ~df['details_fetched'].astype(bool)
+    if not unfetched.any():
+        return df
+    bounds = score_bounds(df[unfetched])
+    exact = bounds['fake_probability_low'] == bounds['fake_probability_high']
+    df.loc[unfetched, 'fake_probability'] = bounds['fake_probability_low'].where(exact)
+    df.loc[unfetched, 'classification'] = bounds['classification_low'].where(bounds['decided'],
+                                                                             CLASS_UNDETERMINED)
+    for column in DETAIL_INPUTS:
+        if column in df:
+            df[column] = df[column].where(~unfetched)
+    return df
+
+
+def detail_priority(bounds):
+    """
+    Positions of undecided followers, most ambiguous first: those whose
+    range spans the most classes, then the widest ranges, then the
+    highest lower bound.
+    """
+    order = [label for _, _, label in TRYYY_PROFILE.bands] + [TRYYY_PROFILE.default_label]
+    rank = {label: i for i, label in enumerate(order)}
+    undecided = np.flatnonzero(~bounds['decided'].to_numpy())
+    low = bounds['fake_probability_low'].to_numpy()[undecided]
+    high = bounds['fake_probability_high'].to_numpy()[undecided]
+    span = (bounds['classification_high'].map(rank).to_numpy()[undecided]
+            - bounds['classification_low'].map(rank).to_numpy()[undecided])
+    return undecided[np.lexsort((-low, low - high, -span))]
+
+
+def classify_profile(probability):
+    """Classify a single probability"""
+    return TRYYY_PROFILE.label_for(probability)
@@ -0,0 +1,140 @@
+import io
+import itertools
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+from scoring import prepare_followers_frame, score_followers
+from snapshot_store import ARROW_EXTENSIONS, PARQUET_EXTENSIONS
+from summary import RunningSummary
+
+# -----------------------------
+# Out-of-core scoring of large follower files on a process pool
+# -----------------------------
+
+DEFAULT_SHARD_BYTES = 64 * 2 ** 20
+DEFAULT_SHARD_ROWS = 500_000
+
+# Bytes examined at a time while looking for safe CSV split points
+_SCAN_BLOCK = 16 * 2 ** 20
+
+# Shard i numbers its rows from i * _ARRIVAL_STRIDE, so ties in the top-k
+# break in file order across shards
+_ARRIVAL_STRIDE = 2 ** 40
+
+_QUOTE = ord('"')
+_NEWLINE = ord('\n')
+
+
+def _csv_row_ends(mapped, start, end, in_quotes):
+    """Offsets just past each newline in mapped[start:end] that ends a CSV row"""
+    block = np.frombuffer(mapped[start:end], dtype=np.uint8)
+    # Quote parity before each byte: newlines inside quoted fields do not end rows
+    parity = np.bitwise_xor.accumulate((block == _QUOTE).astype(np.uint8))
+    parity ^= np.uint8(in_quotes)
+    newlines = np.flatnonzero((block == _NEWLINE) & (parity == 0))
+    return newlines + start + 1, bool(parity[-1]) if len(parity) else in_quotes
+
+
+def plan_csv_shards(path, shard_bytes=DEFAULT_SHARD_BYTES):
+    """
+    Split a CSV into byte ranges of about shard_bytes that start and end on
+    row boundaries (quoted fields may contain newlines). Returns
+    (header_end, [(start, end), ...]).
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        header_end = mapped.find(b'\n') + 1 or size
+        boundaries = [header_end]
+        target = header_end + shard_bytes
+        in_quotes = False
+        for block_start in range(header_end, size, _SCAN_BLOCK):
+            if target >= size:
+                break
+            block_end = min(block_start + _SCAN_BLOCK, size)
+            if block_end <= target:
+                # No split point needed here, only the quote state
+                _, in_quotes = _csv_row_ends(mapped, block_start, block_end, in_quotes)
+                continue
+            row_ends, in_quotes = _csv_row_ends(mapped, block_start, block_end, in_quotes)
+            while target < block_end:
+                position = np.searchsorted(row_ends, target)
+                if position == len(row_ends):
+                    break
+                boundaries.append(int(row_ends[position]))
+                target = boundaries[-1] + shard_bytes
+        if boundaries[-1] < size:
+            boundaries.append(size)
+    return header_end, list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def plan_shards(path, shard_bytes=DEFAULT_SHARD_BYTES, shard_rows=DEFAULT_SHARD_ROWS):
+    """Describe the shards of a CSV, Parquet or Arrow IPC file; each can be read on its own"""
+    lowered = str(path).lower()
+    if lowered.endswith(PARQUET_EXTENSIONS):
+        row_groups = pq.ParquetFile(path).num_row_groups
+        return [('parquet', path, row_group) for row_group in range(row_groups)]
+    if lowered.endswith(ARROW_EXTENSIONS):
+        shards = []
+        with pa.memory_map(str(path), 'r') as source:
+            reader = pa.ipc.open_file(source)
+            for batch_index in range(reader.num_record_batches):
+                rows = reader.get_batch(batch_index).num_rows
+                for offset in range(0, rows, shard_rows):
+                    shards.append(('ipc', path, batch_index, offset, min(shard_rows, rows - offset)))
+        return shards
+    header_end, ranges = plan_csv_shards(path, shard_bytes)
+    return [('csv', path, header_end, start, end) for start, end in ranges]
+
+
+def read_shard(shard):
+    """Load one shard as a DataFrame straight from the file (memory-mapped where possible)"""
+    kind, path = shard[0], shard[1]
+    if kind == 'parquet':
+        return pq.ParquetFile(path).read_row_group(shard[2]).to_pandas()
+    if kind == 'ipc':
+        _, _, batch_index, offset, length = shard
+        with pa.memory_map(str(path), 'r') as source:
+            batch = pa.ipc.open_file(source).get_batch(batch_index).slice(offset, length)
+            return pa.Table.from_batches([batch]).to_pandas()
+    _, _, header_end, start, end = shard
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return pd.read_csv(io.BytesIO(mapped[:header_end] + mapped[start:end]))
+
+
+def score_shard(shard_index, shard, top_k=5):
+    """Score one shard in a worker process and return only its RunningSummary"""
+    df = read_shard(shard)
+    prepare_followers_frame(df)
+    score_followers(df)
+    summary = RunningSummary(top_k)
+    summary.add_frame(df, first_arrival=shard_index * _ARRIVAL_STRIDE)
+    return summary
+
+
+def score_file_sharded(path, processes=None, top_k=5, shard_bytes=DEFAULT_SHARD_BYTES,
+                       shard_rows=DEFAULT_SHARD_ROWS):
+    """
+    Score a follower file without loading it whole: shards are scored on a
+    process pool and their counts and top-k merged into one RunningSummary.
+    Workers read their shard from the file themselves (memory-mapped, so
+    the OS page cache is shared), and only shard descriptions go out and
+    small summaries come back. Memory per worker is bounded by the shard size.
+    """
+    shards = plan_shards(path, shard_bytes, shard_rows)
+    merged = RunningSummary(top_k)
+    if not shards:
+        return merged
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for part in pool.map(score_shard, range(len(shards)), shards, itertools.repeat(top_k)):
+            merged.merge(part)
+    return merged
@@ -0,0 +1,120 @@
+import logging
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+HAVE_PYARROW = pa is not None
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# Typed columnar snapshots (Parquet / Arrow IPC) for follower data
+# -----------------------------
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+SNAPSHOT_EXTENSIONS = PARQUET_EXTENSIONS + ARROW_EXTENSIONS
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Snapshot files need pyarrow: pip install pyarrow")
+
+
+def raw_schema():
+    """Column types of the raw data written by collect_followers_data"""
+    _require_pyarrow()
+    return pa.schema([
+        ('username', pa.string()),
+        ('full_name', pa.string()),
+        ('is_private', pa.bool_()),
+        ('has_profile_pic', pa.bool_()),
+        ('is_verified', pa.bool_()),
+        ('biography', pa.string()),
+        ('mediacount', pa.int64()),
+        ('followers', pa.int64()),
+        ('followees', pa.int64()),
+        ('external_url', pa.string()),
+    ])
+
+
+def is_snapshot_path(path):
+    return str(path).lower().endswith(SNAPSHOT_EXTENSIONS)
+
+
+def _snapshot_format(path):
+    if str(path).lower().endswith(ARROW_EXTENSIONS):
+        return 'ipc'
+    return 'parquet'
+
+
+def _to_table(data, schema=None):
+    if isinstance(data, pd.DataFrame):
+        frame = data
+    else:
+        frame = pd.DataFrame(list(data))
+    if schema is not None:
+        # Keep known columns typed; anything extra (e.g. scores) is inferred
+        known = [field for field in schema if field.name in frame.columns]
+        extra = [name for name in frame.columns if name not in schema.names]
+        inferred = pa.Schema.from_pandas(frame[extra], preserve_index=False) if extra else pa.schema([])
+        schema = pa.schema(known + list(inferred))
+        return pa.Table.from_pandas(frame[schema.names], schema=schema, preserve_index=False)
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def write_snapshot(data, path, schema=None):
+    """
+    Write a DataFrame (or list of records) as a typed snapshot.
+    The format follows the extension: .parquet for Parquet, .arrow/.feather
+    for uncompressed Arrow IPC, which can be memory-mapped on load.
+    """
+    _require_pyarrow()
+    table = _to_table(data, schema)
+    tmp_path = f"{path}.tmp"
+    if _snapshot_format(path) == 'ipc':
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    else:
+        pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _as_expression(filters):
+    if filters is None or isinstance(filters, ds.Expression):
+        return filters
+    # DNF tuples, as accepted by pyarrow.parquet: [('followers', '>', 1000), ...]
+    return pq.filters_to_expression(filters)
+
+
+def read_snapshot_table(path, columns=None, filters=None):
+    """
+    Load a snapshot as an Arrow table, reading only the requested columns and
+    rows that pass filters. Arrow IPC files are memory-mapped, so untouched
+    columns are never read from disk.
+    """
+    _require_pyarrow()
+    if _snapshot_format(path) == 'ipc':
+        with pa.memory_map(str(path), 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        expression = _as_expression(filters)
+        return table.filter(expression) if expression is not None else table
+
+    dataset = ds.dataset(str(path), format='parquet')
+    return dataset.to_table(columns=columns, filter=_as_expression(filters))
+
+
+def read_snapshot(path, columns=None, filters=None):
+    """Load a snapshot straight into a typed DataFrame"""
+    return read_snapshot_table(path, columns=columns, filters=filters).to_pandas()
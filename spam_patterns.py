@@ -0,0 +1,86 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# Precompiled spam pattern matching for usernames and biographies
+# -----------------------------
+
+SPAM_USERNAME_PATTERNS = [
+    r'\d{4,}',  # 4+ consecutive numbers
+    r'follow|flw|f4f|l4l|like4like|spam|_bot|\.bot|bot_',  # Follow/like related patterns
+    r'^[a-z]{1,2}\d{4,}',  # Short character prefix with numbers
+]
+
+SPAM_BIO_PATTERNS = [
+    r'follow for follow',
+    r'follow back',
+    r'f4f',
+    r'l4l',
+    r'dm for promo',
+]
+
+NO_MATCH = -1
+
+
+def _is_text_column(series):
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+class PatternMatcher:
+    """
+    A family of regex patterns compiled once into a single alternation.
+    Each pattern becomes a named group, so one scan of the text both answers
+    "does anything match" and tells which pattern fired.
+    """
+
+    def __init__(self, patterns, flags=re.IGNORECASE):
+        self.patterns = list(patterns)
+        self.flags = flags
+        self._group_names = [f"p{i}" for i in range(len(self.patterns))]
+        combined = '|'.join(
+            f"(?P<{name}>{pattern})" for name, pattern in zip(self._group_names, self.patterns)
+        )
+        self.regex = re.compile(combined, flags)
+        # Same alternation without capture groups for plain yes/no scans
+        self._any_regex = re.compile('|'.join(f"(?:{pattern})" for pattern in self.patterns), flags)
+
+    def matches(self, text):
+        """True if any pattern matches; non-string values never match"""
+        if not isinstance(text, str):
+            return False
+        return self._any_regex.search(text) is not None
+
+    def which(self, text):
+        """Index of the pattern that matched earliest in the text, or NO_MATCH"""
+        if not isinstance(text, str):
+            return NO_MATCH
+        match = self.regex.search(text)
+        if match is None:
+            return NO_MATCH
+        return int(match.lastgroup[1:])
+
+    def match_column(self, series):
+        """Boolean column: True where any pattern matches"""
+        if not _is_text_column(series):
+            return pd.Series(False, index=series.index)
+        return series.str.contains(self._any_regex, regex=True, na=False).astype(bool)
+
+    def which_column(self, series):
+        """Integer column with the index of the pattern that fired, NO_MATCH elsewhere"""
+        if not _is_text_column(series) or len(series) == 0:
+            return pd.Series(NO_MATCH, index=series.index, dtype=np.int16)
+        groups = series.str.extract(self.regex, expand=True)
+        fired = groups.notna().to_numpy()
+        result = np.where(fired.any(axis=1), fired.argmax(axis=1), NO_MATCH)
+        return pd.Series(result.astype(np.int16), index=series.index)
+
+    def pattern_names(self, indexes):
+        """Map pattern indexes (e.g. from which_column) back to pattern strings"""
+        lookup = dict(enumerate(self.patterns))
+        return pd.Series(indexes).map(lookup)
+
+
+USERNAME_SPAM_MATCHER = PatternMatcher(SPAM_USERNAME_PATTERNS)
+BIO_SPAM_MATCHER = PatternMatcher(SPAM_BIO_PATTERNS)
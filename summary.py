@@ -0,0 +1,127 @@
+import heapq
+import math
+
+from scoring import CLASS_LIKELY_FAKE, CLASS_LIKELY_REAL, CLASS_SUSPICIOUS, CLASS_UNDETERMINED
+
+# -----------------------------
+# Running counts and top suspicious followers
+# -----------------------------
+
+
+def class_percentages(total, counts):
+    """Share of each classification in percent"""
+    if total == 0:
+        return {classification: 0.0 for classification in counts}
+    return {classification: (count / total) * 100 for classification, count in counts.items()}
+
+
+def format_summary(total, counts, top):
+    """Render the text report printed by tryyy.py; top is [(username, probability), ...]"""
+    fake_count = counts.get(CLASS_LIKELY_FAKE, 0)
+    suspicious_count = counts.get(CLASS_SUSPICIOUS, 0)
+    real_count = counts.get(CLASS_LIKELY_REAL, 0)
+
+    percentages = class_percentages(total, counts)
+    fake_percent = percentages.get(CLASS_LIKELY_FAKE, 0.0)
+    suspicious_percent = percentages.get(CLASS_SUSPICIOUS, 0.0)
+    real_percent = percentages.get(CLASS_LIKELY_REAL, 0.0)
+
+    summary = f"""
+        FAKE PROFILE DETECTION SUMMARY
+        =============================
+        Total followers analyzed: {total}
+        
+        Likely fake profiles: {fake_count} ({fake_percent:.1f}%)
+        Suspicious profiles: {suspicious_count} ({suspicious_percent:.1f}%)
+        Likely real profiles: {real_count} ({real_percent:.1f}%)
+        """
+
+    # Only tiered collections that ran out of detail requests have these
+    undetermined_count = counts.get(CLASS_UNDETERMINED, 0)
+    if undetermined_count:
+        undetermined_percent = percentages.get(CLASS_UNDETERMINED, 0.0)
+        summary += f"""Undetermined (details not fetched): {undetermined_count} ({undetermined_percent:.1f}%)
+        """
+
+    summary += """
+        Top 5 most suspicious followers:
+        """
+
+    for username, probability in top:
+        summary += f"\n- @{username} (Probability: {probability:.1f}%)"
+
+    return summary
+
+
+class RunningSummary:
+    """
+    Class counts plus the top_k most suspicious followers, updated one scored
+    row (add) or one scored frame (add_frame) at a time in a single pass. Only
+    top_k rows are ever held, so memory does not grow with the number of
+    followers and results never need a full sort to be summarized.
+    """
+
+    def __init__(self, top_k=5):
+        self.top_k = top_k
+        self.total = 0
+        self.counts = {CLASS_LIKELY_FAKE: 0, CLASS_SUSPICIOUS: 0, CLASS_LIKELY_REAL: 0}
+        # Min-heap of (probability, -arrival, username): the root is the first to drop
+        self._heap = []
+        # A plain int (not itertools.count) so summaries pickle across processes
+        self._next_arrival = 0
+
+    def _push(self, entry):
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def add(self, username, probability, classification):
+        self.total += 1
+        self.counts[classification] = self.counts.get(classification, 0) + 1
+        # Undetermined followers have no probability and never rank
+        if not math.isnan(probability):
+            self._push((probability, -self._next_arrival, username))
+        self._next_arrival += 1
+
+    def add_record(self, record):
+        self.add(record['username'], record['fake_probability'], record['classification'])
+
+    def add_frame(self, frame, first_arrival=None):
+        """
+        Add every scored row of frame at once. Row i counts as arriving at
+        first_arrival + i, which decides ties in the top-k; by default the
+        frame arrives after everything added so far, as if added row by row.
+        """
+        if first_arrival is None:
+            first_arrival = self._next_arrival
+        self._next_arrival = max(self._next_arrival, first_arrival + len(frame))
+        self.total += len(frame)
+        for classification, count in frame['classification'].value_counts().items():
+            self.counts[classification] = self.counts.get(classification, 0) + int(count)
+
+        probabilities = frame['fake_probability'].reset_index(drop=True)
+        usernames = frame['username'].to_numpy()
+        for position, probability in probabilities.nlargest(self.top_k, keep='first').items():
+            self._push((float(probability), -(first_arrival + position), usernames[position]))
+
+    def merge(self, other):
+        """Fold another summary (e.g. from a different shard) into this one"""
+        self.total += other.total
+        for classification, count in other.counts.items():
+            self.counts[classification] = self.counts.get(classification, 0) + count
+        for entry in other._heap:
+            self._push(entry)
+        self._next_arrival = max(self._next_arrival, other._next_arrival)
+
+    def percentages(self):
+        return class_percentages(self.total, self.counts)
+
+    def top(self):
+        """Top followers as [(username, probability), ...], most suspicious first"""
+        return [(username, probability) for probability, _, username in sorted(self._heap, reverse=True)]
+
+    def render(self):
+        if self.total == 0:
+            return "No data to summarize"
+        return format_summary(self.total, self.counts, self.top())
@@ -0,0 +1,64 @@
+"""A collection that dies mid-run resumes from its CollectionCheckpoint."""
+from checkpoint import CollectionCheckpoint
+
+
+def follower(username, **details):
+    return {'username': username, 'full_name': username.title(), **details}
+
+
+def crashed_run(directory):
+    """Collect two followers, queue a third, then die without closing"""
+    checkpoint = CollectionCheckpoint('target', directory=str(directory))
+    for name in ('alice', 'bob', 'carol'):
+        checkpoint.mark_queued(follower(name))
+    checkpoint.mark_collected(follower('alice', mediacount=3))
+    checkpoint.mark_collected(follower('bob', mediacount=5))
+    checkpoint.save_iterator_state({'node': 'page-2', 'remaining': 10})
+    # The process is killed halfway through writing the next entry
+    checkpoint._log.write('{"queued": {"username": "da')
+    checkpoint._log.flush()
+    return checkpoint
+
+
+def test_resume_after_crash(tmp_path):
+    crashed_run(tmp_path)
+
+    resumed = CollectionCheckpoint('target', directory=str(tmp_path))
+    assert resumed.is_resuming
+    assert resumed.collected == {'alice', 'bob'}
+    assert list(resumed.queued) == ['carol']
+    assert resumed.seen('carol') and not resumed.seen('dave')
+    assert resumed.load_iterator_state() == {'node': 'page-2', 'remaining': 10}
+    assert [record['mediacount'] for record in resumed.iter_collected_records()] == [3, 5]
+
+
+def test_entries_after_a_partial_line_are_kept(tmp_path):
+    crashed_run(tmp_path)
+
+    resumed = CollectionCheckpoint('target', directory=str(tmp_path))
+    resumed.mark_collected(follower('carol', mediacount=7))
+    resumed.mark_queued(follower('dave'))
+    resumed.close()
+
+    again = CollectionCheckpoint('target', directory=str(tmp_path))
+    assert again.collected == {'alice', 'bob', 'carol'}
+    assert list(again.queued) == ['dave']
+    assert [record['username'] for record in again.iter_collected_records()] == ['alice', 'bob', 'carol']
+
+
+def test_unreadable_iterator_state_restarts_the_list(tmp_path):
+    checkpoint = crashed_run(tmp_path)
+    with open(checkpoint.iterator_path, 'w', encoding='utf-8') as f:
+        f.write('{"node": ')
+
+    assert CollectionCheckpoint('target', directory=str(tmp_path)).load_iterator_state() is None
+
+
+def test_clear_removes_the_checkpoint(tmp_path):
+    checkpoint = crashed_run(tmp_path)
+    checkpoint.clear()
+
+    fresh = CollectionCheckpoint('target', directory=str(tmp_path))
+    assert not fresh.is_resuming
+    assert list(fresh.iter_collected_records()) == []
+    assert fresh.load_iterator_state() is None
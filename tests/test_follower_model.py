@@ -0,0 +1,74 @@
+"""ScoredFollowers keeps one scored row per username and rescores only what changes."""
+import pandas as pd
+
+import follower_model
+from follower_model import STATUS_GENUINE, STATUS_SUSPICIOUS, ScoredFollowers, score_batch
+
+NOW = pd.Timestamp('2026-06-01')
+
+
+def account(username, **changes):
+    record = {"username": username, "profile_pic": True, "bio": True, "links": True,
+              "posts_count": 120, "creation_date": "2020-05-15", "engagement_ratio": 0.8}
+    record.update(changes)
+    return record
+
+
+def make_model(count=20):
+    return ScoredFollowers([account(f"user{i}") for i in range(count)], now=NOW)
+
+
+def spy_on_scoring(model, monkeypatch):
+    scored = []
+
+    def score(records, now):
+        frame = score_batch(records, now)
+        scored.extend(frame['username'])
+        return frame
+
+    monkeypatch.setattr(follower_model, 'score_batch', score)
+    return scored
+
+
+def test_update_rescores_only_changed_and_new_rows(monkeypatch):
+    model = make_model()
+    before = model.frame.copy()
+    scored = spy_on_scoring(model, monkeypatch)
+
+    records = [account(f"user{i}") for i in range(20)]
+    records[3] = account("user3", profile_pic=False, bio=False)
+    records.append(account("newcomer", posts_count=1, engagement_ratio=0.1))
+
+    assert model.update(records) == 2
+    assert sorted(scored) == ["newcomer", "user3"]
+    assert len(model) == 21
+
+    after = model.frame
+    assert after.loc[3, 'status'] == STATUS_SUSPICIOUS
+    assert after.loc[3, 'flags'] == ["No Profile Picture", "No Bio"]
+    assert after.loc[20, 'status'] == STATUS_SUSPICIOUS
+    unchanged = [i for i in range(20) if i != 3]
+    pd.testing.assert_frame_equal(after.loc[unchanged], before.loc[unchanged], check_dtype=False)
+
+
+def test_update_with_unchanged_data_rescores_nothing(monkeypatch):
+    model = make_model()
+    scored = spy_on_scoring(model, monkeypatch)
+    assert model.update([account(f"user{i}") for i in range(20)]) == 0
+    assert scored == []
+
+
+def test_duplicate_usernames_keep_one_row_with_the_latest_data():
+    model = ScoredFollowers(now=NOW)
+    model.extend([
+        score_batch([account("a"), account("b"), account("a", profile_pic=False, bio=False)], NOW),
+        score_batch([account("b", posts_count=1, engagement_ratio=0.1)], NOW),
+    ])
+    assert len(model) == 2
+    assert model.frame['username'].tolist() == ["a", "b"]
+    assert model.frame['status'].tolist() == [STATUS_SUSPICIOUS, STATUS_SUSPICIOUS]
+    assert model.counts() == (0, 2)
+
+    # An update reaches the single row of a duplicated follower
+    assert model.update([account("a")]) == 1
+    assert model.frame['status'].tolist() == [STATUS_GENUINE, STATUS_SUSPICIOUS]
@@ -0,0 +1,86 @@
+"""ProfileCache expires entries after their TTL and evicts the oldest beyond max_entries."""
+import types
+
+import pytest
+
+import profile_cache
+from profile_cache import ProfileCache
+
+TTL = 100
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = types.SimpleNamespace(value=1_000_000.0)
+    monkeypatch.setattr(profile_cache, 'time', types.SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = ProfileCache(str(tmp_path / 'cache.sqlite3'), ttl_seconds=TTL, max_entries=3)
+    yield cache
+    cache.close()
+
+
+def record(username, userid=None, **details):
+    return {'username': username, 'userid': userid, 'mediacount': 1, **details}
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.put('alice', record('alice', userid='1'))
+    clock.value += TTL
+    assert cache.get(username='alice')['username'] == 'alice'
+    assert cache.get(userid='1')['username'] == 'alice'
+
+    clock.value += 1
+    assert cache.get(username='alice') is None
+    assert cache.get(userid='1') is None
+
+
+def test_put_refreshes_an_entry(cache, clock):
+    cache.put('alice', record('alice'))
+    clock.value += TTL
+    cache.put('alice', record('alice', mediacount=9))
+    clock.value += TTL
+
+    assert cache.get(username='alice')['mediacount'] == 9
+    assert len(cache) == 1
+
+
+def test_userid_lookup_survives_a_username_change(cache, clock):
+    cache.put('old_name', record('old_name', userid='42'))
+    clock.value += 1
+    cache.put('new_name', record('new_name', userid='42'))
+
+    assert cache.get(username='missing', userid='42')['username'] == 'new_name'
+
+
+def test_trim_drops_expired_then_oldest_entries(cache, clock):
+    cache.put('expired', record('expired'))
+    clock.value += TTL
+    for name in ('a', 'b', 'c', 'd'):
+        clock.value += 1
+        cache.put(name, record(name))
+
+    cache.trim()
+
+    # 'expired' is past its TTL, 'a' is the oldest of the four left over max_entries
+    assert len(cache) == 3
+    assert cache.get(username='expired') is None
+    assert cache.get(username='a') is None
+    assert [cache.get(username=name)['username'] for name in ('b', 'c', 'd')] == ['b', 'c', 'd']
+
+
+def test_put_trims_every_thousand_writes(tmp_path, clock):
+    cache = ProfileCache(str(tmp_path / 'cache.sqlite3'), ttl_seconds=TTL, max_entries=10)
+    for i in range(999):
+        clock.value += 0.001
+        cache.put(f'user{i}', record(f'user{i}'))
+    assert len(cache) == 999
+
+    clock.value += 0.001
+    cache.put('user999', record('user999'))
+    assert len(cache) == 10
+    assert cache.get(username='user999') is not None
+    cache.close()
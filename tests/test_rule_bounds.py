@@ -0,0 +1,91 @@
+"""
+RuleProfile.bounds must give exactly the lowest and highest score a row can
+still reach, checked by scoring every completion of the unknown inputs.
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from rule_engine import Rule, RuleProfile
+from scoring import prepare_followers_frame, score_bounds, score_followers
+
+# One value on each side of every threshold the detail rules look at
+BIOGRAPHIES = ['', 'coffee & code', 'follow back']
+MEDIA_COUNTS = [0, 1, 3, 31]
+FOLLOWERS = [0, 50, 20000]
+FOLLOWEES = [0, 10, 100000]
+EXTERNAL_URLS = ['', 'https://example.com']
+
+# Basic fields: everything the follower list gives without a detail lookup
+USERNAMES = ['anna', 'f4f_king99999']
+FULL_NAMES = ['', 'Anna Smith']
+FLAGS = [True, False]
+
+
+def test_score_bounds_match_exhaustive_search():
+    basic = pd.DataFrame(
+        list(itertools.product(USERNAMES, FULL_NAMES, FLAGS, FLAGS, FLAGS)),
+        columns=['username', 'full_name', 'has_profile_pic', 'is_verified', 'is_private'],
+    )
+    details = pd.DataFrame(
+        list(itertools.product(BIOGRAPHIES, MEDIA_COUNTS, FOLLOWERS, FOLLOWEES, EXTERNAL_URLS)),
+        columns=['biography', 'mediacount', 'followers', 'followees', 'external_url'],
+    )
+    # Every follower (a basic-field combination) with every detail completion
+    full = basic.assign(follower=np.arange(len(basic))).merge(details, how='cross')
+    scored = score_followers(prepare_followers_frame(full))
+    reachable = scored.groupby('follower')['fake_probability'].agg(['min', 'max'])
+    labels = scored.groupby('follower')['classification'].nunique()
+
+    bounds = score_bounds(basic)
+    np.testing.assert_allclose(bounds['fake_probability_low'], reachable['min'])
+    np.testing.assert_allclose(bounds['fake_probability_high'], reachable['max'])
+    assert bounds['decided'].tolist() == (labels == 1).tolist()
+
+
+def check_bounds(profile, inputs, exact):
+    rows = pd.DataFrame(list(itertools.product(FLAGS, repeat=len(inputs))), columns=inputs)
+    for size in range(len(inputs) + 1):
+        for unknown in itertools.combinations(inputs, size):
+            known = [column for column in inputs if column not in unknown]
+            bounds = profile.bounds(rows, unknown=unknown)
+            for position, row in rows.iterrows():
+                # Every value of the unknown inputs, with the known ones fixed
+                completions = rows[(rows[known] == row[known]).all(axis=1)]
+                scores = profile.evaluate(completions)['score']
+                low, high = bounds['low'].iloc[position], bounds['high'].iloc[position]
+                if exact:
+                    assert (low, high) == (scores.min(), scores.max()), (unknown, position)
+                else:
+                    assert low <= scores.min() and high >= scores.max(), (unknown, position)
+
+
+def test_bounds_of_exclusive_groups_are_exact():
+    profile = RuleProfile(
+        'groups',
+        rules=[
+            Rule('a', 'true', None, 3, group='first'),
+            Rule('b', 'true', None, 2, group='first'),
+            Rule('c', 'true', None, -1, group='first'),
+            Rule('d', 'true', None, 4),
+            Rule('e', 'true', None, -2, group='second'),
+            Rule('f', 'true', None, 1, group='second'),
+        ],
+    )
+    check_bounds(profile, ['a', 'b', 'c', 'd', 'e', 'f'], exact=True)
+
+
+def test_bounds_with_shared_inputs_are_never_too_narrow():
+    profile = RuleProfile(
+        'shared',
+        rules=[
+            Rule('a', 'true', None, 3, group='first'),
+            Rule('b', 'true', None, 2, group='first'),
+            Rule('a', 'false', None, 1, group='second'),
+            Rule('c', 'true', None, 2, group='second'),
+            Rule('d', 'true', None, 0, action='set'),
+            Rule('b', 'true', None, 1, action='reduce', also=(('c', 'false', None),)),
+        ],
+    )
+    check_bounds(profile, ['a', 'b', 'c', 'd'], exact=False)
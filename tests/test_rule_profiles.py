@@ -0,0 +1,100 @@
+"""
+Every rule profile must score exactly like the original hand-written rules
+(frozen in benchmarks/reference_scoring.py), through both the record and
+the column path.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks import reference_scoring as reference
+from benchmarks.bench_scoring import make_followers
+from benchmarks.suite import make_population, to_app, to_try, to_try1, to_tryyy
+from rule_profiles import APP_FLAG_PROFILE, APP_PROFILE, INSTA_PROFILE, TRY1_PROFILE, TRY_PROFILE
+from scoring import prepare_followers_frame, score_followers, score_record
+
+SEEDS = [0, 1, 2]
+NUM_ROWS = 3000
+
+
+def with_edge_counts(frame, columns, seed):
+    """Put zeros and small counts (ratio edge cases) into some rows"""
+    rng = np.random.default_rng(seed)
+    frame = frame.copy()
+    for column in columns:
+        values = frame[column].to_numpy().copy()
+        edge = rng.random(len(frame)) < 0.2
+        values[edge] = rng.integers(0, 4, edge.sum())
+        frame[column] = values
+    return frame
+
+
+@pytest.fixture(params=SEEDS)
+def population(request):
+    population = make_population(NUM_ROWS, request.param)
+    return with_edge_counts(population, ['followers', 'following', 'posts'], request.param)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_tryyy_matches_original(seed):
+    raw = pd.concat([
+        to_tryyy(make_population(NUM_ROWS, seed), seed),
+        make_followers(NUM_ROWS, seed),
+    ], ignore_index=True)
+    raw = with_edge_counts(raw, ['followers', 'followees', 'mediacount'], seed)
+    raw.loc[raw.sample(frac=0.05, random_state=seed).index, 'biography'] = np.nan
+
+    frame = prepare_followers_frame(raw.copy())
+    expected = frame.copy()
+    expected['spam_username'] = expected['username'].apply(reference.has_spam_username)
+    expected['suspicious_bio'] = expected['biography'].apply(reference.has_suspicious_bio)
+    expected['fake_probability'] = expected.apply(reference.calculate_fake_probability, axis=1)
+    expected['classification'] = expected['fake_probability'].apply(reference.classify_profile)
+
+    scored = score_followers(frame)
+    for column in ('spam_username', 'suspicious_bio', 'fake_probability', 'classification'):
+        assert scored[column].tolist() == expected[column].tolist(), column
+
+    records = [score_record(record) for record in raw.to_dict('records')]
+    assert [r['fake_probability'] for r in records] == expected['fake_probability'].tolist()
+    assert [r['classification'] for r in records] == expected['classification'].tolist()
+
+
+def test_insta_matches_original(population):
+    expected = [reference.calculate_fake_score(row) for row in population.to_dict('records')]
+    assert INSTA_PROFILE.evaluate(population)['score'].tolist() == expected
+    assert [INSTA_PROFILE.evaluate_record(row).score for row in population.to_dict('records')] == expected
+
+
+def test_try1_matches_original(population):
+    frame = to_try1(population)
+    expected = [reference.analyze_follower(row) for row in frame.to_dict('records')]
+    scored = TRY1_PROFILE.evaluate(frame, reasons=True)
+    assert list(zip(scored['label'], scored['score'], scored['reasons'])) == expected
+    records = [TRY1_PROFILE.evaluate_record(row) for row in frame.to_dict('records')]
+    assert [(r.label, r.score, r.reasons) for r in records] == expected
+
+
+def test_try_matches_original(population):
+    frame = to_try(population, 0)
+    expected = [reference.analyze_indicators(row) for row in frame.to_dict('records')]
+    scored = TRY_PROFILE.evaluate(frame)
+    assert list(zip(scored['score'], scored['score'] >= 0.6)) == expected
+    records = [TRY_PROFILE.evaluate_record(row) for row in frame.to_dict('records')]
+    assert [(r.score, r.score >= 0.6) for r in records] == expected
+
+
+def test_app_matches_original(population):
+    frame = to_app(population, 0)
+    # Some accounts younger than a month
+    recent = (pd.Timestamp.now() - pd.to_timedelta(np.arange(len(frame)) % 60, unit='D')).strftime('%Y-%m-%d')
+    frame['creation_date'] = np.where(np.arange(len(frame)) % 3 == 0, recent, frame['creation_date'])
+    records = frame.to_dict('records')
+
+    expected = [reference.is_suspicious_account(row) for row in records]
+    assert APP_PROFILE.evaluate(frame)['label'].tolist() == expected
+    assert [APP_PROFILE.evaluate_record(row).label for row in records] == expected
+
+    expected_flags = [reference.account_flags(row) for row in records]
+    assert APP_FLAG_PROFILE.evaluate(frame, reasons=True)['reasons'].tolist() == expected_flags
+    assert [APP_FLAG_PROFILE.evaluate_record(row).reasons for row in records] == expected_flags
@@ -0,0 +1,61 @@
+"""CSV shards never split a row, even inside quoted multi-line fields."""
+import pandas as pd
+import pytest
+
+import sharded_scoring
+from sharded_scoring import plan_csv_shards, plan_shards, read_shard
+
+
+@pytest.fixture
+def followers_csv(tmp_path):
+    rows = []
+    for i in range(120):
+        if i % 3 == 0:
+            biography = f'line one\nline "two", still {i}\n\nfollow back'
+        elif i % 3 == 1:
+            biography = f'plain bio {i}'
+        else:
+            biography = ''
+        rows.append({'username': f'user{i}', 'full_name': f'User, {i}', 'biography': biography,
+                     'mediacount': i, 'followers': i * 10, 'followees': 5})
+    path = tmp_path / 'followers.csv'
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('shard_bytes', [1, 50, 333, 4096, 10 ** 9])
+@pytest.mark.parametrize('scan_block', [7, 64, 16 * 2 ** 20])
+def test_shards_rebuild_the_file(followers_csv, monkeypatch, shard_bytes, scan_block):
+    # Small scan blocks put block edges inside quoted fields too
+    monkeypatch.setattr(sharded_scoring, '_SCAN_BLOCK', scan_block)
+    expected = pd.read_csv(followers_csv)
+
+    shards = plan_shards(followers_csv, shard_bytes=shard_bytes)
+    parts = [read_shard(shard) for shard in shards]
+
+    # A one-row shard with an empty bio reads that column as float NaN, so compare values only
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), expected, check_dtype=False)
+    if shard_bytes < 50:
+        # Tiny shards end up one row each
+        assert [len(part) for part in parts] == [1] * len(expected)
+
+
+def test_split_points_are_row_boundaries(followers_csv, monkeypatch):
+    monkeypatch.setattr(sharded_scoring, '_SCAN_BLOCK', 64)
+    data = followers_csv.read_bytes()
+
+    header_end, ranges = plan_csv_shards(followers_csv, shard_bytes=200)
+
+    assert data[:header_end] == data.split(b'\n', 1)[0] + b'\n'
+    assert ranges[0][0] == header_end and ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        # An even number of quotes before the split: not inside a quoted field
+        assert data[end - 1:end] == b'\n' and data[:end].count(b'"') % 2 == 0
+
+
+def test_header_only_file_has_no_shards(tmp_path):
+    path = tmp_path / 'empty.csv'
+    path.write_text('username,biography\n')
+
+    assert plan_csv_shards(path, shard_bytes=10) == (len('username,biography\n'), [])
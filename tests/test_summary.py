@@ -0,0 +1,98 @@
+"""Every way of building a RunningSummary breaks top-k ties in file order."""
+import pandas as pd
+import pytest
+
+from scoring import prepare_followers_frame, score_followers
+from sharded_scoring import score_file_sharded
+from summary import RunningSummary
+
+TOP_K = 5
+
+# Only a handful of distinct profiles, so most probabilities tie
+TEMPLATES = [
+    {'full_name': '', 'is_private': False, 'has_profile_pic': False, 'is_verified': False,
+     'biography': 'follow back', 'mediacount': 0, 'followers': 1, 'followees': 900,
+     'external_url': ''},
+    {'full_name': 'Ann', 'is_private': False, 'has_profile_pic': True, 'is_verified': False,
+     'biography': '', 'mediacount': 2, 'followers': 40, 'followees': 300, 'external_url': ''},
+    {'full_name': 'Bo', 'is_private': True, 'has_profile_pic': True, 'is_verified': False,
+     'biography': 'hi', 'mediacount': 50, 'followers': 300, 'followees': 200,
+     'external_url': 'https://example.com'},
+]
+
+
+@pytest.fixture
+def followers():
+    rows = [{'username': f'user{i}', **TEMPLATES[i % 3 if i % 7 else 0]} for i in range(300)]
+    return pd.DataFrame(rows)
+
+
+def scored(frame):
+    frame = frame.copy()
+    prepare_followers_frame(frame)
+    score_followers(frame)
+    return frame
+
+
+def expected_top(frame):
+    # A stable sort keeps file order among equal probabilities
+    ranked = frame.sort_values('fake_probability', ascending=False, kind='stable')
+    return list(zip(ranked['username'][:TOP_K], ranked['fake_probability'][:TOP_K]))
+
+
+def per_record(frame):
+    summary = RunningSummary(TOP_K)
+    for record in frame.to_dict('records'):
+        summary.add_record(record)
+    return summary
+
+
+def per_frame(frame):
+    summary = RunningSummary(TOP_K)
+    summary.add_frame(frame)
+    return summary
+
+
+def chunked_and_mixed(frame):
+    summary = RunningSummary(TOP_K)
+    for start in range(0, len(frame), 40):
+        chunk = frame.iloc[start:start + 40]
+        if start % 80:
+            summary.add_frame(chunk)
+        else:
+            for record in chunk.to_dict('records'):
+                summary.add_record(record)
+    return summary
+
+
+def merged(frame):
+    summary = RunningSummary(TOP_K)
+    offset = 0
+    for chunk in (frame.iloc[:90], frame.iloc[90:200], frame.iloc[200:]):
+        part = RunningSummary(TOP_K)
+        part.add_frame(chunk, first_arrival=offset)
+        offset += len(chunk)
+        summary.merge(part)
+    return summary
+
+
+@pytest.mark.parametrize('build', [per_record, per_frame, chunked_and_mixed, merged])
+def test_top_k_ties_follow_file_order(followers, build):
+    frame = scored(followers)
+    summary = build(frame)
+
+    assert frame['fake_probability'].value_counts().max() > TOP_K
+    assert summary.top() == expected_top(frame)
+    assert summary.total == len(frame)
+    assert summary.counts == per_record(frame).counts
+
+
+def test_sharded_summary_matches_in_memory(followers, tmp_path):
+    path = tmp_path / 'followers.csv'
+    followers.to_csv(path, index=False)
+
+    summary = score_file_sharded(path, processes=2, top_k=TOP_K, shard_bytes=2048)
+
+    frame = scored(pd.read_csv(path))
+    assert summary.top() == expected_top(frame)
+    assert summary.counts == per_record(frame).counts
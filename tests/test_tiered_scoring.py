@@ -0,0 +1,111 @@
+"""Followers a capped tiered collection never fetched details for are not scored as if their details were zero."""
+import numpy as np
+import pandas as pd
+
+from enrichment import DETAIL_FIELDS
+from follower_store import FIELDS
+from scoring import (
+    CLASS_LIKELY_FAKE,
+    CLASS_UNDETERMINED,
+    detail_priority,
+    prepare_followers_frame,
+    score_bounds,
+    score_followers,
+    score_unfetched,
+)
+from snapshot_store import raw_schema, read_snapshot, write_snapshot
+from summary import RunningSummary
+
+BUDGET = 15
+
+
+def make_followers(count=200, seed=7):
+    rng = np.random.default_rng(seed)
+    followers = []
+    for i in range(count):
+        followers.append({
+            'username': f'f4f_{i}' if rng.random() < 0.5 else f'person_{i}',
+            'full_name': '' if rng.random() < 0.5 else 'Some Name',
+            'is_private': bool(rng.random() < 0.3),
+            'has_profile_pic': bool(rng.random() < 0.4),
+            'is_verified': bool(rng.random() < 0.1),
+            'biography': '' if rng.random() < 0.5 else 'follow back',
+            'mediacount': int(rng.integers(0, 40)),
+            'followers': int(rng.integers(0, 20000)),
+            'followees': int(rng.integers(0, 3000)),
+            'external_url': '',
+        })
+    return followers
+
+
+def collect_tiered(followers, budget):
+    """What collect_followers_tiered leaves in followers_data, without the requests"""
+    basic = [{field: record[field] for field in FIELDS if field not in DETAIL_FIELDS} for record in followers]
+    bounds = score_bounds(pd.DataFrame(basic))
+    fetched = set(detail_priority(bounds)[:budget])
+    records = [followers[i] if i in fetched else {**basic[i], **dict.fromkeys(DETAIL_FIELDS)}
+               for i in range(len(basic))]
+    frame = pd.DataFrame(records, columns=list(FIELDS))
+    frame['details_fetched'] = [i in fetched for i in range(len(basic))]
+    return frame, bounds
+
+
+def detect(frame):
+    """The scoring steps of detect_fake_profiles"""
+    df = frame.copy()
+    prepare_followers_frame(df)
+    score_followers(df)
+    if 'details_fetched' in df:
+        score_unfetched(df)
+    return df
+
+
+def test_unfetched_followers_are_only_labelled_as_far_as_bounds_allow():
+    followers = make_followers()
+    frame, bounds = collect_tiered(followers, BUDGET)
+    results = detect(frame)
+    unfetched = ~results['details_fetched']
+
+    assert results['details_fetched'].sum() == BUDGET
+    fake = unfetched & (results['classification'] == CLASS_LIKELY_FAKE)
+    assert (bounds.loc[fake, 'classification_low'] == CLASS_LIKELY_FAKE).all()
+    # Scoring the zero-filled details would have called some of them fake
+    assert (detect(frame.drop(columns='details_fetched'))['classification'][unfetched] == CLASS_LIKELY_FAKE).any()
+
+    undecided = unfetched & ~bounds['decided']
+    assert (results.loc[undecided, 'classification'] == CLASS_UNDETERMINED).all()
+    assert results.loc[undecided, 'fake_probability'].isna().all()
+    assert results.loc[unfetched, list(DETAIL_FIELDS)].isna().all().all()
+
+    verified = unfetched & bounds['decided']
+    assert verified.any()
+    assert (results.loc[verified, 'fake_probability'] == 0).all()
+
+
+def test_fetched_followers_score_as_in_a_full_collection():
+    followers = make_followers()
+    frame, _ = collect_tiered(followers, BUDGET)
+    results = detect(frame)
+    full = detect(pd.DataFrame(followers, columns=list(FIELDS)))
+
+    fetched = results['details_fetched']
+    pd.testing.assert_series_equal(results.loc[fetched, 'fake_probability'], full.loc[fetched, 'fake_probability'])
+    pd.testing.assert_series_equal(results.loc[fetched, 'classification'], full.loc[fetched, 'classification'])
+
+
+def test_summary_and_snapshot_keep_undetermined_followers_apart(tmp_path):
+    frame, _ = collect_tiered(make_followers(), BUDGET)
+    results = detect(frame)
+
+    summary = RunningSummary()
+    summary.add_frame(results)
+    undetermined = set(results.loc[results['classification'] == CLASS_UNDETERMINED, 'username'])
+    assert summary.counts[CLASS_UNDETERMINED] == len(undetermined)
+    assert not undetermined & {username for username, _ in summary.top()}
+    assert "Undetermined (details not fetched)" in summary.render()
+
+    # Raw tiered data saves with the missing details as nulls
+    path = tmp_path / 'raw.parquet'
+    write_snapshot(frame, path, schema=raw_schema())
+    loaded = read_snapshot(path)
+    assert loaded.loc[~loaded['details_fetched'], 'followers'].isna().all()
@@ -1,12 +1,41 @@
 import requests
 from instagrapi import Client
+from instagrapi.exceptions import (
+    ClientConnectionError,
+    ClientRequestTimeout,
+    ClientThrottledError,
+    PleaseWaitFewMinutes,
+)
 import pandas as pd
 
+from checkpoint import CollectionCheckpoint
+from enrichment import call_with_retries, iter_concurrent
+from rule_profiles import TRY_PROFILE
+
+# Errors worth retrying: rate limits and network trouble, not e.g. missing users
+TRANSIENT_ERRORS = (
+    ClientConnectionError,
+    ClientRequestTimeout,
+    ClientThrottledError,
+    PleaseWaitFewMinutes,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
 class FakeProfileDetector:
     def __init__(self):
         self.cl = Client()
         self.fake_indicator_threshold = 0.6
         
+        # user_info lookups: concurrent calls, retries per follower, failures
+        self.max_workers = 8
+        self.max_attempts = 4
+        self.retry_base_delay = 2.0
+        self.failed_ids = []
+        
+        # Followers are listed in pages of roughly this many accounts
+        self.page_size = 200
+        
     def login(self, username, password):
         try:
             self.cl.login(username, password)
@@ -20,12 +49,41 @@ class FakeProfileDetector:
         followers = self.cl.user_followers(user_id)
         return followers
 
-    def analyze_profile(self, user):
-        # Calculate fake probability based on multiple factors
-        fake_score = 0
-        indicators = {}
+    def iter_follower_pages(self, user_id=None, page_size=None, checkpoint=None):
+        # Yield followers a page (list of UserShort) at a time; with a
+        # checkpoint, the cursor is saved after each page so a run can resume
+        user_id = user_id or self.cl.user_id
+        state = checkpoint.load_iterator_state() if checkpoint is not None else None
+        if state and state.get('done'):
+            return
+        max_id = state['max_id'] if state else ""
         
-        # Check profile characteristics
+        while True:
+            page, max_id = call_with_retries(self.cl.user_followers_v1_chunk, user_id, page_size or self.page_size,
+                                             max_id, attempts=self.max_attempts,
+                                             base_delay=self.retry_base_delay, retry_on=TRANSIENT_ERRORS)
+            yield page
+            max_id = max_id or ""
+            if checkpoint is not None:
+                checkpoint.save_iterator_state({'max_id': max_id, 'done': not max_id})
+            if not max_id:
+                break
+
+    def iter_followers(self, checkpoint, page_size=None):
+        # Followers not analyzed yet: unfinished ones from an earlier run
+        # first, then new pages as they arrive
+        yield from list(checkpoint.queued.values())
+        for page in self.iter_follower_pages(page_size=page_size, checkpoint=checkpoint):
+            for user in page:
+                if checkpoint.seen(user.username):
+                    continue
+                follower = {'username': user.username, 'pk': user.pk}
+                checkpoint.mark_queued(follower)
+                yield follower
+
+    def profile_indicators(self, user):
+        # Profile characteristics the fake-score rules look at
+        indicators = {}
         indicators['is_private'] = user.is_private
         indicators['follower_count'] = user.follower_count
         indicators['following_count'] = user.following_count
@@ -33,46 +91,74 @@ class FakeProfileDetector:
         indicators['has_profile_pic'] = bool(user.profile_pic_url)
         indicators['username_digits'] = sum(c.isdigit() for c in user.username)
         indicators['fullname_length'] = len(user.full_name) if user.full_name else 0
-        
-        # Calculate fake score
-        if indicators['is_private']:
-            fake_score += 0.2
-            
-        if indicators['follower_count'] < 100:
-            fake_score += 0.3
-            
-        if indicators['following_count'] > 1000:
-            fake_score += 0.4
-            
-        if indicators['post_count'] < 3:
-            fake_score += 0.3
-            
-        if not indicators['has_profile_pic']:
-            fake_score += 0.25
-            
-        if indicators['username_digits'] > 4:
-            fake_score += 0.15
+        return indicators
+
+    def analyze_profile(self, user):
+        # Calculate fake probability based on multiple factors
+        # (rules and weights live in rule_profiles.TRY_PROFILE)
+        indicators = self.profile_indicators(user)
+        result = TRY_PROFILE.evaluate_record(indicators)
             
         return {
             'username': user.username,
-            'fake_score': min(fake_score, 1.0),
-            'is_fake': fake_score >= self.fake_indicator_threshold,
+            'fake_score': result.score,
+            'is_fake': result.score >= self.fake_indicator_threshold,
             'indicators': indicators
         }
 
-    def analyze_followers(self):
-        followers = self.get_followers()
-        results = []
+    def score_indicators(self, usernames, indicators):
+        # Score many followers at once through the batch rule evaluator
+        if not indicators:
+            return pd.DataFrame(columns=['username', 'fake_score', 'is_fake', 'indicators'])
+        scored = TRY_PROFILE.evaluate(pd.DataFrame(indicators))
+        return pd.DataFrame({
+            'username': usernames,
+            'fake_score': scored['score'].to_numpy(),
+            'is_fake': scored['score'].to_numpy() >= self.fake_indicator_threshold,
+            'indicators': indicators,
+        })
+
+    def fetch_user_info(self, user_id):
+        # Retry transient errors with exponential backoff and jitter
+        return call_with_retries(self.cl.user_info, user_id, attempts=self.max_attempts,
+                                 base_delay=self.retry_base_delay, retry_on=TRANSIENT_ERRORS)
+
+    def analyze_followers(self, max_workers=None, page_size=None, resume=True):
+        checkpoint = CollectionCheckpoint(f"instagrapi_{self.cl.user_id}")
+        if not resume:
+            checkpoint.clear()
+        
+        # Results of an interrupted run come back from the checkpoint
+        usernames = []
+        indicators = []
+        for record in checkpoint.iter_collected_records():
+            usernames.append(record['username'])
+            indicators.append(record['indicators'])
+        self.failed_ids = []
+        
+        # Follower pages are fetched as analysis needs them, and at most
+        # max_workers user_info calls run at once
+        completed = iter_concurrent(lambda follower: self.fetch_user_info(follower['pk']),
+                                    self.iter_followers(checkpoint, page_size),
+                                    workers=max_workers or self.max_workers)
+        try:
+            for follower, user, error in completed:
+                if error is not None:
+                    print(f"Error analyzing {follower['pk']}: {error}")
+                    self.failed_ids.append(follower['pk'])
+                    continue
+                usernames.append(follower['username'])
+                indicators.append(self.profile_indicators(user))
+                checkpoint.mark_collected({'username': follower['username'], 'indicators': indicators[-1]})
+        finally:
+            completed.close()
+            checkpoint.close()
         
-        for user_id in followers.keys():
-            try:
-                user = self.cl.user_info(user_id)
-                result = self.analyze_profile(user)
-                results.append(result)
-            except Exception as e:
-                print(f"Error analyzing {user_id}: {e}")
+        if self.failed_ids:
+            print(f"Could not analyze {len(self.failed_ids)} followers: {', '.join(map(str, self.failed_ids))}")
+        checkpoint.clear()
                 
-        return pd.DataFrame(results)
+        return self.score_indicators(usernames, indicators)
 
 if __name__ == "__main__":
     detector = FakeProfileDetector()
@@ -1,5 +1,11 @@
+import hashlib
+import json
+
 import streamlit as st
-import matplotlib.pyplot as plt
+import pandas as pd
+from matplotlib.figure import Figure
+
+from rule_profiles import TRY1_PROFILE
 
 # Dummy followers data
 followers_data = [
@@ -14,22 +20,118 @@ followers_data = [
 ]
 
 def analyze_follower(f):
-    score = 0
-    reasons = []
-    if f["posts"] < 3:
-        score += 30
-        reasons.append("Very few posts")
-    if f["followers"] > 0 and (f["following"] / f["followers"]) > 2:
-        score += 30
-        reasons.append("High following/follower ratio")
-    if not f["profile_pic"]:
-        score += 20
-        reasons.append("No profile picture")
-    if not f["bio"]:
-        score += 20
-        reasons.append("No bio")
-    label = "Suspicious/Fake" if score >= 50 else "Real"
-    return label, score, reasons
+    # Rules and weights live in rule_profiles.TRY1_PROFILE
+    result = TRY1_PROFILE.evaluate_record(f)
+    return result.label, result.score, result.reasons
+
+
+def dataset_key(followers):
+    """Stable hash of the follower records, used to key cached scores"""
+    payload = json.dumps(followers, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+@st.cache_data(show_spinner="Scoring followers...")
+def score_followers(_followers, data_key, rule_key):
+    # _followers is not hashed by Streamlit; data_key and rule_key identify it
+    frame = pd.DataFrame(_followers)
+    scored = TRY1_PROFILE.evaluate(frame, reasons=True)
+    frame["label"] = scored["label"]
+    frame["score"] = scored["score"]
+    frame["reasons"] = scored["reasons"]
+    return frame
+
+
+def build_chart(real_count, fake_count):
+    # A plain Figure, so reruns do not accumulate pyplot figures
+    fig = Figure()
+    ax = fig.add_subplot()
+    ax.pie([real_count, fake_count], labels=["Real", "Suspicious/Fake"], autopct="%1.1f%%", colors=["#4CAF50", "#FF5252"])
+    ax.set_title("Followers Classification")
+    return fig
+
+
+def analyze_followers(followers):
+    """Score followers (cached) and keep results and chart in the session"""
+    data_key = dataset_key(followers)
+    analysis = st.session_state.get("analysis")
+    if analysis is not None and analysis["key"] == (data_key, TRY1_PROFILE.key):
+        return analysis
+
+    results = score_followers(followers, data_key, TRY1_PROFILE.key)
+    real_count = int((results["label"] == "Real").sum())
+    fake_count = int((results["label"] == "Suspicious/Fake").sum())
+    suspicious = results[results["label"] == "Suspicious/Fake"]
+    analysis = {
+        "key": (data_key, TRY1_PROFILE.key),
+        "results": results,
+        "suspicious": suspicious_table(suspicious),
+        "real": real_count,
+        "fake": fake_count,
+        "chart": build_chart(real_count, fake_count),
+    }
+    st.session_state["analysis"] = analysis
+    return analysis
+
+
+PAGE_SIZES = [25, 50, 100, 250]
+SORT_COLUMNS = {"Fake Score": "Fake Score (%)", "Username": "Username"}
+
+
+def suspicious_table(suspicious):
+    """Suspicious accounts as one flat table with reasons joined into a column"""
+    return pd.DataFrame({
+        "Username": "@" + suspicious["username"].astype(str),
+        "Fake Score (%)": suspicious["score"].to_numpy(),
+        "Reasons": [", ".join(reasons) for reasons in suspicious["reasons"]],
+    })
+
+
+def filter_suspicious(table, search="", sort_by="Fake Score", descending=True):
+    """Search and sort the suspicious table server-side"""
+    if search:
+        table = table[table["Username"].str.contains(search, case=False, regex=False)]
+    return table.sort_values(SORT_COLUMNS[sort_by], ascending=not descending, kind="stable")
+
+
+def page_count(rows, page_size):
+    return max(1, -(-rows // page_size))
+
+
+def show_suspicious(table):
+    # One Arrow-backed dataframe per page instead of an element per account
+    search = st.text_input("Search username", key="suspicious_search")
+    col1, col2, col3 = st.columns(3)
+    sort_by = col1.selectbox("Sort by", list(SORT_COLUMNS), key="suspicious_sort")
+    descending = col2.toggle("Descending", value=True, key="suspicious_desc")
+    page_size = col3.selectbox("Rows per page", PAGE_SIZES, key="suspicious_page_size")
+
+    matches = filter_suspicious(table, search, sort_by, descending)
+    pages = page_count(len(matches), page_size)
+    # A narrower search can leave the stored page past the end
+    if st.session_state.get("suspicious_page", 1) > pages:
+        st.session_state["suspicious_page"] = pages
+    page = st.number_input("Page", min_value=1, max_value=pages, step=1, key="suspicious_page")
+
+    start = (page - 1) * page_size
+    st.dataframe(matches.iloc[start:start + page_size], hide_index=True, use_container_width=True)
+    st.caption(f"{len(matches)} matching accounts, page {page} of {pages}")
+
+
+def show_analysis(analysis):
+    results = analysis["results"]
+    # Pie chart
+    st.pyplot(analysis["chart"])
+    st.write(f"**Total Followers Analyzed:** {len(results)}")
+    st.write(f"**Real:** {analysis['real']}")
+    st.write(f"**Suspicious/Fake:** {analysis['fake']}")
+    # Suspicious accounts table
+    st.subheader("Suspicious/Fake Accounts")
+    if not analysis["suspicious"].empty:
+        show_suspicious(analysis["suspicious"])
+    else:
+        st.write("No suspicious accounts detected!")
+
 
 def main():
     st.set_page_config(page_title="Instagram Fake Profile Detector", layout="centered")
@@ -46,32 +148,23 @@ def main():
         if not username or not password:
             st.error("Please enter both username and password.")
             return
-        st.success(f"Logged in as {username} (simulation)")
-        st.write(":point_down: Click below to analyze your followers!")
-        if st.button("Analyze My Followers"):
-            results = []
-            for f in followers_data:
-                label, score, reasons = analyze_follower(f)
-                results.append({**f, "label": label, "score": score, "reasons": reasons})
-            real_count = sum(1 for r in results if r["label"] == "Real")
-            fake_count = sum(1 for r in results if r["label"] == "Suspicious/Fake")
-            # Pie chart
-            fig, ax = plt.subplots()
-            ax.pie([real_count, fake_count], labels=["Real", "Suspicious/Fake"], autopct="%1.1f%%", colors=["#4CAF50", "#FF5252"])
-            ax.set_title("Followers Classification")
-            st.pyplot(fig)
-            st.write(f"**Total Followers Analyzed:** {len(results)}")
-            st.write(f"**Real:** {real_count}")
-            st.write(f"**Suspicious/Fake:** {fake_count}")
-            # Suspicious accounts list
-            st.subheader("Suspicious/Fake Accounts")
-            suspicious = [r for r in results if r["label"] == "Suspicious/Fake"]
-            if suspicious:
-                for r in suspicious:
-                    st.markdown(f"**@{r['username']}** - Fake Score: {r['score']}%  ")
-                    st.write(f"Reasons: {', '.join(r['reasons'])}")
-            else:
-                st.write("No suspicious accounts detected!")
+        # Remember the login across reruns; a new login starts a fresh analysis
+        st.session_state["user"] = username
+        st.session_state.pop("analysis", None)
+
+    user = st.session_state.get("user")
+    if not user:
+        return
+
+    st.success(f"Logged in as {user} (simulation)")
+    st.write(":point_down: Click below to analyze your followers!")
+    if st.button("Analyze My Followers"):
+        analyze_followers(followers_data)
+
+    # Reruns redraw stored results without rescoring
+    analysis = st.session_state.get("analysis")
+    if analysis is not None:
+        show_analysis(analysis)
 
 if __name__ == "__main__":
     main()
@@ -1,21 +1,41 @@
 import instaloader
 import getpass
-import time
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import re
 import logging
 import os
+import threading
 import traceback
 from tqdm import tqdm
 import pickle
-import random
+
+from checkpoint import CollectionCheckpoint
+from enrichment import DETAIL_FIELDS, EMPTY_DETAILS, RequestBudget, iter_concurrent
+from follower_history import DELTA_LEFT, DELTA_NEW, FollowerHistory, diff_followers, merge_delta
+from follower_store import FIELDS, FollowerStore
+from profile_cache import ProfileCache, profile_to_record
+from sharded_scoring import score_file_sharded
+from scoring import (
+    CLASS_LIKELY_FAKE,
+    CLASS_SUSPICIOUS,
+    detail_priority,
+    prepare_followers_frame,
+    score_bounds,
+    score_followers,
+    score_record,
+    score_unfetched,
+)
+from snapshot_store import HAVE_PYARROW, is_snapshot_path, raw_schema, read_snapshot, write_snapshot
+from summary import RunningSummary
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Followers per follower-list request, for iterators that do not report it
+FOLLOWER_PAGE_LENGTH = 50
+
 class InstagramFakeProfileDetector:
     def __init__(self):
         self.L = instaloader.Instaloader(
@@ -28,6 +48,23 @@ class InstagramFakeProfileDetector:
         )
         self.user_profile = None
         self.followers_data = []
+        self.detail_bounds = None
+        
+        # Detail lookups share one request budget across all worker threads
+        self.enrichment_workers = 4
+        self.request_budget = RequestBudget(max_requests=30, window_seconds=60.0)
+        
+        # Detail lookups are checked against the on-disk cache before any network call;
+        # the cache is opened on first lookup, so runs that fetch no details leave no file
+        self._profile_cache = None
+        self._profile_cache_lock = threading.Lock()
+        
+    @property
+    def profile_cache(self):
+        with self._profile_cache_lock:
+            if self._profile_cache is None:
+                self._profile_cache = ProfileCache()
+            return self._profile_cache
         
     def login(self, username=None, password=None):
         """Login to Instagram"""
@@ -126,235 +163,518 @@ class InstagramFakeProfileDetector:
             logger.error(traceback.format_exc())
             return False
     
-    def collect_followers_data(self, max_followers=None):
-        """Collect data about followers"""
+    def _budgeted_pages(self, followers_iterator):
+        """Yield from a follower iterator, taking a request budget slot before each further page loads"""
+        page_length = getattr(followers_iterator, 'page_length', lambda: FOLLOWER_PAGE_LENGTH)()
+        for position, follower in enumerate(followers_iterator):
+            if position and position % page_length == 0:
+                self.request_budget.acquire()
+            yield follower
+    
+    def _iter_basic_followers(self, max_followers=None, checkpoint=None, profile=None, budgeted=False):
+        """
+        Yield the basic info that comes with the follower list itself.
+        With budgeted, every page of the list counts against the shared request budget.
+        """
+        if budgeted:
+            self.request_budget.acquire()  # the first page loads with the iterator
+        followers_iterator = (profile or self.user_profile).get_followers()
+        follower_count = 0
+        
+        if checkpoint is not None:
+            # Pick up where the last run stopped: thaw the follower list position
+            # and re-enrich followers that were queued but never finished
+            state = checkpoint.load_iterator_state()
+            if state is not None:
+                try:
+                    followers_iterator.thaw(instaloader.FrozenNodeIterator(**state))
+                except Exception as e:
+                    logger.warning(f"Could not resume follower list position, rescanning it: {str(e)}")
+            follower_count = len(checkpoint.collected)
+            for follower_data in list(checkpoint.queued.values()):
+                if max_followers and follower_count >= max_followers:
+                    return
+                follower_count += 1
+                yield follower_data
+        
+        for follower in (self._budgeted_pages(followers_iterator) if budgeted else followers_iterator):
+            if max_followers and follower_count >= max_followers:
+                break
+            
+            if checkpoint is not None and checkpoint.seen(follower.username):
+                continue
+            
+            try:
+                # Basic profile info that doesn't require extra API calls
+                follower_data = {
+                    'username': follower.username,
+                    'userid': follower.userid,
+                    'full_name': follower.full_name,
+                    'is_private': follower.is_private,
+                    'has_profile_pic': follower.has_profile_pic,
+                    'is_verified': follower.is_verified,
+                }
+            except Exception as e:
+                logger.warning(f"Error collecting data for {follower.username}: {str(e)}")
+                continue
+            
+            follower_count += 1
+            if checkpoint is not None:
+                checkpoint.mark_queued(follower_data)
+                if follower_count % 25 == 0:
+                    checkpoint.save_iterator_state(followers_iterator.freeze()._asdict())
+            yield follower_data
+        
+        if checkpoint is not None:
+            checkpoint.save_iterator_state(followers_iterator.freeze()._asdict())
+    
+    def _fetch_profile_details(self, username, userid=None):
+        """
+        Fetch detail fields for one follower, from the profile cache when possible.
+        With userid the cache still hits after the follower changes username.
+        """
+        cached = self.profile_cache.get(username=username, userid=userid)
+        if cached is not None:
+            return {field: cached.get(field) for field in DETAIL_FIELDS}
+        
+        self.request_budget.acquire()
+        detailed_profile = instaloader.Profile.from_username(self.L.context, username)
+        record = profile_to_record(detailed_profile)
+        try:
+            self.profile_cache.put(username, record)
+        except Exception as e:
+            logger.warning(f"Could not cache profile {username}: {str(e)}")
+        return {field: record[field] for field in DETAIL_FIELDS}
+    
+    def _enrich_follower(self, follower_data, strict=False):
+        """
+        Add detail fields to a basic follower record (runs on a worker thread).
+        A failed lookup leaves empty details, or raises if strict is set.
+        """
+        follower_data = dict(follower_data)
+        # The user id is only needed for the cache lookup, not in the results
+        userid = follower_data.pop('userid', None)
+        try:
+            # Try to get detailed profile info but handle if it fails
+            follower_data.update(self._fetch_profile_details(follower_data['username'], userid))
+        except Exception as e:
+            if strict:
+                raise
+            # If detailed info fails, use basic info only
+            logger.debug(f"Could not get detailed info for {follower_data['username']}: {str(e)}")
+            follower_data.update(EMPTY_DETAILS)
+        return follower_data
+    
+    def _confirm_follower_count(self, max_followers=None):
+        """Work out how many followers will be collected; None if the user cancels"""
+        followers_count = self.user_profile.followers
+        logger.info(f"Profile has {followers_count} followers")
+        
+        if max_followers and max_followers < followers_count:
+            logger.info(f"Limiting analysis to {max_followers} followers")
+            followers_count = max_followers
+            
+        # Warning for large accounts
+        if followers_count > 500:
+            logger.warning(f"Analyzing {followers_count} followers will take a long time and may trigger Instagram limits")
+            confirm = input("Continue with analysis? (y/n): ")
+            if confirm.lower() != 'y':
+                logger.info("Analysis cancelled")
+                return None
+        
+        return followers_count
+    
+    def _iter_collected_followers(self, pbar, max_followers=None, workers=None, checkpoint=None):
+        """Yield enriched follower records as their detail lookups complete"""
+        # Detail lookups run on a worker pool; the shared request budget,
+        # not per-call sleeps, decides how fast requests go out
+        completed = iter_concurrent(
+            self._enrich_follower,
+            self._iter_basic_followers(max_followers, checkpoint),
+            workers=workers or self.enrichment_workers,
+        )
+        try:
+            for follower_data, enriched, error in completed:
+                if error is not None:
+                    logger.warning(f"Error collecting data for {follower_data['username']}: {str(error)}")
+                    continue
+                
+                if checkpoint is not None:
+                    checkpoint.mark_collected(enriched)
+                pbar.update(1)
+                yield enriched
+        finally:
+            completed.close()
+            if checkpoint is not None:
+                checkpoint.close()
+    
+    def collect_followers_data(self, max_followers=None, workers=None, resume=True):
+        """
+        Collect data about followers.
+        Records are appended to an on-disk checkpoint as they arrive, so an
+        interrupted run picks up where it stopped when resume is True.
+        """
         if not self.user_profile:
             logger.error("No target profile set")
             return False
         
         try:
-            followers_count = self.user_profile.followers
-            logger.info(f"Profile has {followers_count} followers")
-            
-            if max_followers and max_followers < followers_count:
-                logger.info(f"Limiting analysis to {max_followers} followers")
-                followers_count = max_followers
-                
-            # Warning for large accounts
-            if followers_count > 500:
-                logger.warning(f"Analyzing {followers_count} followers will take a long time and may trigger Instagram limits")
-                confirm = input("Continue with analysis? (y/n): ")
-                if confirm.lower() != 'y':
-                    logger.info("Analysis cancelled")
-                    return False
+            followers_count = self._confirm_follower_count(max_followers)
+            if followers_count is None:
+                return False
             
-            self.followers_data = []
+            checkpoint = CollectionCheckpoint(self.user_profile.username)
+            if not resume:
+                checkpoint.clear()
+            self.followers_data = FollowerStore.from_records(checkpoint.iter_collected_records())
             
             # Create progress bar
-            with tqdm(total=followers_count if max_followers is None else min(followers_count, max_followers), 
+            with tqdm(total=followers_count, initial=len(self.followers_data),
                       desc="Collecting follower data") as pbar:
-                
-                followers_iterator = self.user_profile.get_followers()
-                follower_count = 0
-                
-                for follower in followers_iterator:
-                    if max_followers and follower_count >= max_followers:
-                        break
-                    
-                    try:
-                        # Basic profile info that doesn't require extra API calls
-                        follower_data = {
-                            'username': follower.username,
-                            'full_name': follower.full_name,
-                            'is_private': follower.is_private,
-                            'has_profile_pic': follower.has_profile_pic,
-                            'is_verified': follower.is_verified,
-                        }
-                        
-                        # Get additional info - may require extra API calls
-                        try:
-                            # Try to get detailed profile info but handle if it fails
-                            detailed_profile = instaloader.Profile.from_username(self.L.context, follower.username)
-                            follower_data.update({
-                                'biography': detailed_profile.biography,
-                                'mediacount': detailed_profile.mediacount,
-                                'followers': detailed_profile.followers,
-                                'followees': detailed_profile.followees,
-                                'external_url': detailed_profile.external_url,
-                            })
-                        except Exception as e:
-                            # If detailed info fails, use basic info only
-                            logger.debug(f"Could not get detailed info for {follower.username}: {str(e)}")
-                            follower_data.update({
-                                'biography': '',
-                                'mediacount': 0,
-                                'followers': 0,
-                                'followees': 0,
-                                'external_url': '',
-                            })
-                        
-                        self.followers_data.append(follower_data)
-                        follower_count += 1
-                        pbar.update(1)
-                        
-                        # Add random delay to avoid rate limiting
-                        time.sleep(random.uniform(1.0, 3.0))
-                    except Exception as e:
-                        logger.warning(f"Error collecting data for {follower.username}: {str(e)}")
-                        continue
+                for follower_data in self._iter_collected_followers(pbar, max_followers, workers, checkpoint):
+                    self.followers_data.append(follower_data)
             
             logger.info(f"Collected data for {len(self.followers_data)} followers")
+            self._save_raw_data()
             
-            # Save raw data as backup
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            raw_data_file = f"raw_followers_data_{timestamp}.csv"
-            pd.DataFrame(self.followers_data).to_csv(raw_data_file, index=False)
-            logger.info(f"Raw data saved to {raw_data_file}")
+            # Everything is in the CSV now, so the checkpoint is no longer needed
+            checkpoint.clear()
             
             return True
         except instaloader.exceptions.ConnectionException as e:
             logger.error(f"Connection error: {str(e)}")
             logger.info("This might be due to rate limiting or IP blocking")
+            logger.info("Progress was checkpointed; run the collection again to resume")
             return False
         except Exception as e:
             logger.error(f"Error collecting followers data: {str(e)}")
             logger.error(traceback.format_exc())
             return False
     
-    def detect_fake_profiles(self):
-        """Analyze followers data to detect fake profiles"""
-        if not self.followers_data:
-            logger.error("No follower data available for analysis")
-            return None
+    def _save_raw_data(self):
+        """Save raw data as backup (typed Parquet snapshot when pyarrow is available)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if isinstance(self.followers_data, pd.DataFrame):
+            raw_frame = self.followers_data
+        else:
+            raw_frame = self.followers_data.to_frame()
+        if HAVE_PYARROW:
+            raw_data_file = f"raw_followers_data_{timestamp}.parquet"
+            write_snapshot(raw_frame, raw_data_file, schema=raw_schema())
+        else:
+            raw_data_file = f"raw_followers_data_{timestamp}.csv"
+            raw_frame.to_csv(raw_data_file, index=False)
+        logger.info(f"Raw data saved to {raw_data_file}")
+        return raw_data_file
+    
+    def collect_followers_tiered(self, max_followers=None, max_detail_requests=None, workers=None):
+        """
+        Collect followers in two stages to save detail requests.
+        Stage one lists followers with the fields the follower list gives for
+        free and bounds each one's final score. Stage two fetches details only
+        for followers whose classification the missing fields could still
+        change, most ambiguous first, up to max_detail_requests lookups.
+        With the current weights only verified followers are decided in
+        stage one, so the saving comes mostly from max_detail_requests.
+        Followers left without details keep missing detail fields and a
+        details_fetched column; detect_fake_profiles reports the undecided
+        ones as Undetermined. Their score ranges are kept in self.detail_bounds.
+        """
+        if not self.user_profile:
+            logger.error("No target profile set")
+            return False
         
         try:
-            df = pd.DataFrame(self.followers_data)
-            
-            # Replace NaN values with appropriate defaults
-            df['followers'] = df['followers'].fillna(0).astype(int)
-            df['followees'] = df['followees'].fillna(0).astype(int)
-            df['mediacount'] = df['mediacount'].fillna(0).astype(int)
-            df['biography'] = df['biography'].fillna('')
-            df['external_url'] = df['external_url'].fillna('')
-            
-            # Add calculated features
-            df['follower_ratio'] = df['followers'] / (df['followees'] + 1)  # Add 1 to avoid division by zero
-            df['content_ratio'] = df['mediacount'] / (df['followers'] + 1)  # Add 1 to avoid division by zero
-            
-            # Feature: Check for spam patterns in username
-            def has_spam_username(username):
-                # Check for patterns like many numbers, follow/like keywords, etc.
-                spam_patterns = [
-                    r'\d{4,}',  # 4+ consecutive numbers
-                    r'follow|flw|f4f|l4l|like4like|spam|_bot|\.bot|bot_',  # Follow/like related patterns
-                    r'^[a-z]{1,2}\d{4,}',  # Short character prefix with numbers
-                ]
-                for pattern in spam_patterns:
-                    if re.search(pattern, username, re.IGNORECASE):
-                        return True
+            followers_count = self._confirm_follower_count(max_followers)
+            if followers_count is None:
                 return False
             
-            df['spam_username'] = df['username'].apply(has_spam_username)
-            
-            # Feature: Check for suspicious biography
-            def has_suspicious_bio(bio):
-                if not isinstance(bio, str):
-                    return False
-                    
-                spam_bio_patterns = [
-                    r'follow for follow',
-                    r'follow back',
-                    r'f4f',
-                    r'l4l',
-                    r'dm for promo',
-                ]
-                for pattern in spam_bio_patterns:
-                    if re.search(pattern, bio, re.IGNORECASE):
-                        return True
+            # Stage one: basic fields only, no extra requests
+            basic = list(tqdm(self._iter_basic_followers(max_followers), total=followers_count,
+                              desc="Listing followers"))
+            if not basic:
+                logger.warning("No followers found")
                 return False
+            bounds = score_bounds(pd.DataFrame(basic))
             
-            df['suspicious_bio'] = df['biography'].apply(has_suspicious_bio)
+            # Stage two: details where they can still change the outcome
+            to_fetch = detail_priority(bounds)
+            undecided = len(to_fetch)
+            if max_detail_requests is not None:
+                to_fetch = to_fetch[:max_detail_requests]
             
-            # Calculate fake profile probability using these features
-            def calculate_fake_probability(row):
-                score = 0
-                
-                # Extreme follower ratios
-                if row['follower_ratio'] < 0.01:  # Very few followers compared to followees
-                    score += 3
-                elif row['follower_ratio'] > 50:  # Extremely high followers compared to followees
-                    score += 2
-                
-                # No profile picture
-                if not row['has_profile_pic']:
-                    score += 2
-                
-                # No posts or very few posts
-                if row['mediacount'] == 0:
-                    score += 3
-                elif row['mediacount'] < 3:
-                    score += 1
-                
-                # Suspicious username
-                if row['spam_username']:
-                    score += 2
-                
-                # Suspicious biography
-                if row['suspicious_bio']:
-                    score += 2
-                
-                # No biography
-                if not isinstance(row['biography'], str) or row['biography'].strip() == '':
-                    score += 1
-                
-                # No full name
-                if not isinstance(row['full_name'], str) or row['full_name'].strip() == '':
-                    score += 1
-                
-                # Verified accounts are not fake
-                if row['is_verified']:
-                    score = 0
-                
-                # Very high followers usually not fake
-                if row['followers'] > 10000 and row['mediacount'] > 30:
-                    score = max(0, score - 2)
+            enriched = {}
+            with tqdm(total=len(to_fetch), desc="Fetching profile details") as pbar:
+                # Strict: a failed lookup must stay unfetched, not become zeros
+                for follower_data, result, error in iter_concurrent(
+                        lambda follower_data: self._enrich_follower(follower_data, strict=True),
+                        (basic[i] for i in to_fetch),
+                        workers=workers or self.enrichment_workers):
+                    if error is not None:
+                        logger.warning(f"Error collecting data for {follower_data['username']}: {str(error)}")
+                        continue
+                    enriched[follower_data['username']] = result
+                    pbar.update(1)
+            
+            # Kept as a frame: FollowerStore would turn the missing details into zeros
+            records = [enriched.get(follower_data['username'])
+                       or {**follower_data, **dict.fromkeys(DETAIL_FIELDS)} for follower_data in basic]
+            bounds['details_fetched'] = bounds['username'].isin(enriched)
+            self.followers_data = pd.DataFrame(records, columns=list(FIELDS))
+            self.followers_data['details_fetched'] = bounds['details_fetched'].to_numpy()
+            self.detail_bounds = bounds
+            
+            logger.info(f"Collected {len(basic)} followers: {len(basic) - undecided} decided from basic fields, "
+                        f"details fetched for {len(enriched)} of {undecided} undecided")
+            if undecided > len(enriched):
+                logger.warning(f"{undecided - len(enriched)} undecided followers have no details and will be "
+                               f"reported as Undetermined; their possible score ranges are in detail_bounds")
+            self._save_raw_data()
+            return True
+        except instaloader.exceptions.ConnectionException as e:
+            logger.error(f"Connection error: {str(e)}")
+            logger.info("This might be due to rate limiting or IP blocking")
+            return False
+        except Exception as e:
+            logger.error(f"Error collecting followers data: {str(e)}")
+            logger.error(traceback.format_exc())
+            return False
+    
+    def _list_target_followers(self, username, max_followers=None):
+        """
+        Look up one target and list its followers' basic info (runs on a worker thread).
+        The lookup and every page of the list go through the shared request budget,
+        since several targets are listed at once.
+        """
+        self.request_budget.acquire()
+        profile = instaloader.Profile.from_username(self.L.context, username)
+        return list(self._iter_basic_followers(max_followers, profile=profile, budgeted=True))
+    
+    def analyze_targets(self, targets, max_followers=None, workers=None, target_workers=4):
+        """
+        Batch mode for several target accounts with overlapping audiences.
+        Follower lists are fetched for target_workers targets at a time, each
+        distinct follower is enriched and scored once, and the results are
+        split back out per target. Every lookup goes through the shared
+        request budget and profile cache, so cost follows the number of
+        distinct followers rather than the sum over targets.
+        Returns {target: results DataFrame} for the targets that could be listed.
+        """
+        targets = list(dict.fromkeys(t.strip().lstrip('@') for t in targets if t.strip()))
+        followers = {}   # username -> basic record, one per distinct follower
+        members = {}     # target -> usernames of its followers
+        
+        try:
+            listed = iter_concurrent(lambda target: self._list_target_followers(target, max_followers),
+                                     targets, workers=target_workers)
+            for target, basic, error in listed:
+                if error is not None:
+                    logger.error(f"Could not list followers of {target}: {str(error)}")
+                    continue
+                members[target] = [follower_data['username'] for follower_data in basic]
+                for follower_data in basic:
+                    followers.setdefault(follower_data['username'], follower_data)
+                logger.info(f"Listed {len(basic)} followers of {target}")
+            
+            total = sum(len(usernames) for usernames in members.values())
+            logger.info(f"{len(followers)} distinct followers across {len(members)} targets "
+                        f"({total} before deduplication)")
+            if not followers:
+                return {}
+            
+            # Enrich and score each distinct follower once
+            self.followers_data = FollowerStore()
+            with tqdm(total=len(followers), desc="Collecting follower data") as pbar:
+                for follower_data, enriched, error in iter_concurrent(
+                        self._enrich_follower, followers.values(), workers=workers or self.enrichment_workers):
+                    if error is not None:
+                        logger.warning(f"Error collecting data for {follower_data['username']}: {str(error)}")
+                        continue
+                    self.followers_data.append(enriched)
+                    pbar.update(1)
+            
+            results = self.detect_fake_profiles()
+            if results is None:
+                return {}
+            
+            # Split back out per target
+            return {target: results[results['username'].isin(set(usernames))]
+                    for target, usernames in members.items()}
+        except Exception as e:
+            logger.error(f"Error analyzing targets: {str(e)}")
+            logger.error(traceback.format_exc())
+            return {}
+    
+    def analyze_new_followers(self, workers=None):
+        """
+        Delta run: list the target's followers, fetch and score only those who
+        joined since the last run, mark those who left, and merge everything
+        into an updated report with a delta_status column. The report minus
+        departed followers is stored as the target's history for next time.
+        Returns the report, or None on failure.
+        """
+        if not self.user_profile:
+            logger.error("No target profile set")
+            return None
+        
+        history = FollowerHistory(self.user_profile.username)
+        previous = history.load()
+        
+        try:
+            if previous is None:
+                logger.info("No earlier run for this target; analyzing all followers")
+                if not self.collect_followers_data():
+                    return None
+                results = self.detect_fake_profiles()
+                if results is None:
+                    return None
+                report = merge_delta(results.iloc[0:0], results, results['username'])
+            else:
+                # Listing followers needs no detail lookups; only newcomers get them
+                basic = list(tqdm(self._iter_basic_followers(), total=self.user_profile.followers,
+                                  desc="Listing followers"))
+                current = [follower_data['username'] for follower_data in basic]
+                joined, stayed, left = diff_followers(previous['username'], current)
+                logger.info(f"Since the last run: {len(joined)} new, {len(left)} left, {len(stayed)} unchanged")
                 
-                # Convert score to probability (0-100%)
-                max_score = 14
-                probability = min(100, (score / max_score) * 100)
+                enriched = []
+                with tqdm(total=len(joined), desc="Analyzing new followers") as pbar:
+                    for follower_data, result, error in iter_concurrent(
+                            self._enrich_follower, (f for f in basic if f['username'] in joined),
+                            workers=workers or self.enrichment_workers):
+                        if error is not None:
+                            logger.warning(f"Error collecting data for {follower_data['username']}: {str(error)}")
+                            continue
+                        enriched.append(result)
+                        pbar.update(1)
                 
-                return probability
+                new_results = previous.iloc[0:0]
+                if enriched:
+                    self.followers_data = FollowerStore.from_records(enriched)
+                    new_results = self.detect_fake_profiles()
+                    if new_results is None:
+                        return None
+                report = merge_delta(previous, new_results, current)
             
-            df['fake_probability'] = df.apply(calculate_fake_probability, axis=1)
+            history.save(report[report['delta_status'] != DELTA_LEFT].drop(columns='delta_status'))
+            return report
+        except instaloader.exceptions.ConnectionException as e:
+            logger.error(f"Connection error: {str(e)}")
+            logger.info("This might be due to rate limiting or IP blocking")
+            return None
+        except Exception as e:
+            logger.error(f"Error running delta analysis: {str(e)}")
+            logger.error(traceback.format_exc())
+            return None
+    
+    def stream_and_score(self, max_followers=None, workers=None, filename=None, batch_size=200):
+        """
+        Score each follower as soon as its details arrive.
+        Scored rows are appended to a CSV in micro-batches and a running summary
+        is kept, so nothing is held per follower and results show up right away.
+        Returns the RunningSummary, or None on failure.
+        """
+        if not self.user_profile:
+            logger.error("No target profile set")
+            return None
+        
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"instagram_fake_followers_{timestamp}.csv"
+        
+        running = RunningSummary()
+        batch = []
+        
+        def flush():
+            if batch:
+                pd.DataFrame(batch).to_csv(filename, mode='a', header=not os.path.exists(filename), index=False)
+                batch.clear()
+        
+        try:
+            followers_count = self._confirm_follower_count(max_followers)
+            if followers_count is None:
+                return None
             
-            # Classify profiles
-            def classify_profile(probability):
-                if probability < 30:
-                    return "Likely Real"
-                elif probability < 60:
-                    return "Suspicious"
-                else:
-                    return "Likely Fake"
+            with tqdm(total=followers_count, desc="Collecting and scoring followers") as pbar:
+                try:
+                    for follower_data in self._iter_collected_followers(pbar, max_followers, workers):
+                        scored = score_record(follower_data)
+                        running.add_record(scored)
+                        batch.append(scored)
+                        
+                        if len(batch) >= batch_size:
+                            flush()
+                            pbar.set_postfix({
+                                'fake': running.counts[CLASS_LIKELY_FAKE],
+                                'suspicious': running.counts[CLASS_SUSPICIOUS],
+                            })
+                finally:
+                    # Rows scored before an interruption still reach the file
+                    flush()
             
-            df['classification'] = df['fake_probability'].apply(classify_profile)
+            logger.info(f"Scored {running.total} followers; results written to {filename}")
+            return running
+        except instaloader.exceptions.ConnectionException as e:
+            logger.error(f"Connection error: {str(e)}")
+            logger.info("This might be due to rate limiting or IP blocking")
+            logger.info(f"Rows scored so far are in {filename}")
+            return None
+        except Exception as e:
+            logger.error(f"Error streaming followers: {str(e)}")
+            logger.error(traceback.format_exc())
+            return None
+    
+    def detect_fake_profiles(self, sort=False):
+        """
+        Analyze followers data to detect fake profiles.
+        Rows keep their collection order unless sort is set; summaries do
+        not need them sorted (see summarize_results).
+        """
+        if len(self.followers_data) == 0:
+            logger.error("No follower data available for analysis")
+            return None
+        
+        try:
+            # Collected and loaded data are both columnar already; plain record lists still work
+            if isinstance(self.followers_data, FollowerStore):
+                df = self.followers_data.to_frame()
+            elif isinstance(self.followers_data, pd.DataFrame):
+                df = self.followers_data.copy()
+            else:
+                df = pd.DataFrame(self.followers_data)
+            
+            # Replace NaN values with defaults and add ratio features
+            prepare_followers_frame(df)
+            
+            # Score every rule as whole-column operations (see scoring.py)
+            score_followers(df)
             
-            # Sort by fake probability (highest first)
-            df = df.sort_values('fake_probability', ascending=False)
+            # Followers a tiered collection never fetched details for
+            if 'details_fetched' in df:
+                score_unfetched(df)
             
-            return df
+            return self.sort_results(df) if sort else df
         except Exception as e:
             logger.error(f"Error analyzing followers: {str(e)}")
             logger.error(traceback.format_exc())
             return None
     
+    @staticmethod
+    def sort_results(dataframe):
+        """Sort by fake probability (highest first); ties keep their order"""
+        return dataframe.sort_values('fake_probability', ascending=False, kind='stable')
+    
     def export_results(self, dataframe, filename=None):
-        """Export analysis results to CSV"""
+        """Export analysis results to CSV, or to a Parquet/Arrow snapshot by file extension"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"instagram_fake_followers_{timestamp}.csv"
         
         try:
-            dataframe.to_csv(filename, index=False)
+            if is_snapshot_path(filename):
+                write_snapshot(dataframe, filename, schema=raw_schema())
+            else:
+                dataframe.to_csv(filename, index=False)
             logger.info(f"Results exported to {filename}")
             return True
         except Exception as e:
@@ -367,31 +687,10 @@ class InstagramFakeProfileDetector:
         if dataframe is None or len(dataframe) == 0:
             return "No data to summarize"
         
-        total = len(dataframe)
-        fake_count = len(dataframe[dataframe['classification'] == "Likely Fake"])
-        suspicious_count = len(dataframe[dataframe['classification'] == "Suspicious"])
-        real_count = len(dataframe[dataframe['classification'] == "Likely Real"])
-        
-        fake_percent = (fake_count / total) * 100
-        suspicious_percent = (suspicious_count / total) * 100
-        real_percent = (real_count / total) * 100
-        
-        summary = f"""
-        FAKE PROFILE DETECTION SUMMARY
-        =============================
-        Total followers analyzed: {total}
-        
-        Likely fake profiles: {fake_count} ({fake_percent:.1f}%)
-        Suspicious profiles: {suspicious_count} ({suspicious_percent:.1f}%)
-        Likely real profiles: {real_count} ({real_percent:.1f}%)
-        
-        Top 5 most suspicious followers:
-        """
-        
-        for _, row in dataframe.head(5).iterrows():
-            summary += f"\n- @{row['username']} (Probability: {row['fake_probability']:.1f}%)"
-        
-        return summary
+        # One pass for counts and the top 5, no sort of the whole frame
+        running = RunningSummary()
+        running.add_frame(dataframe)
+        return running.render()
 
     def load_data_from_csv(self, file_path):
         """Load previously collected follower data from CSV"""
@@ -400,14 +699,57 @@ class InstagramFakeProfileDetector:
                 logger.error(f"File not found: {file_path}")
                 return False
                 
-            df = pd.read_csv(file_path)
-            self.followers_data = df.to_dict('records')
+            self.followers_data = pd.read_csv(file_path)
             logger.info(f"Loaded {len(self.followers_data)} follower records from {file_path}")
             return True
         except Exception as e:
             logger.error(f"Error loading data: {str(e)}")
             logger.error(traceback.format_exc())
             return False
+    
+    def score_file_sharded(self, file_path, processes=None):
+        """
+        Score a CSV or snapshot too large to load whole, shard by shard on a
+        process pool. Returns the merged RunningSummary (counts and top
+        followers only, no per-follower rows), or None on failure.
+        """
+        try:
+            if not os.path.exists(file_path):
+                logger.error(f"File not found: {file_path}")
+                return None
+            
+            running = score_file_sharded(file_path, processes=processes)
+            logger.info(f"Scored {running.total} follower records from {file_path}")
+            return running
+        except Exception as e:
+            logger.error(f"Error scoring {file_path} in shards: {str(e)}")
+            logger.error(traceback.format_exc())
+            return None
+    
+    def load_snapshot(self, file_path, columns=None, filters=None):
+        """
+        Load follower data from a Parquet or Arrow snapshot.
+        columns restricts which columns are read and filters (pyarrow DNF
+        tuples such as [('followers', '<', 100)]) which rows are kept.
+        """
+        try:
+            if not os.path.exists(file_path):
+                logger.error(f"File not found: {file_path}")
+                return False
+            
+            self.followers_data = read_snapshot(file_path, columns=columns, filters=filters)
+            logger.info(f"Loaded {len(self.followers_data)} follower records from {file_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading snapshot: {str(e)}")
+            logger.error(traceback.format_exc())
+            return False
+
+
+def ask_sort_export():
+    """Sorting millions of rows takes a while, so exports are only sorted on request"""
+    answer = input("Sort the exported rows by fake probability? (y/n): ")
+    return answer.lower() == 'y'
 
 
 def main():
@@ -422,7 +764,7 @@ def main():
     print("1. Login with username and password")
     print("2. Login with saved session")
     print("3. Login with cookie file")
-    print("4. Skip login (load data from CSV)")
+    print("4. Skip login (load data from CSV or Parquet/Arrow snapshot)")
     
     choice = input("\nSelect login method (1-4): ")
     
@@ -434,11 +776,24 @@ def main():
     elif choice == '3':
         login_successful = detector.cookie_login()
     elif choice == '4':
-        # Skip login, will load data from CSV
+        # Skip login, will load data from CSV or snapshot
         login_successful = True
-        csv_path = input("Enter path to the CSV file with follower data: ")
-        if not detector.load_data_from_csv(csv_path):
-            print("Failed to load data from CSV. Exiting.")
+        data_path = input("Enter path to the CSV or snapshot file with follower data: ")
+        sharded = input("Summarize only, scoring the file in parallel shards (for files too large for memory)? (y/n): ")
+        if sharded.lower() == 'y':
+            running = detector.score_file_sharded(data_path)
+            if running is None:
+                print("Sharded scoring failed. Exiting.")
+                return
+            print("\n" + running.render())
+            print("\nAnalysis complete!")
+            return
+        if is_snapshot_path(data_path):
+            loaded = detector.load_snapshot(data_path)
+        else:
+            loaded = detector.load_data_from_csv(data_path)
+        if not loaded:
+            print("Failed to load follower data. Exiting.")
             return
     else:
         print("Invalid choice. Exiting.")
@@ -448,6 +803,29 @@ def main():
         print("Login failed. Exiting program.")
         return
     
+    # Batch mode analyzes several targets, scoring shared followers once
+    if choice != '4':
+        batch = input("\nAnalyze several target accounts at once (batch mode)? (y/n): ")
+        if batch.lower() == 'y':
+            targets = input("Enter target usernames separated by commas: ").split(',')
+            print("\nCollecting followers of all targets. This might take a while...")
+            per_target = detector.analyze_targets(targets)
+            if not per_target:
+                print("Batch analysis failed. Exiting.")
+                return
+            export = input("\nWould you like to export the detailed results to CSV? (y/n): ")
+            sort = export.lower() == 'y' and ask_sort_export()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            for target, results in per_target.items():
+                print(f"\n=== @{target} ===")
+                print(detector.summarize_results(results))
+                if export.lower() == 'y':
+                    if sort:
+                        results = detector.sort_results(results)
+                    detector.export_results(results, f"instagram_fake_followers_{target}_{timestamp}.csv")
+            print("\nAnalysis complete!")
+            return
+    
     # Set target profile if not loading from CSV
     if choice != '4':
         target_set = False
@@ -460,6 +838,23 @@ def main():
                     print("Exiting program.")
                     return
         
+        # Delta mode reuses the last run and only analyzes new followers
+        delta = input("\nOnly analyze followers who are new since the last run (delta mode)? (y/n): ")
+        if delta.lower() == 'y':
+            print("\nComparing the follower list with the last run...")
+            report = detector.analyze_new_followers()
+            if report is None:
+                print("Delta analysis failed. Exiting.")
+                return
+            counts = report['delta_status'].value_counts()
+            print(f"\nNew followers: {counts.get(DELTA_NEW, 0)}, left since last run: {counts.get(DELTA_LEFT, 0)}")
+            print("\n" + detector.summarize_results(report[report['delta_status'] != DELTA_LEFT]))
+            export = input("\nWould you like to export the updated report to CSV? (y/n): ")
+            if export.lower() == 'y':
+                detector.export_results(detector.sort_results(report) if ask_sort_export() else report)
+            print("\nAnalysis complete!")
+            return
+        
         # Ask for max followers to analyze
         try:
             max_followers = input("\nEnter maximum number of followers to analyze (press Enter for all): ")
@@ -468,9 +863,35 @@ def main():
             print("Invalid input. Analyzing all followers.")
             max_followers = None
         
-        # Collect follower data
-        print("\nCollecting follower data. This might take a while...")
-        data_collected = detector.collect_followers_data(max_followers)
+        # Streaming mode scores followers as they arrive instead of after collection
+        stream = input("\nScore followers as they are collected (streaming mode)? (y/n): ")
+        if stream.lower() == 'y':
+            print("\nCollecting and scoring followers. Results are written as they arrive...")
+            running = detector.stream_and_score(max_followers)
+            if running is None:
+                print("Streaming analysis failed. Exiting.")
+                return
+            print("\n" + running.render())
+            print("\nAnalysis complete!")
+            return
+        
+        # Tiered mode fetches details only where they can change the result
+        tiered = input("\nOnly fetch profile details where they can change the result (tiered mode)? (y/n): ")
+        if tiered.lower() == 'y':
+            try:
+                print("Without details only verified followers can be decided; any others left over "
+                      "when the limit is reached are reported as Undetermined.")
+                budget = input("Enter maximum number of detail requests (press Enter for no limit): ")
+                budget = int(budget) if budget.strip() else None
+            except ValueError:
+                print("Invalid input. No limit on detail requests.")
+                budget = None
+            print("\nCollecting follower data in two stages...")
+            data_collected = detector.collect_followers_tiered(max_followers, max_detail_requests=budget)
+        else:
+            # Collect follower data
+            print("\nCollecting follower data. This might take a while...")
+            data_collected = detector.collect_followers_data(max_followers)
         
         if not data_collected:
             print("Failed to collect follower data. Exiting.")
@@ -491,8 +912,8 @@ def main():
     # Export results
     export = input("\nWould you like to export the detailed results to CSV? (y/n): ")
     if export.lower() == 'y':
-        detector.export_results(results)
-    +
+        detector.export_results(detector.sort_results(results) if ask_sort_export() else results)
+    
     print("\nAnalysis complete!")
 
 